@@ -0,0 +1,58 @@
+function getTokens() {
+    var root = document.documentElement;
+    var styles = getComputedStyle(root);
+    var tokens = {};
+    for (var i = 0; i < styles.length; i++) {
+        var prop = styles[i];
+        if (prop.startsWith('--')) {
+            tokens[prop] = styles.getPropertyValue(prop).trim();
+        }
+    }
+    return tokens;
+}
+
+function copyCSS() {
+    var tokens = getTokens();
+    var css = ':root {\n' + Object.keys(tokens).map(function(k) {
+        return '    ' + k + ': ' + tokens[k] + ';';
+    }).join('\n') + '\n}';
+    navigator.clipboard.writeText(css);
+    showToast('CSS variables copied!');
+}
+
+function copyJSON() {
+    var tokens = getTokens();
+    navigator.clipboard.writeText(JSON.stringify(tokens, null, 2));
+    showToast('JSON tokens copied!');
+}
+
+function copyTailwind() {
+    var tokens = getTokens();
+    var config = {
+        theme: {
+            extend: {
+                colors: {},
+                fontFamily: {}
+            }
+        }
+    };
+    Object.keys(tokens).forEach(function(key) {
+        var value = tokens[key];
+        var cleanKey = key.replace('--', '').replace(/-/g, '_');
+        if (value.includes('#') || value.includes('rgb')) {
+            config.theme.extend.colors[cleanKey] = value;
+        }
+    });
+    var output = 'module.exports = ' + JSON.stringify(config, null, 2);
+    navigator.clipboard.writeText(output);
+    showToast('Tailwind config copied!');
+}
+
+function showToast(message) {
+    var toast = document.getElementById('exportToast');
+    toast.textContent = message;
+    toast.classList.add('visible');
+    setTimeout(function() {
+        toast.classList.remove('visible');
+    }, 2000);
+}
@@ -0,0 +1,12 @@
+(function() {
+    var match = location.pathname.match(/style-(\d+)/);
+    if (match) {
+        var num = parseInt(match[1]);
+        var key = 'lobbi-recent-styles';
+        var recent = JSON.parse(localStorage.getItem(key) || '[]');
+        recent = recent.filter(function(n) { return n !== num; });
+        recent.unshift(num);
+        recent = recent.slice(0, 8);
+        localStorage.setItem(key, JSON.stringify(recent));
+    }
+})();
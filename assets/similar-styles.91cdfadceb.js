@@ -0,0 +1,28 @@
+(function() {
+    const section = document.querySelector('.similar-styles-section');
+    const toggle = document.querySelector('.similar-styles-toggle');
+    const STORAGE_KEY = 'lobbi-similar-styles-collapsed';
+
+    // Restore collapsed state from localStorage
+    if (localStorage.getItem(STORAGE_KEY) === 'true') {
+        section.classList.add('collapsed');
+    }
+
+    // Toggle collapse on click
+    if (toggle) {
+        toggle.addEventListener('click', (e) => {
+            e.stopPropagation();
+            section.classList.toggle('collapsed');
+            localStorage.setItem(STORAGE_KEY, section.classList.contains('collapsed'));
+        });
+    }
+
+    // Also allow clicking the header to toggle
+    const header = document.querySelector('.similar-styles-header');
+    if (header) {
+        header.addEventListener('click', () => {
+            section.classList.toggle('collapsed');
+            localStorage.setItem(STORAGE_KEY, section.classList.contains('collapsed'));
+        });
+    }
+})();
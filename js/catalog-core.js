@@ -0,0 +1,66 @@
+/**
+ * Lobbi Design System - Catalog Core
+ *
+ * Shared shard format for the style catalogue. Used by:
+ * - scripts/build-data.js (build time, Node) to write the shards
+ * - index.html to decode them as they arrive
+ *
+ * Layout:
+ *   data/catalog.json          - { version, fields, count, shards: [{ file, first, last, count }] }
+ *   data/catalog/<name>.json   - { version, rows }  one row per style, values in `fields` order
+ *
+ * Shard files carry a content hash in their name, so they can be cached
+ * forever; only data/catalog.json needs revalidating.
+ */
+
+(function (root, factory) {
+    const api = factory();
+    if (typeof module === 'object' && module.exports) {
+        module.exports = api;
+    } else {
+        root.LobbiCatalog = api;
+    }
+})(typeof self !== 'undefined' ? self : this, function () {
+    const CATALOG_VERSION = 1;
+
+    // Styles per shard, by style number: shard 0 holds 1-32, shard 1 33-64...
+    // Keying on the number rather than the position keeps a shard's contents
+    // stable when styles are added at the end.
+    const SHARD_SIZE = 32;
+
+    const FIELDS = ['num', 'name', 'blend', 'tags', 'temp', 'formality', 'preview', 'perfectFor', 'colors', 'file'];
+
+    function shardKey(num) {
+        return Math.floor((num - 1) / SHARD_SIZE);
+    }
+
+    function encodeShard(styles) {
+        return {
+            version: CATALOG_VERSION,
+            rows: styles.map(style => FIELDS.map(field => style[field]))
+        };
+    }
+
+    function decodeShard(catalog, shard) {
+        if (shard.version !== CATALOG_VERSION) {
+            throw new Error(`catalog shard version ${shard.version}, expected ${CATALOG_VERSION}`);
+        }
+        const fields = catalog.fields;
+        return shard.rows.map(row => {
+            const style = {};
+            fields.forEach((field, i) => {
+                style[field] = row[i];
+            });
+            return style;
+        });
+    }
+
+    return {
+        CATALOG_VERSION,
+        SHARD_SIZE,
+        FIELDS,
+        shardKey,
+        encodeShard,
+        decodeShard
+    };
+});
@@ -0,0 +1,230 @@
+/**
+ * Lobbi Design System - Collections
+ *
+ * Feature module for index.html, loaded on first use by loadFeature().
+ * Collections are stored by the shell (getCollections/saveCollections);
+ * this module is the modal, the per-card dropdown and the editing.
+ */
+
+(function () {
+    function createCollection(name) {
+        if (!name || !name.trim()) return null;
+        const collections = getCollections();
+        const id = 'col_' + Date.now();
+        collections[id] = { name: name.trim(), styles: [], created: Date.now() };
+        saveCollections(collections);
+        return id;
+    }
+
+    function addToCollection(collectionId, styleNum) {
+        const collections = getCollections();
+        if (!collections[collectionId]) return;
+        if (!collections[collectionId].styles.includes(styleNum)) {
+            collections[collectionId].styles.push(styleNum);
+            saveCollections(collections);
+        }
+    }
+
+    function removeFromCollection(collectionId, styleNum) {
+        const collections = getCollections();
+        if (!collections[collectionId]) return;
+        collections[collectionId].styles = collections[collectionId].styles.filter(n => n !== styleNum);
+        saveCollections(collections);
+    }
+
+    function deleteCollection(collectionId) {
+        const collections = getCollections();
+        delete collections[collectionId];
+        saveCollections(collections);
+        if (activeCollection === collectionId) {
+            activeCollection = null;
+            currentFilter = 'all';
+            document.querySelectorAll('.filter-tab').forEach(t => t.classList.remove('active'));
+            document.querySelector('.filter-tab[data-filter="all"]').classList.add('active');
+        }
+    }
+
+    function renderCollections() {
+        const collections = getCollections();
+        const list = document.getElementById('collectionsList');
+
+        if (Object.keys(collections).length === 0) {
+            list.innerHTML = '<p style="padding:1rem;color:var(--text-muted);text-align:center;">No collections yet</p>';
+            return;
+        }
+
+        list.innerHTML = Object.entries(collections).map(([id, col]) => `
+            <div class="collection-item ${activeCollection === id ? 'active' : ''}" onclick="selectCollection('${id}')">
+                <span>${col.name} (${col.styles.length})</span>
+                <button onclick="event.stopPropagation(); deleteCollectionHandler('${id}');" class="delete-col-btn" title="Delete collection">×</button>
+            </div>
+        `).join('');
+    }
+
+    function deleteCollectionHandler(id) {
+        if (confirm('Delete this collection?')) {
+            deleteCollection(id);
+            renderCollections();
+        }
+    }
+
+    function selectCollection(collectionId) {
+        activeCollection = collectionId;
+        currentFilter = 'collections';
+
+        // Update filter tabs
+        document.querySelectorAll('.filter-tab').forEach(t => t.classList.remove('active'));
+        document.getElementById('collectionsTab').classList.add('active');
+
+        // Close modal and render
+        document.getElementById('collectionsModal').classList.remove('visible');
+        renderCollections();
+        filterAndSort();
+    }
+
+    function showAddToCollectionMenu(styleNum, event) {
+        event.preventDefault();
+        event.stopPropagation();
+
+        // Close any existing dropdowns
+        document.querySelectorAll('.add-to-collection-dropdown').forEach(d => d.remove());
+
+        const collections = getCollections();
+        const dropdown = document.createElement('div');
+        dropdown.className = 'add-to-collection-dropdown visible';
+
+        // Build dropdown content
+        let dropdownHTML = '';
+
+        // Show existing collections
+        if (Object.keys(collections).length > 0) {
+            dropdownHTML += Object.entries(collections).map(([id, col]) => `
+                <div class="dropdown-item ${col.styles.includes(styleNum) ? 'checked' : ''}"
+                     onclick="toggleStyleInCollection('${id}', ${styleNum})">
+                    ${col.styles.includes(styleNum) ? '✓ ' : ''}${col.name}
+                </div>
+            `).join('');
+        } else {
+            dropdownHTML += '<div class="dropdown-item" style="color:var(--text-muted);pointer-events:none;">No collections yet</div>';
+        }
+
+        // Add "New Collection" option
+        dropdownHTML += `
+            <div class="dropdown-item new-collection" onclick="showQuickNewCollection(${styleNum}, event)">
+                <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+                    <line x1="12" y1="5" x2="12" y2="19"></line>
+                    <line x1="5" y1="12" x2="19" y2="12"></line>
+                </svg>
+                New Collection
+            </div>
+        `;
+
+        dropdown.innerHTML = dropdownHTML;
+
+        const btn = event.currentTarget;
+        btn.style.position = 'relative';
+        btn.appendChild(dropdown);
+
+        // Close dropdown when clicking outside
+        setTimeout(() => {
+            document.addEventListener('click', function closeDropdown(e) {
+                if (!dropdown.contains(e.target)) {
+                    dropdown.remove();
+                    document.removeEventListener('click', closeDropdown);
+                }
+            }, { once: false });
+        }, 10);
+    }
+
+    function showQuickNewCollection(styleNum, event) {
+        event.stopPropagation();
+
+        // Replace dropdown content with input
+        const dropdown = event.currentTarget.closest('.add-to-collection-dropdown');
+        dropdown.innerHTML = `
+            <div class="dropdown-new-input">
+                <input type="text" id="quickCollectionName" placeholder="Collection name..." maxlength="30" autofocus>
+            </div>
+        `;
+
+        const input = dropdown.querySelector('#quickCollectionName');
+        input.focus();
+
+        input.addEventListener('keydown', (e) => {
+            if (e.key === 'Enter' && input.value.trim()) {
+                const newId = createCollection(input.value.trim());
+                if (newId) {
+                    addToCollection(newId, styleNum);
+                    showToast(`Added to "${input.value.trim()}"`);
+                    dropdown.remove();
+                    renderCollections();
+                }
+            } else if (e.key === 'Escape') {
+                dropdown.remove();
+            }
+        });
+    }
+
+    function toggleStyleInCollection(collectionId, styleNum) {
+        const collections = getCollections();
+        const wasAdded = !collections[collectionId].styles.includes(styleNum);
+        if (wasAdded) {
+            addToCollection(collectionId, styleNum);
+            showToast(`Added to "${collections[collectionId].name}"`);
+        } else {
+            removeFromCollection(collectionId, styleNum);
+            showToast(`Removed from "${collections[collectionId].name}"`);
+        }
+        renderCollections();
+
+        // Update the dropdown
+        document.querySelectorAll('.add-to-collection-dropdown').forEach(d => d.remove());
+    }
+
+    function openCollections() {
+        document.getElementById('collectionsModal').classList.add('visible');
+        renderCollections();
+    }
+
+    document.getElementById('collectionsClose').addEventListener('click', () => {
+        document.getElementById('collectionsModal').classList.remove('visible');
+    });
+
+    // Close modal when clicking outside
+    document.getElementById('collectionsModal').addEventListener('click', (e) => {
+        if (e.target.id === 'collectionsModal') {
+            document.getElementById('collectionsModal').classList.remove('visible');
+        }
+    });
+
+    // Create new collection
+    document.getElementById('createCollectionBtn').addEventListener('click', () => {
+        const input = document.getElementById('newCollectionName');
+        const name = input.value.trim();
+        if (name) {
+            createCollection(name);
+            input.value = '';
+            renderCollections();
+        }
+    });
+
+    // Allow Enter key to create collection
+    document.getElementById('newCollectionName').addEventListener('keypress', (e) => {
+        if (e.key === 'Enter') {
+            const name = e.target.value.trim();
+            if (name) {
+                createCollection(name);
+                e.target.value = '';
+                renderCollections();
+            }
+        }
+    });
+
+    // Entry points for the shell's stubs and inline handlers
+    window.openCollections = openCollections;
+    window.showAddToCollectionMenu = showAddToCollectionMenu;
+    window.showQuickNewCollection = showQuickNewCollection;
+    window.toggleStyleInCollection = toggleStyleInCollection;
+    window.selectCollection = selectCollection;
+    window.deleteCollectionHandler = deleteCollectionHandler;
+})();
@@ -0,0 +1,110 @@
+/**
+ * Lobbi Design System - Comparison Matrix
+ *
+ * Feature module for index.html, loaded on first use by loadFeature().
+ */
+
+(function () {
+    const matrixStyles = [];
+
+    function addToComparisonMatrix(styleNum, event) {
+        event.preventDefault();
+        event.stopPropagation();
+
+        const style = styles.find(s => s.num === styleNum);
+        if (!style) return;
+
+        if (!matrixStyles.find(s => s.num === styleNum)) {
+            matrixStyles.push(style);
+            showToast(`Added ${style.name} to comparison matrix`, 'success');
+
+            if (matrixStyles.length >= 2) {
+                // Auto-open when we have 2+ styles
+                setTimeout(() => {
+                    document.getElementById('comparisonMatrixBtn').style.animation = 'pulse 0.5s ease-in-out 3';
+                }, 300);
+            }
+        } else {
+            showToast(`${style.name} already in matrix`, 'warning');
+        }
+    }
+
+    function openComparisonMatrix() {
+        if (matrixStyles.length === 0) {
+            showToast('Add styles to compare first', 'warning');
+            return;
+        }
+
+        const modal = document.getElementById('comparisonMatrixModal');
+        const body = document.getElementById('comparisonMatrixBody');
+
+        // Build comparison table
+        const attributes = [
+            { label: 'Style Name', key: 'name' },
+            { label: 'Style Number', key: 'num' },
+            { label: 'Blend Formula', key: 'blend' },
+            { label: 'Temperature', key: 'temp' },
+            { label: 'Formality', key: 'formality' },
+            { label: 'Categories', key: 'tags' },
+            { label: 'Perfect For', key: 'perfectFor' },
+            { label: 'Primary Colors', key: 'colors' }
+        ];
+
+        let tableHTML = `
+            <table class="comparison-table">
+                <thead>
+                    <tr>
+                        <th>Attribute</th>
+                        ${matrixStyles.map(s => `<th>${s.name}</th>`).join('')}
+                    </tr>
+                </thead>
+                <tbody>
+        `;
+
+        attributes.forEach(attr => {
+            tableHTML += `<tr><td style="font-weight:600;">${attr.label}</td>`;
+
+            matrixStyles.forEach(style => {
+                let value = style[attr.key];
+
+                if (attr.key === 'tags') {
+                    value = value.map(t => `<span class="tag ${t}">${t}</span>`).join(' ');
+                } else if (attr.key === 'perfectFor') {
+                    value = (value || []).join(', ');
+                } else if (attr.key === 'colors') {
+                    const colors = styleColors[style.num] || [];
+                    value = colors.slice(0, 4).map(c => 
+                        `<span style="display:inline-block;width:24px;height:24px;background:${c};border-radius:4px;margin-right:4px;border:1px solid var(--border);"></span>`
+                    ).join('');
+                }
+
+                tableHTML += `<td>${value}</td>`;
+            });
+
+            tableHTML += `</tr>`;
+        });
+
+        tableHTML += `
+                </tbody>
+            </table>
+        `;
+
+        body.innerHTML = tableHTML;
+        modal.classList.add('visible');
+    }
+
+    function closeComparisonMatrix() {
+        document.getElementById('comparisonMatrixModal').classList.remove('visible');
+    }
+
+    function exportComparisonMatrix() {
+        showToast('Comparison export feature coming soon!', 'success');
+        // Would implement PDF export here
+    }
+
+    // Entry points for the shell's stubs and inline handlers
+    window.openComparisonMatrix = openComparisonMatrix;
+    window.addToComparisonMatrix = addToComparisonMatrix;
+    window.closeComparisonMatrix = closeComparisonMatrix;
+    window.exportComparisonMatrix = exportComparisonMatrix;
+})();
@@ -0,0 +1,300 @@
+/**
+ * Lobbi Design System - Mobile Features
+ *
+ * Feature module for index.html, loaded on first use by loadFeature().
+ * The shell loads it on the first touch, or when a bottom-nav or drawer
+ * button is tapped.
+ */
+
+(function () {
+    // Mobile Navigation Actions
+    function mobileNavAction(action) {
+        // Update active state
+        document.querySelectorAll('.mobile-nav-btn').forEach(btn => {
+            btn.classList.remove('active');
+        });
+        document.querySelector(`[data-action="${action}"]`).classList.add('active');
+
+        switch(action) {
+            case 'home':
+                window.scrollTo({ top: 0, behavior: 'smooth' });
+                break;
+            case 'filters':
+                openMobileFilterDrawer();
+                break;
+            case 'compare':
+                if (compareSelection.length >= 1) {
+                    openComparison();
+                } else {
+                    toggleCompareMode();
+                    showToast('Select styles to compare', 'success');
+                }
+                break;
+            case 'ai':
+                generateAISuggestions();
+                break;
+            case 'more':
+                showMobileMoreMenu();
+                break;
+        }
+    }
+
+    function openMobileFilterDrawer() {
+        const drawer = document.getElementById('mobileFilterDrawer');
+        drawer.classList.add('visible');
+
+        // Update active filter in drawer
+        const currentFilterBtn = drawer.querySelector(`[data-filter="${currentFilter}"]`);
+        if (currentFilterBtn) {
+            drawer.querySelectorAll('.filter-tab').forEach(b => b.classList.remove('active'));
+            currentFilterBtn.classList.add('active');
+        }
+    }
+
+    function closeMobileDrawer() {
+        document.getElementById('mobileFilterDrawer').classList.remove('visible');
+    }
+
+    function applyMobileFilter(filter) {
+        currentFilter = filter;
+
+        // Update all filter tabs
+        document.querySelectorAll('.filter-tab').forEach(t => t.classList.remove('active'));
+        document.querySelectorAll(`[data-filter="${filter}"]`).forEach(t => t.classList.add('active'));
+
+        filterAndSort();
+        updateBreadcrumb();
+
+        showToast(`Filter: ${filter}`, 'success');
+    }
+
+    function applyMobileSort(sortValue) {
+        currentSort = sortValue;
+        document.getElementById('sortSelect').value = sortValue;
+        filterAndSort();
+        showToast(`Sorted by ${sortValue}`, 'success');
+    }
+
+    function showMobileMoreMenu() {
+        const actions = [
+            { label: 'Collections', action: () => document.getElementById('collectionsBtn').click() },
+            { label: 'Keyboard Shortcuts', action: () => document.getElementById('keyboardHint').click() },
+            { label: 'Random Style', action: () => getRandomStyle() },
+            { label: 'Clear Favorites', action: () => {
+                if (confirm('Clear all favorites?')) {
+                    favorites = [];
+                    localStorage.setItem('lobbi-favorites', JSON.stringify(favorites));
+                    updateFavoritesCount();
+                    filterAndSort();
+                    showToast('Favorites cleared', 'success');
+                }
+            }}
+        ];
+
+        // Create a simple action sheet
+        const sheet = document.createElement('div');
+        sheet.style.cssText = `
+            position: fixed;
+            bottom: 70px;
+            left: 0;
+            right: 0;
+            background: var(--bg-secondary);
+            border-top: 1px solid var(--border);
+            z-index: 300;
+            padding: 1rem;
+            box-shadow: 0 -4px 24px rgba(0, 0, 0, 0.5);
+        `;
+
+        sheet.innerHTML = actions.map(a => `
+            <button style="
+                width: 100%;
+                padding: 1rem;
+                background: var(--bg-tertiary);
+                border: 1px solid var(--border);
+                border-radius: 0.5rem;
+                color: var(--text-primary);
+                font-size: 0.9375rem;
+                margin-bottom: 0.5rem;
+                cursor: pointer;
+                min-height: 44px;
+            " onclick="this.parentElement.remove();">${a.label}</button>
+        `).join('');
+
+        const closeBtn = document.createElement('button');
+        closeBtn.textContent = 'Cancel';
+        closeBtn.style.cssText = `
+            width: 100%;
+            padding: 1rem;
+            background: transparent;
+            border: 1px solid var(--border);
+            border-radius: 0.5rem;
+            color: var(--text-secondary);
+            font-size: 0.9375rem;
+            cursor: pointer;
+            min-height: 44px;
+        `;
+        closeBtn.onclick = () => sheet.remove();
+        sheet.appendChild(closeBtn);
+
+        // Add event listeners
+        sheet.querySelectorAll('button').forEach((btn, i) => {
+            if (i < actions.length) {
+                btn.onclick = () => {
+                    actions[i].action();
+                    sheet.remove();
+                };
+            }
+        });
+
+        document.body.appendChild(sheet);
+    }
+
+    // Swipe gestures for mobile
+    let touchStartX = 0;
+    let touchStartY = 0;
+    let touchEndX = 0;
+    let touchEndY = 0;
+
+    function handleSwipe() {
+        const diffX = touchEndX - touchStartX;
+        const diffY = touchEndY - touchStartY;
+        const absX = Math.abs(diffX);
+        const absY = Math.abs(diffY);
+
+        // Only trigger if horizontal swipe is longer than vertical
+        if (absX > absY && absX > 50) {
+            if (diffX > 0) {
+                // Swipe right - go to previous style (optional)
+                showSwipeIndicator('Swiped right');
+            } else {
+                // Swipe left - go to next style (optional)
+                showSwipeIndicator('Swiped left');
+            }
+        }
+    }
+
+    function showSwipeIndicator(text) {
+        const indicator = document.getElementById('swipeIndicator');
+        indicator.textContent = text;
+        indicator.classList.add('visible');
+        setTimeout(() => {
+            indicator.classList.remove('visible');
+        }, 1500);
+    }
+
+    // Touch event listeners
+    document.addEventListener('touchstart', e => {
+        touchStartX = e.changedTouches[0].screenX;
+        touchStartY = e.changedTouches[0].screenY;
+    }, { passive: true });
+
+    document.addEventListener('touchend', e => {
+        touchEndX = e.changedTouches[0].screenX;
+        touchEndY = e.changedTouches[0].screenY;
+        handleSwipe();
+    }, { passive: true });
+
+    // Close drawer on swipe down
+    const drawer = document.getElementById('mobileFilterDrawer');
+    let drawerTouchStart = 0;
+
+    drawer.addEventListener('touchstart', e => {
+        drawerTouchStart = e.touches[0].clientY;
+    }, { passive: true });
+
+    drawer.addEventListener('touchmove', e => {
+        const touchY = e.touches[0].clientY;
+        const diff = touchY - drawerTouchStart;
+
+        if (diff > 0 && drawer.scrollTop === 0) {
+            // Allow closing by pulling down
+            e.preventDefault();
+        }
+    });
+
+    drawer.addEventListener('touchend', e => {
+        const touchY = e.changedTouches[0].clientY;
+        const diff = touchY - drawerTouchStart;
+
+        if (diff > 100) {
+            closeMobileDrawer();
+        }
+    }, { passive: true });
+
+    // Pull to refresh (on main content)
+    let pullStartY = 0;
+    let isPulling = false;
+
+    window.addEventListener('touchstart', e => {
+        if (window.scrollY === 0) {
+            pullStartY = e.touches[0].clientY;
+            isPulling = true;
+        }
+    }, { passive: true });
+
+    window.addEventListener('touchmove', e => {
+        if (isPulling && window.scrollY === 0) {
+            const pullY = e.touches[0].clientY;
+            const diff = pullY - pullStartY;
+
+            if (diff > 80) {
+                showSwipeIndicator('Pull to refresh');
+            }
+        }
+    }, { passive: true });
+
+    window.addEventListener('touchend', e => {
+        if (isPulling) {
+            const pullY = e.changedTouches[0].clientY;
+            const diff = pullY - pullStartY;
+
+            if (diff > 100) {
+                location.reload();
+            }
+
+            isPulling = false;
+        }
+    }, { passive: true });
+
+    // Enhanced mobile nav visual feedback
+    function enhanceMobileNavFeedback() {
+        const navButtons = document.querySelectorAll('.mobile-nav-btn');
+        navButtons.forEach(btn => {
+            btn.addEventListener('touchstart', () => {
+                btn.style.transform = 'scale(0.95)';
+            }, { passive: true });
+
+            btn.addEventListener('touchend', () => {
+                btn.style.transform = '';
+            }, { passive: true });
+        });
+    }
+
+    enhanceMobileNavFeedback();
+
+    // Haptic feedback on mobile (if supported)
+    function triggerHapticFeedback() {
+        if ('vibrate' in navigator) {
+            navigator.vibrate(10);
+        }
+    }
+
+    // Add haptic to nav buttons
+    document.querySelectorAll('.mobile-nav-btn').forEach(btn => {
+        btn.addEventListener('click', triggerHapticFeedback);
+    });
+
+    // Add haptic to filter tabs on mobile
+    if (window.innerWidth < 768) {
+        document.querySelectorAll('.filter-tab').forEach(tab => {
+            tab.addEventListener('click', triggerHapticFeedback);
+        });
+    }
+
+    // Entry points for the shell's stubs and inline handlers
+    window.mobileNavAction = mobileNavAction;
+    window.openMobileFilterDrawer = openMobileFilterDrawer;
+    window.closeMobileDrawer = closeMobileDrawer;
+    window.applyMobileFilter = applyMobileFilter;
+    window.applyMobileSort = applyMobileSort;
+})();
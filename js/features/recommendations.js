@@ -0,0 +1,104 @@
+/**
+ * Lobbi Design System - Smart Suggestions
+ *
+ * Feature module for index.html, loaded on first use by loadFeature().
+ * Needs js/similarity-core.js, which loadFeature() brings in with it.
+ */
+
+(function () {
+    // Suggestions come from the precomputed neighbour table
+    // (data/neighbors.json, see js/similarity-core.js), seeded by
+    // favorites, collections and recently viewed styles. Only the seeds'
+    // neighbour lists are read - nothing scans the whole catalogue.
+    const RECOMMENDATION_LIMIT = 5;
+    let neighborIndex = null;
+
+    function loadNeighborIndex() {
+        if (!neighborIndex) {
+            neighborIndex = fetchCatalogJSON('data/neighbors.json')
+                .then(table => LobbiSimilarity.indexTable(table))
+                .catch(error => {
+                    neighborIndex = null;
+                    throw error;
+                });
+        }
+        return neighborIndex;
+    }
+
+    function getRecommendationSeeds() {
+        const seeds = favorites.map(num => ({ num, weight: 1, source: 'in your favorites' }));
+        Object.values(getCollections()).forEach(col => {
+            col.styles.forEach(num => seeds.push({ num, weight: 0.7, source: `in your "${col.name}" collection` }));
+        });
+        // Recent views fade with age
+        getRecentStyles().forEach((num, i) => {
+            seeds.push({ num, weight: 0.5 * Math.pow(0.8, i), source: 'recently viewed' });
+        });
+        return seeds;
+    }
+
+    function suggestionReason(rec) {
+        const seedStyle = styleByNum.get(rec.seed.num);
+        const seedName = seedStyle ? seedStyle.name : `Style ${rec.seed.num}`;
+        return `Similar palette, tags and mood to ${seedName} (${rec.seed.source})`;
+    }
+
+    async function generateAISuggestions() {
+        const panel = document.getElementById('aiRecommendationsPanel');
+        const body = document.getElementById('aiPanelBody');
+
+        let index;
+        try {
+            index = await loadNeighborIndex();
+        } catch (error) {
+            console.error('Could not load recommendations:', error);
+            showToast('Could not load recommendations', 'warning');
+            return;
+        }
+
+        let suggestions = LobbiSimilarity.recommend(index, getRecommendationSeeds(), RECOMMENDATION_LIMIT)
+            .filter(rec => styleByNum.has(rec.num))
+            .map(rec => ({
+                title: styleByNum.get(rec.num).name,
+                reason: suggestionReason(rec),
+                confidence: Math.round(rec.similarity * 100),
+                styleNum: rec.num
+            }));
+
+        // Nothing to go on yet - start from the styles most others resemble
+        if (suggestions.length === 0) {
+            suggestions = index.central
+                .filter(num => styleByNum.has(num))
+                .slice(0, RECOMMENDATION_LIMIT)
+                .map(num => ({
+                    title: styleByNum.get(num).name,
+                    reason: 'A versatile starting point - close to many other styles. Favorite styles to personalise these suggestions.',
+                    confidence: null,
+                    styleNum: num
+                }));
+        }
+
+        body.innerHTML = suggestions.map(sug => `
+            <div class="ai-suggestion">
+                <div class="ai-suggestion-header">
+                    <span class="ai-suggestion-title">${sug.title}</span>
+                    ${sug.confidence !== null ? `<span class="ai-confidence">${sug.confidence}%</span>` : ''}
+                </div>
+                <p class="ai-suggestion-reason">${sug.reason}</p>
+                <button class="ai-suggestion-action" onclick="jumpToStyle(${sug.styleNum})">
+                    View Style
+                </button>
+            </div>
+        `).join('');
+
+        panel.classList.add('visible');
+    }
+
+    function closeAIPanel() {
+        document.getElementById('aiRecommendationsPanel').classList.remove('visible');
+    }
+
+    // Entry points for the shell's stubs and inline handlers
+    window.generateAISuggestions = generateAISuggestions;
+    window.closeAIPanel = closeAIPanel;
+})();
@@ -0,0 +1,84 @@
+/**
+ * Lobbi Design System - Search History
+ *
+ * Feature module for index.html, loaded on first use by loadFeature().
+ * The shell owns the search box listeners and calls showSearchHistory on
+ * focus and saveSearchHistory on Enter.
+ */
+
+(function () {
+    const SEARCH_HISTORY_KEY = 'lobbi-search-history';
+    const MAX_SEARCH_HISTORY = 8;
+
+    function getSearchHistory() {
+        return JSON.parse(localStorage.getItem(SEARCH_HISTORY_KEY) || '[]');
+    }
+
+    function saveSearchHistory(term) {
+        if (!term || term.trim().length < 2) return;
+
+        let history = getSearchHistory();
+
+        // Remove if already exists
+        history = history.filter(item => item !== term);
+
+        // Add to beginning
+        history.unshift(term);
+
+        // Limit to MAX_SEARCH_HISTORY
+        history = history.slice(0, MAX_SEARCH_HISTORY);
+
+        localStorage.setItem(SEARCH_HISTORY_KEY, JSON.stringify(history));
+    }
+
+    function renderSearchHistory() {
+        const history = getSearchHistory();
+        const historyList = document.getElementById('searchHistoryList');
+
+        if (history.length === 0) {
+            historyList.innerHTML = '<div class="search-history-item" style="color:var(--text-muted);cursor:default;">No recent searches</div>';
+            return;
+        }
+
+        historyList.innerHTML = history.map(term => `
+            <div class="search-history-item" onclick="selectSearchHistory('${term.replace(/'/g, "\\'")}')">
+                <span>
+                    <svg class="history-icon" width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" style="display:inline;vertical-align:middle;">
+                        <circle cx="12" cy="12" r="10"></circle>
+                        <polyline points="12 6 12 12 16 14"></polyline>
+                    </svg>
+                    ${term}
+                </span>
+            </div>
+        `).join('');
+    }
+
+    function selectSearchHistory(term) {
+        document.getElementById('searchInput').value = term;
+        document.getElementById('searchHistory').classList.remove('visible');
+        filterAndSort();
+    }
+
+    function clearSearchHistory() {
+        localStorage.removeItem(SEARCH_HISTORY_KEY);
+        renderSearchHistory();
+        document.getElementById('searchHistory').classList.remove('visible');
+        showToast('Search history cleared', 'success');
+    }
+
+    // Called on every focus of the search box; the box may have lost
+    // focus again while this module was loading
+    function showSearchHistory() {
+        renderSearchHistory();
+        if (document.activeElement === searchInput && getSearchHistory().length > 0 && searchInput.value === '') {
+            searchHistory.classList.add('visible');
+        }
+    }
+
+    document.getElementById('clearSearchHistory').addEventListener('click', clearSearchHistory);
+
+    // Entry points for the shell's stubs and inline handlers
+    window.showSearchHistory = showSearchHistory;
+    window.saveSearchHistory = saveSearchHistory;
+    window.selectSearchHistory = selectSearchHistory;
+})();
@@ -0,0 +1,206 @@
+/**
+ * Lobbi Design System - Design Token Inspector
+ *
+ * Feature module for index.html, loaded on first use by loadFeature().
+ * Needs js/tokens-core.js, which loadFeature() brings in with it.
+ */
+
+(function () {
+    // Design Token Inspector
+    // Tokens are extracted from each style page at build time
+    // (scripts/extract-tokens.js) into one small shard per style,
+    // fetched the first time that style is inspected.
+    let currentInspectedStyle = null;
+    let currentTokens = null;
+    let currentTokenTab = 'colors';
+    const tokenShards = new Map();
+
+    function loadTokenShard(styleNum) {
+        if (!tokenShards.has(styleNum)) {
+            tokenShards.set(styleNum, fetchCatalogJSON(LobbiTokens.shardPath(styleNum))
+                .then(shard => {
+                    if (shard.version !== LobbiTokens.TOKENS_VERSION) {
+                        throw new Error(`token shard version ${shard.version}, expected ${LobbiTokens.TOKENS_VERSION}`);
+                    }
+                    return shard;
+                })
+                .catch(error => {
+                    tokenShards.delete(styleNum);
+                    throw error;
+                }));
+        }
+        return tokenShards.get(styleNum);
+    }
+
+    async function openTokenInspector(styleNum, event) {
+        event.preventDefault();
+        event.stopPropagation();
+
+        currentInspectedStyle = styles.find(s => s.num === styleNum);
+        if (!currentInspectedStyle) return;
+
+        const modal = document.getElementById('tokenInspectorModal');
+        const body = document.getElementById('tokenInspectorBody');
+        modal.classList.add('visible');
+        currentTokens = null;
+        currentTokenTab = 'colors';
+        setActiveTokenTab(currentTokenTab);
+        body.innerHTML = '<div class="token-loading">Loading tokens…</div>';
+
+        try {
+            const tokens = await loadTokenShard(styleNum);
+            if (currentInspectedStyle.num !== styleNum) return;
+            currentTokens = tokens;
+            renderTokenTab(currentTokenTab);
+        } catch (error) {
+            console.error('Token shard failed to load:', error);
+            if (currentInspectedStyle.num === styleNum) {
+                body.innerHTML = '<div class="token-loading">Tokens for this style are not available.</div>';
+            }
+        }
+    }
+
+    function closeTokenInspector() {
+        document.getElementById('tokenInspectorModal').classList.remove('visible');
+    }
+
+    function setActiveTokenTab(tab) {
+        document.querySelectorAll('.token-tab').forEach(t => t.classList.toggle('active', t.dataset.tab === tab));
+    }
+
+    function escapeTokenHTML(value) {
+        return String(value)
+            .replace(/&/g, '&amp;')
+            .replace(/</g, '&lt;')
+            .replace(/>/g, '&gt;')
+            .replace(/"/g, '&quot;');
+    }
+
+    // One copyable token card; `preview` is optional markup shown above the value
+    function tokenItem(name, value, preview = '') {
+        const safeValue = escapeTokenHTML(value);
+        return `
+            <div class="token-item">
+                ${preview}
+                <div class="token-item-header">
+                    <span class="token-name">${escapeTokenHTML(name)}</span>
+                    <button class="token-copy-btn" data-token="${safeValue}" onclick="copyToken(this.dataset.token)">Copy</button>
+                </div>
+                <div class="token-value">${safeValue}</div>
+            </div>
+        `;
+    }
+
+    function tokenSection(heading, items, empty) {
+        return `
+            <div class="token-section">
+                <h3>${heading}</h3>
+                ${items.length ? `<div class="token-grid">${items.join('')}</div>` : `<div class="token-value">${empty}</div>`}
+            </div>
+        `;
+    }
+
+    function renderTokenTab(tab) {
+        if (!currentInspectedStyle) return;
+
+        currentTokenTab = tab;
+        setActiveTokenTab(tab);
+        if (!currentTokens) return;
+
+        const body = document.getElementById('tokenInspectorBody');
+        const tokens = currentTokens;
+
+        if (tab === 'colors') {
+            body.innerHTML = tokenSection(`
+                <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+                    <circle cx="12" cy="12" r="10"></circle>
+                </svg>
+                Color Palette
+            `, tokens.colors.map(color => tokenItem(`color-${color.name.replace(/^color-/, '')}`, color.value,
+                `<div class="color-swatch-large" style="background: ${escapeTokenHTML(color.value)}"></div>`)),
+            'No colors found in this style.');
+        } else if (tab === 'typography') {
+            const families = [];
+            if (tokens.fonts.heading) families.push(tokenItem('font-heading', tokens.fonts.heading));
+            if (tokens.fonts.body) families.push(tokenItem('font-body', tokens.fonts.body));
+            tokens.fonts.webFonts.forEach((family, i) => families.push(tokenItem(`web-font-${i + 1}`, family)));
+
+            body.innerHTML = tokenSection('Font Families', families, 'No font families declared.') +
+                tokenSection('Type Scale', tokens.typeScale.map((size, i) => tokenItem(`font-size-${i + 1}`, size,
+                    `<div style="font-size: ${escapeTokenHTML(size)}; font-family: ${escapeTokenHTML(tokens.fonts.heading || 'inherit')}; color: var(--text-primary); white-space: nowrap; overflow: hidden; text-overflow: ellipsis; margin-bottom: 0.5rem;">Aa</div>`)),
+                'No font sizes declared.');
+        } else if (tab === 'spacing') {
+            body.innerHTML = tokenSection('Spacing Scale', tokens.spacing.map((size, i) => tokenItem(`space-${i + 1}`, size,
+                `<div style="background: var(--accent); height: ${escapeTokenHTML(size)}; max-height: 96px; width: 100%; margin-bottom: 0.5rem; border-radius: 0.25rem;"></div>`)),
+            'No spacing values declared.');
+        } else if (tab === 'effects') {
+            body.innerHTML = tokenSection('Border Radii', tokens.radii.map((radius, i) => tokenItem(`radius-${i + 1}`, radius,
+                `<div style="background: var(--bg-secondary); border: 2px solid var(--accent); border-radius: ${escapeTokenHTML(radius)}; height: 60px; margin-bottom: 0.5rem;"></div>`)),
+                'No border radii declared.') +
+                tokenSection('Shadows', tokens.shadows.map((shadow, i) => tokenItem(`shadow-${i + 1}`, shadow,
+                    `<div style="background: #fff; box-shadow: ${escapeTokenHTML(shadow)}; border-radius: 0.375rem; height: 60px; margin: 0.5rem 0.5rem 1rem;"></div>`)),
+                'No shadows declared.');
+        } else if (tab === 'export') {
+            const exportButton = (format, label, primary) => `
+                <button class="export-btn${primary ? ' primary' : ''}" onclick="downloadTokens('${format}')">
+                    <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+                        <path d="M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4"></path>
+                        <polyline points="7 10 12 15 17 10"></polyline>
+                        <line x1="12" y1="15" x2="12" y2="3"></line>
+                    </svg>
+                    ${label}
+                </button>
+            `;
+
+            body.innerHTML = `
+                <div class="token-section">
+                    <h3>Export Design Tokens</h3>
+                    <div class="export-options">
+                        ${exportButton('css', 'CSS Variables', true)}
+                        ${exportButton('tailwind', 'Tailwind Config')}
+                        ${exportButton('scss', 'SCSS Variables')}
+                        ${exportButton('json', 'JSON')}
+                    </div>
+                    <div style="margin-top: 2rem;">
+                        <h4 style="font-size: 0.875rem; margin-bottom: 0.75rem; color: var(--text-primary);">Preview (CSS Variables)</h4>
+                        <pre style="background: var(--bg-tertiary); padding: 1rem; border-radius: 0.5rem; overflow-x: auto; font-size: 0.75rem; color: var(--text-secondary);">${escapeTokenHTML(LobbiTokens.formatTokens(tokens, 'css').content)}</pre>
+                    </div>
+                </div>
+            `;
+        }
+    }
+
+    function copyToken(value) {
+        navigator.clipboard.writeText(value).then(() => {
+            showToast('Token copied!', 'success');
+        });
+    }
+
+    function downloadTokens(format) {
+        if (!currentTokens) return;
+
+        const { content, filename, mime } = LobbiTokens.formatTokens(currentTokens, format);
+        const blob = new Blob([content], { type: mime });
+        const url = URL.createObjectURL(blob);
+        const a = document.createElement('a');
+        a.href = url;
+        a.download = filename;
+        a.click();
+        URL.revokeObjectURL(url);
+
+        showToast(`Downloaded ${filename}`, 'success');
+    }
+
+    // Token tab switching
+    document.addEventListener('click', (e) => {
+        if (e.target.classList.contains('token-tab')) {
+            renderTokenTab(e.target.dataset.tab);
+        }
+    });
+
+    // Entry points for the shell's stubs and inline handlers
+    window.openTokenInspector = openTokenInspector;
+    window.closeTokenInspector = closeTokenInspector;
+    window.copyToken = copyToken;
+    window.downloadTokens = downloadTokens;
+})();
@@ -0,0 +1,91 @@
+/**
+ * Lobbi Design System - Walkthrough
+ *
+ * Feature module for index.html, loaded on first use by loadFeature().
+ * The shell opens it for first-time visitors (WALKTHROUGH_KEY) and
+ * from the help button.
+ */
+
+(function () {
+    let currentWalkthroughStep = 1;
+    const totalWalkthroughSteps = 4;
+
+    function showWalkthrough() {
+        const overlay = document.getElementById('walkthroughOverlay');
+        overlay.classList.add('visible');
+        document.body.style.overflow = 'hidden';
+        currentWalkthroughStep = 1;
+        updateWalkthroughStep();
+    }
+
+    function hideWalkthrough() {
+        const overlay = document.getElementById('walkthroughOverlay');
+        overlay.classList.remove('visible');
+        document.body.style.overflow = '';
+        localStorage.setItem(WALKTHROUGH_KEY, 'true');
+    }
+
+    function updateWalkthroughStep() {
+        // Update step visibility
+        document.querySelectorAll('.walkthrough-step').forEach(step => {
+            step.classList.remove('active');
+            if (parseInt(step.dataset.step) === currentWalkthroughStep) {
+                step.classList.add('active');
+            }
+        });
+
+        // Update dots
+        document.querySelectorAll('.walkthrough-dot').forEach(dot => {
+            dot.classList.remove('active');
+            if (parseInt(dot.dataset.dot) === currentWalkthroughStep) {
+                dot.classList.add('active');
+            }
+        });
+
+        // Update button text
+        const nextBtn = document.getElementById('walkthroughNext');
+        if (currentWalkthroughStep === totalWalkthroughSteps) {
+            nextBtn.textContent = 'Get Started';
+        } else {
+            nextBtn.textContent = 'Next';
+        }
+    }
+
+    function nextWalkthroughStep() {
+        if (currentWalkthroughStep < totalWalkthroughSteps) {
+            currentWalkthroughStep++;
+            updateWalkthroughStep();
+        } else {
+            hideWalkthrough();
+        }
+    }
+
+    // Walkthrough event listeners
+    document.getElementById('walkthroughSkip').addEventListener('click', hideWalkthrough);
+    document.getElementById('walkthroughNext').addEventListener('click', nextWalkthroughStep);
+
+    // Close walkthrough on overlay click
+    document.getElementById('walkthroughOverlay').addEventListener('click', (e) => {
+        if (e.target.id === 'walkthroughOverlay') {
+            hideWalkthrough();
+        }
+    });
+
+    // Close walkthrough on Escape
+    document.addEventListener('keydown', (e) => {
+        if (e.key === 'Escape' && document.getElementById('walkthroughOverlay').classList.contains('visible')) {
+            hideWalkthrough();
+        }
+    });
+
+    // Dot click navigation
+    document.querySelectorAll('.walkthrough-dot').forEach(dot => {
+        dot.addEventListener('click', () => {
+            currentWalkthroughStep = parseInt(dot.dataset.dot);
+            updateWalkthroughStep();
+        });
+    });
+
+    // Entry points for the shell's stubs and inline handlers
+    window.showWalkthrough = showWalkthrough;
+})();
@@ -0,0 +1,253 @@
+/**
+ * Lobbi Design System - Perf Core
+ *
+ * Shared performance report format. Used by:
+ * - index.html, where the Shift+P panel shows the current session's Web
+ *   Vitals and exports them as a report
+ * - scripts/bench-pages.js (Node), which injects this file into every page
+ *   it loads under puppeteer, collects the same metrics per scenario and
+ *   diffs reports against scripts/fixtures/perf-baseline.json
+ *
+ * Report:
+ *   { version, source, generatedAt, userAgent, viewport,
+ *     runs: [{ page, scenario, metrics }] }
+ *
+ * Metrics (null when the browser cannot measure them):
+ *   lcp, cls, inp        Web Vitals from PerformanceObserver; inp is null
+ *                        until the user interacts
+ *   interactions         interactions seen for inp
+ *   domContentLoaded,    navigation timing, ms
+ *   load
+ *   heapBytes            used JS heap (Chrome only)
+ *   domNodes             elements in the top document
+ *   transferBytes        bytes over the network. The panel sums the top
+ *                        document's resource timing; the benchmark counts
+ *                        every response, iframes included.
+ *   iframeCount,         iframes tracked with trackIframe(), and their
+ *   iframeLoadMean,      load times from src to load event, ms
+ *   iframeLoadMax
+ */
+
+(function (root, factory) {
+    const api = factory(root);
+    if (typeof module === 'object' && module.exports) {
+        module.exports = api;
+    } else {
+        root.LobbiPerf = api;
+    }
+})(typeof self !== 'undefined' ? self : this, function (root) {
+    const REPORT_VERSION = 1;
+
+    // Budgets derived from a baseline allow `headroom` (a fraction) plus
+    // `slack` (absolute) on top of the measured value. `noise` is the
+    // smallest change the diff report calls out.
+    const METRICS = [
+        { key: 'lcp', label: 'LCP', unit: 'ms', headroom: 0.2, slack: 100, noise: 50 },
+        { key: 'cls', label: 'CLS', unit: '', headroom: 0.2, slack: 0.02, noise: 0.01 },
+        { key: 'inp', label: 'INP', unit: 'ms', headroom: 0.2, slack: 50, noise: 16 },
+        { key: 'domContentLoaded', label: 'DOM ready', unit: 'ms', headroom: 0.2, slack: 100, noise: 50 },
+        { key: 'load', label: 'Load', unit: 'ms', headroom: 0.2, slack: 200, noise: 50 },
+        { key: 'heapBytes', label: 'JS heap', unit: 'B', headroom: 0.15, slack: 1048576, noise: 262144 },
+        { key: 'domNodes', label: 'DOM nodes', unit: '', headroom: 0.1, slack: 50, noise: 10 },
+        { key: 'transferBytes', label: 'Transferred', unit: 'B', headroom: 0.1, slack: 10240, noise: 1024 },
+        { key: 'iframeCount', label: 'Iframes', unit: '', headroom: 0, slack: 2, noise: 1 },
+        { key: 'iframeLoadMean', label: 'Iframe load (mean)', unit: 'ms', headroom: 0.25, slack: 100, noise: 50 },
+        { key: 'iframeLoadMax', label: 'Iframe load (max)', unit: 'ms', headroom: 0.25, slack: 200, noise: 50 }
+    ];
+
+    // Observers live on the page's global object so a second copy of this
+    // file (the page's own and the benchmark's) shares the first one's data
+    const VITALS_KEY = '__lobbiWebVitals';
+
+    // INP reports the worst interaction, ignoring one outlier per 50
+    function interactionToNextPaint(durations) {
+        if (durations.length === 0) return null;
+        const sorted = [...durations].sort((a, b) => b - a);
+        return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length / 50))];
+    }
+
+    // CLS is the largest session window: shifts less than 1s apart, at
+    // most 5s in total, ignoring shifts right after input
+    function cumulativeLayoutShift(shifts) {
+        let worst = 0;
+        let current = 0;
+        let windowStart = 0;
+        let previous = 0;
+        shifts.forEach(shift => {
+            if (current && (shift.startTime - previous > 1000 || shift.startTime - windowStart > 5000)) {
+                current = 0;
+            }
+            if (!current) windowStart = shift.startTime;
+            current += shift.value;
+            previous = shift.startTime;
+            worst = Math.max(worst, current);
+        });
+        return worst;
+    }
+
+    function observe(type, options, callback) {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback))
+                .observe({ type, buffered: true, ...options });
+            return true;
+        } catch (error) {
+            // Entry type not supported by this browser
+            return false;
+        }
+    }
+
+    /**
+     * Start collecting Web Vitals for this page (browser only). Safe to
+     * call more than once; every call returns the same collector.
+     */
+    function observeWebVitals() {
+        if (root[VITALS_KEY]) return root[VITALS_KEY];
+
+        const state = {
+            lcp: null,
+            lcpFinal: false,
+            shifts: [],
+            interactions: new Map(),
+            iframeLoads: [],
+            supported: {}
+        };
+
+        // LCP stops updating at the first input, as in the browser's own report
+        const finalizeLCP = () => { state.lcpFinal = true; };
+        ['keydown', 'pointerdown'].forEach(type =>
+            addEventListener(type, finalizeLCP, { once: true, capture: true }));
+
+        state.supported.lcp = observe('largest-contentful-paint', {}, entry => {
+            if (!state.lcpFinal) state.lcp = entry.renderTime || entry.loadTime || entry.startTime;
+        });
+        state.supported.cls = observe('layout-shift', {}, entry => {
+            if (!entry.hadRecentInput) state.shifts.push({ startTime: entry.startTime, value: entry.value });
+        });
+        const recordInteraction = entry => {
+            if (!entry.interactionId) return;
+            const longest = state.interactions.get(entry.interactionId) || 0;
+            state.interactions.set(entry.interactionId, Math.max(longest, entry.duration));
+        };
+        state.supported.inp = observe('event', { durationThreshold: 16 }, recordInteraction);
+        observe('first-input', {}, recordInteraction);
+
+        const collector = {
+            // Time an iframe from now to its next load event
+            trackIframe(iframe) {
+                const startTime = performance.now();
+                iframe.addEventListener('load', () => {
+                    state.iframeLoads.push(performance.now() - startTime);
+                }, { once: true });
+            },
+
+            // Current metrics for this page (see the format above)
+            collect() {
+                const nav = performance.getEntriesByType('navigation')[0];
+                const resources = performance.getEntriesByType('resource');
+                const loads = state.iframeLoads;
+                return {
+                    lcp: state.supported.lcp ? state.lcp : null,
+                    cls: state.supported.cls ? cumulativeLayoutShift(state.shifts) : null,
+                    inp: state.supported.inp ? interactionToNextPaint([...state.interactions.values()]) : null,
+                    interactions: state.interactions.size,
+                    domContentLoaded: nav ? nav.domContentLoadedEventEnd : null,
+                    load: nav && nav.loadEventEnd ? nav.loadEventEnd : null,
+                    heapBytes: performance.memory ? performance.memory.usedJSHeapSize : null,
+                    domNodes: document.getElementsByTagName('*').length,
+                    transferBytes: resources.reduce((sum, entry) => sum + (entry.transferSize || 0),
+                        nav ? nav.transferSize || 0 : 0),
+                    iframeCount: loads.length,
+                    iframeLoadMean: loads.length ? loads.reduce((sum, ms) => sum + ms, 0) / loads.length : null,
+                    iframeLoadMax: loads.length ? Math.max(...loads) : null
+                };
+            }
+        };
+
+        root[VITALS_KEY] = collector;
+        return collector;
+    }
+
+    function createReport(source, runs, environment = {}) {
+        return {
+            version: REPORT_VERSION,
+            source,
+            generatedAt: new Date().toISOString(),
+            userAgent: environment.userAgent || null,
+            viewport: environment.viewport || null,
+            runs
+        };
+    }
+
+    function runKey(run) {
+        return `${run.page}#${run.scenario}`;
+    }
+
+    // Budget for every metric the run measured
+    function deriveBudgets(metrics) {
+        const budgets = {};
+        METRICS.forEach(({ key, headroom, slack }) => {
+            const value = metrics[key];
+            if (value === null || value === undefined) return;
+            const budget = value * (1 + headroom) + slack;
+            budgets[key] = key === 'cls' ? Math.ceil(budget * 1000) / 1000 : Math.ceil(budget);
+        });
+        return budgets;
+    }
+
+    /**
+     * Compare a report against a baseline ({ version, runs: { key: { metrics,
+     * budgets } } }). Returns one row per run with every metric's change and
+     * whether it went over budget.
+     */
+    function compareReport(report, baseline) {
+        return report.runs.map(run => {
+            const key = runKey(run);
+            const base = baseline.runs[key] || null;
+            const metrics = METRICS.map(({ key: metric, label, unit, noise }) => {
+                const value = run.metrics[metric];
+                const before = base ? base.metrics[metric] : undefined;
+                const budget = base && base.budgets ? base.budgets[metric] : undefined;
+                const delta = typeof value === 'number' && typeof before === 'number' ? value - before : null;
+                return {
+                    key: metric,
+                    label,
+                    unit,
+                    value: value === undefined ? null : value,
+                    baseline: before === undefined ? null : before,
+                    delta,
+                    notable: delta !== null && Math.abs(delta) >= noise,
+                    budget: budget === undefined ? null : budget,
+                    overBudget: typeof value === 'number' && typeof budget === 'number' && value > budget
+                };
+            });
+            return {
+                key,
+                page: run.page,
+                scenario: run.scenario,
+                isNew: !base,
+                metrics,
+                overBudget: metrics.some(m => m.overBudget)
+            };
+        });
+    }
+
+    function formatValue(value, unit) {
+        if (value === null || value === undefined) return '--';
+        if (unit === 'B') return (value / 1024).toFixed(1) + 'KB';
+        if (unit === 'ms') return Math.round(value) + 'ms';
+        return String(Math.round(value * 1000) / 1000);
+    }
+
+    return {
+        REPORT_VERSION,
+        METRICS,
+        interactionToNextPaint,
+        cumulativeLayoutShift,
+        observeWebVitals,
+        createReport,
+        runKey,
+        deriveBudgets,
+        compareReport,
+        formatValue
+    };
+});
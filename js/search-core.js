@@ -0,0 +1,285 @@
+/**
+ * Lobbi Design System - Search Core
+ *
+ * Shared index builder and query engine for the gallery search. Used by:
+ * - scripts/build-data.js (build time, Node)
+ * - js/search-worker.js (Web Worker, via importScripts)
+ * - index.html (in-page fallback when workers are unavailable)
+ *
+ * Index layout (data/catalog/search-index.<hash>.json, listed in catalog.json):
+ *   docs      - style numbers, position = document id
+ *   terms     - sorted unique terms (words, blend-component phrases and
+ *               their shares, e.g. "art deco 60")
+ *   postings  - per term, flat [docId, weight, docId, weight, ...]
+ *
+ * The trigram map (trigram -> term ids, for substring and typo-tolerant
+ * lookup) is a function of `terms`, so it is not shipped: addTrigrams()
+ * builds it once the index is loaded.
+ */
+
+(function (root, factory) {
+    const api = factory();
+    if (typeof module === 'object' && module.exports) {
+        module.exports = api;
+    } else {
+        root.LobbiSearch = api;
+    }
+})(typeof self !== 'undefined' ? self : this, function () {
+    const INDEX_VERSION = 2;
+
+    // Field weights - a name hit outranks a tag, blend or "perfect for" hit
+    const FIELD_WEIGHTS = {
+        name: 8,
+        tag: 6,
+        blend: 4,
+        perfectFor: 3
+    };
+
+    const FUZZY_MIN_LENGTH = 4;
+    const FUZZY_MIN_SIMILARITY = 0.45;
+
+    function normalize(text) {
+        return String(text).toLowerCase().normalize('NFKD').replace(/[\u0300-\u036f]/g, '');
+    }
+
+    function tokenize(text) {
+        return normalize(text).split(/[^a-z0-9]+/).filter(Boolean);
+    }
+
+    function trigramsOf(term) {
+        const padded = ` ${term} `;
+        const grams = new Set();
+        for (let i = 0; i < padded.length - 2; i++) {
+            grams.add(padded.slice(i, i + 3));
+        }
+        return grams;
+    }
+
+    // "Art Deco 60% + Streamline 40%" -> [{ phrase: 'art deco', share: 0.6, percent: 60 }, ...]
+    // A component without a percentage has share 1 and percent null
+    function parseBlend(blend) {
+        return String(blend).split('+').map(part => {
+            const match = part.trim().match(/^(.*?)\s*(\d+)%$/);
+            const label = match ? match[1] : part.trim();
+            const percent = match ? parseInt(match[2], 10) : null;
+            return { phrase: tokenize(label).join(' '), share: match ? percent / 100 : 1, percent };
+        }).filter(component => component.phrase);
+    }
+
+    /**
+     * Build the index from the style manifest entries.
+     */
+    function buildIndex(styles) {
+        const termDocs = new Map();
+
+        function add(term, docId, weight) {
+            if (!termDocs.has(term)) termDocs.set(term, new Map());
+            const docs = termDocs.get(term);
+            docs.set(docId, Math.max(docs.get(docId) || 0, weight));
+        }
+
+        styles.forEach((style, docId) => {
+            tokenize(style.name).forEach(t => add(t, docId, FIELD_WEIGHTS.name));
+            const fullName = tokenize(style.name).join(' ');
+            if (fullName.includes(' ')) add(fullName, docId, FIELD_WEIGHTS.name);
+
+            (style.tags || []).forEach(tag => {
+                add(normalize(tag), docId, FIELD_WEIGHTS.tag);
+                tokenize(tag).forEach(t => add(t, docId, FIELD_WEIGHTS.tag));
+            });
+
+            // Blend components are indexed as whole phrases and as words,
+            // weighted by their share of the blend. The share is indexed too,
+            // with its phrase ("art deco 60") and on its own ("60"), so
+            // "art deco 60%" finds the blend it was copied from.
+            parseBlend(style.blend || '').forEach(({ phrase, share, percent }) => {
+                const weight = FIELD_WEIGHTS.blend * (0.5 + share);
+                add(phrase, docId, weight);
+                phrase.split(' ').forEach(t => add(t, docId, weight));
+                if (percent !== null) {
+                    add(`${phrase} ${percent}`, docId, weight);
+                    add(String(percent), docId, weight);
+                }
+            });
+
+            (style.perfectFor || []).forEach(use => {
+                const phrase = tokenize(use).join(' ');
+                if (phrase.includes(' ')) add(phrase, docId, FIELD_WEIGHTS.perfectFor);
+                tokenize(use).forEach(t => add(t, docId, FIELD_WEIGHTS.perfectFor));
+            });
+        });
+
+        const terms = Array.from(termDocs.keys()).sort();
+        const postings = terms.map(term => {
+            const flat = [];
+            termDocs.get(term).forEach((weight, docId) => {
+                flat.push(docId, Math.round(weight * 100) / 100);
+            });
+            return flat;
+        });
+
+        return {
+            version: INDEX_VERSION,
+            docs: styles.map(s => s.num),
+            terms,
+            postings
+        };
+    }
+
+    /**
+     * Add the trigram map to a built or loaded index, in place. Returns the
+     * index, ready for search().
+     */
+    function addTrigrams(index) {
+        if (index.trigrams) return index;
+        const trigrams = {};
+        index.terms.forEach((term, termId) => {
+            trigramsOf(term).forEach(gram => {
+                (trigrams[gram] = trigrams[gram] || []).push(termId);
+            });
+        });
+        index.trigrams = trigrams;
+        return index;
+    }
+
+    function lowerBound(sorted, value) {
+        let lo = 0;
+        let hi = sorted.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >>> 1;
+            if (sorted[mid] < value) lo = mid + 1;
+            else hi = mid;
+        }
+        return lo;
+    }
+
+    /**
+     * Find the term ids matching one query token, with a score multiplier.
+     * Exact and substring hits come from the trigram candidates; when none
+     * exist, terms with enough trigram overlap are accepted as typo matches.
+     */
+    function matchToken(index, token) {
+        const grams = Array.from(trigramsOf(token));
+        const overlap = new Map();
+        grams.forEach(gram => {
+            (index.trigrams[gram] || []).forEach(termId => {
+                overlap.set(termId, (overlap.get(termId) || 0) + 1);
+            });
+        });
+
+        const matches = new Map();
+        // Substring candidates contain every inner trigram of the token
+        const inner = grams.filter(g => g[0] !== ' ' && g[2] !== ' ').length;
+        overlap.forEach((count, termId) => {
+            const term = index.terms[termId];
+            if (count < inner) return;
+            if (term === token) {
+                matches.set(termId, 1);
+            } else if (term.startsWith(token)) {
+                matches.set(termId, 0.8);
+            } else if (term.includes(token)) {
+                matches.set(termId, 0.6);
+            }
+        });
+
+        if (token.length <= 2) {
+            // Too short for inner trigrams - take the sorted prefix range
+            for (let termId = lowerBound(index.terms, token); termId < index.terms.length; termId++) {
+                if (!index.terms[termId].startsWith(token)) break;
+                if (!matches.has(termId)) matches.set(termId, 0.8);
+            }
+        }
+
+        if (matches.size === 0 && token.length >= FUZZY_MIN_LENGTH) {
+            overlap.forEach((count, termId) => {
+                // A padded term of length n has n trigrams
+                const termGrams = index.terms[termId].length;
+                const similarity = (2 * count) / (grams.length + termGrams);
+                if (similarity >= FUZZY_MIN_SIMILARITY) {
+                    matches.set(termId, 0.5 * similarity);
+                }
+            });
+        }
+
+        return matches;
+    }
+
+    /**
+     * Run a query. Returns style numbers ordered by score (best first), or
+     * null for an empty query meaning "everything".
+     */
+    function search(index, query) {
+        const phrase = tokenize(query).join(' ');
+        if (!phrase) return null;
+
+        const scores = new Map();
+        const tokens = phrase.split(' ');
+
+        // Every token has to match (AND); scores add up across tokens
+        for (let i = 0; i < tokens.length; i++) {
+            const tokenScores = new Map();
+            matchToken(index, tokens[i]).forEach((multiplier, termId) => {
+                const flat = index.postings[termId];
+                for (let p = 0; p < flat.length; p += 2) {
+                    const docId = flat[p];
+                    const score = flat[p + 1] * multiplier;
+                    if (score > (tokenScores.get(docId) || 0)) tokenScores.set(docId, score);
+                }
+            });
+
+            if (i === 0) {
+                tokenScores.forEach((score, docId) => scores.set(docId, score));
+            } else {
+                scores.forEach((score, docId) => {
+                    if (tokenScores.has(docId)) {
+                        scores.set(docId, score + tokenScores.get(docId));
+                    } else {
+                        scores.delete(docId);
+                    }
+                });
+            }
+            if (scores.size === 0) return [];
+        }
+
+        // Whole-phrase hits (e.g. "art deco") get a bonus over scattered words
+        if (tokens.length > 1) {
+            matchToken(index, phrase).forEach((multiplier, termId) => {
+                const flat = index.postings[termId];
+                for (let p = 0; p < flat.length; p += 2) {
+                    const docId = flat[p];
+                    if (scores.has(docId)) scores.set(docId, scores.get(docId) + flat[p + 1] * multiplier);
+                }
+            });
+        }
+
+        return Array.from(scores.entries())
+            .sort((a, b) => b[1] - a[1] || index.docs[a[0]] - index.docs[b[0]])
+            .map(([docId]) => index.docs[docId]);
+    }
+
+    /**
+     * Count every facet in a single pass over the matched styles.
+     */
+    function countFacets(matchedStyles, favorites) {
+        const favoriteSet = new Set(favorites);
+        const counts = { all: 0, favorites: 0 };
+        for (const style of matchedStyles) {
+            counts.all++;
+            if (favoriteSet.has(style.num)) counts.favorites++;
+            for (const tag of style.tags) {
+                counts[tag] = (counts[tag] || 0) + 1;
+            }
+        }
+        return counts;
+    }
+
+    return {
+        INDEX_VERSION,
+        tokenize,
+        parseBlend,
+        buildIndex,
+        addTrigrams,
+        search,
+        countFacets
+    };
+});
@@ -0,0 +1,48 @@
+/**
+ * Lobbi Design System - Search Worker
+ *
+ * Answers gallery search queries off the main thread.
+ *   in:  { type: 'load', url }  the index listed in data/catalog.json,
+ *                               sent once the page has fetched it
+ *        { id, query }
+ *   out: { id, results }   results = ranked style numbers, or null for "all"
+ *        { type: 'ready' } once the index has loaded
+ *        { type: 'error', message } if the index could not be loaded
+ */
+
+importScripts('search-core.js');
+
+let loadIndex;
+const indexUrl = new Promise(resolve => { loadIndex = resolve; });
+
+const indexReady = indexUrl
+    .then(url => fetch(url))
+    .then(response => {
+        if (!response.ok) throw new Error(`search index: HTTP ${response.status}`);
+        return response.json();
+    })
+    .then(index => {
+        if (index.version !== LobbiSearch.INDEX_VERSION) {
+            throw new Error(`search index version ${index.version}, expected ${LobbiSearch.INDEX_VERSION}`);
+        }
+        // Not shipped - derived from the terms here
+        LobbiSearch.addTrigrams(index);
+        self.postMessage({ type: 'ready' });
+        return index;
+    })
+    .catch(error => {
+        self.postMessage({ type: 'error', message: error.message });
+        throw error;
+    });
+
+self.addEventListener('message', (e) => {
+    if (e.data.type === 'load') {
+        // Relative to this script, which lives in js/
+        loadIndex(e.data.url);
+        return;
+    }
+    const { id, query } = e.data;
+    indexReady.then(index => {
+        self.postMessage({ id, results: LobbiSearch.search(index, query) });
+    }, () => {});
+});
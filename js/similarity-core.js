@@ -0,0 +1,292 @@
+/**
+ * Lobbi Design System - Similarity Core
+ *
+ * Style similarity and recommendations. Used by:
+ * - scripts/build-data.js (build time, Node) to compute the neighbour table
+ * - index.html to turn favorites, collections and recent views into
+ *   suggestions from that table
+ *
+ * Each style becomes one feature vector, weighted so that plain Euclidean
+ * distance combines:
+ *   palette - CIELAB colors, matched by lightness rank (distance ~ delta E)
+ *   tags    - normalised multi-hot tags
+ *   blend   - blend-component words weighted by their share
+ *   mood    - temperature and formality
+ * Neighbours come from a vantage-point tree over those vectors, so building
+ * the table costs O(n log n) distance evaluations rather than O(n^2).
+ *
+ * Neighbour table layout (data/neighbors.json):
+ *   k         - neighbours per style
+ *   nums      - style numbers
+ *   neighbors - per style, flat [num, similarity, num, similarity, ...]
+ *               with similarity in thousandths, best first
+ *   central   - styles that appear most in other styles' neighbour lists
+ */
+
+(function (root, factory) {
+    const api = factory();
+    if (typeof module === 'object' && module.exports) {
+        module.exports = api;
+    } else {
+        root.LobbiSimilarity = api;
+    }
+})(typeof self !== 'undefined' ? self : this, function () {
+    const SIMILARITY_VERSION = 1;
+
+    // Share of the squared distance each feature group contributes
+    const FEATURE_WEIGHTS = {
+        palette: 0.35,
+        tags: 0.30,
+        blend: 0.15,
+        mood: 0.20
+    };
+
+    // Palettes are resampled to this many colors, darkest first
+    const PALETTE_SIZE = 4;
+    const CENTRAL_COUNT = 6;
+
+    // --- Color ---------------------------------------------------------
+
+    function srgbToLinear(channel) {
+        const c = channel / 255;
+        return c <= 0.04045 ? c / 12.92 : Math.pow((c + 0.055) / 1.055, 2.4);
+    }
+
+    // sRGB hex -> CIELAB (D65 white point)
+    function hexToLab(hex) {
+        let value = String(hex).replace('#', '');
+        if (value.length === 3) value = value.split('').map(c => c + c).join('');
+        const r = srgbToLinear(parseInt(value.slice(0, 2), 16));
+        const g = srgbToLinear(parseInt(value.slice(2, 4), 16));
+        const b = srgbToLinear(parseInt(value.slice(4, 6), 16));
+
+        const x = (r * 0.4124564 + g * 0.3575761 + b * 0.1804375) / 0.95047;
+        const y = (r * 0.2126729 + g * 0.7151522 + b * 0.0721750);
+        const z = (r * 0.0193339 + g * 0.1191920 + b * 0.9503041) / 1.08883;
+
+        const f = t => t > 216 / 24389 ? Math.cbrt(t) : (24389 / 27 * t + 16) / 116;
+        const fx = f(x);
+        const fy = f(y);
+        const fz = f(z);
+        return [116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)];
+    }
+
+    function paletteLab(colors) {
+        const labs = colors.map(hexToLab).sort((a, b) => a[0] - b[0]);
+        if (labs.length === 0) return new Array(PALETTE_SIZE).fill([50, 0, 0]);
+        return Array.from({ length: PALETTE_SIZE }, (_, i) =>
+            labs[Math.round(i * (labs.length - 1) / Math.max(1, PALETTE_SIZE - 1))]);
+    }
+
+    // --- Features ------------------------------------------------------
+
+    function blendWords(blend) {
+        const weights = new Map();
+        String(blend).split('+').forEach(part => {
+            const match = part.trim().match(/^(.*?)\s*(\d+)%$/);
+            const label = match ? match[1] : part.trim();
+            const share = match ? parseInt(match[2], 10) / 100 : 1;
+            label.toLowerCase().split(/[^a-z0-9]+/).filter(Boolean).forEach(word => {
+                weights.set(word, (weights.get(word) || 0) + share);
+            });
+        });
+        return weights;
+    }
+
+    function unitScale(values) {
+        const norm = Math.sqrt(values.reduce((sum, v) => sum + v * v, 0));
+        return norm > 0 ? values.map(v => v / norm) : values;
+    }
+
+    /**
+     * Feature vectors for a list of styles (each needs colors, blend, tags,
+     * temp and formality). The tag and blend vocabularies are taken from the
+     * list itself; blend words used by only one style carry no similarity
+     * signal and are dropped.
+     */
+    function buildFeatures(styles) {
+        const tagVocab = [...new Set(styles.flatMap(style => style.tags))].sort();
+        const blendByStyle = styles.map(style => blendWords(style.blend));
+        const wordCounts = new Map();
+        blendByStyle.forEach(words => words.forEach((_, word) => {
+            wordCounts.set(word, (wordCounts.get(word) || 0) + 1);
+        }));
+        const blendVocab = [...wordCounts].filter(([, count]) => count > 1).map(([word]) => word).sort();
+
+        // Scale each group to roughly [0, 1] distance before weighting
+        const paletteScale = Math.sqrt(FEATURE_WEIGHTS.palette) / (100 * Math.sqrt(PALETTE_SIZE));
+        const tagScale = Math.sqrt(FEATURE_WEIGHTS.tags) / Math.SQRT2;
+        const blendScale = Math.sqrt(FEATURE_WEIGHTS.blend) / Math.SQRT2;
+        const moodScale = Math.sqrt(FEATURE_WEIGHTS.mood) / Math.SQRT2;
+
+        const vectors = styles.map((style, i) => {
+            const palette = paletteLab(style.colors || []).flat().map(v => v * paletteScale);
+            const tags = unitScale(tagVocab.map(tag => style.tags.includes(tag) ? 1 : 0)).map(v => v * tagScale);
+            const blend = unitScale(blendVocab.map(word => blendByStyle[i].get(word) || 0)).map(v => v * blendScale);
+            const mood = [(style.temp - 1) / 9, (style.formality - 1) / 9].map(v => v * moodScale);
+            return Float64Array.from([...palette, ...tags, ...blend, ...mood]);
+        });
+
+        return { nums: styles.map(style => style.num), vectors };
+    }
+
+    function distance(a, b) {
+        let sum = 0;
+        for (let i = 0; i < a.length; i++) {
+            const d = a[i] - b[i];
+            sum += d * d;
+        }
+        return Math.sqrt(sum);
+    }
+
+    // --- Vantage-point tree --------------------------------------------
+
+    function buildVpTree(vectors) {
+        function build(ids) {
+            if (ids.length === 0) return null;
+            const [vantage, ...rest] = ids;
+            if (rest.length === 0) return { id: vantage, radius: 0, inside: null, outside: null };
+
+            const dists = rest.map(id => ({ id, d: distance(vectors[vantage], vectors[id]) }))
+                .sort((a, b) => a.d - b.d || a.id - b.id);
+            const mid = Math.floor(dists.length / 2);
+            return {
+                id: vantage,
+                radius: dists[mid].d,
+                inside: build(dists.slice(0, mid).map(item => item.id)),
+                outside: build(dists.slice(mid).map(item => item.id))
+            };
+        }
+        return build(vectors.map((_, id) => id));
+    }
+
+    // k nearest ids to vectors[target], excluding target itself
+    function queryVpTree(tree, vectors, target, k) {
+        const best = [];
+        let tau = Infinity;
+
+        function consider(id, d) {
+            if (id === target) return;
+            if (best.length === k && d >= tau) return;
+            best.push({ id, d });
+            best.sort((a, b) => a.d - b.d || a.id - b.id);
+            if (best.length > k) best.pop();
+            if (best.length === k) tau = best[k - 1].d;
+        }
+
+        function search(node) {
+            if (!node) return;
+            const d = distance(vectors[target], vectors[node.id]);
+            consider(node.id, d);
+            if (d < node.radius) {
+                if (d - tau <= node.radius) search(node.inside);
+                if (d + tau >= node.radius) search(node.outside);
+            } else {
+                if (d + tau >= node.radius) search(node.outside);
+                if (d - tau <= node.radius) search(node.inside);
+            }
+        }
+
+        search(tree);
+        return best;
+    }
+
+    // Distance -> similarity in thousandths
+    function toSimilarity(d) {
+        return Math.round(Math.max(0, 1 - d) * 1000);
+    }
+
+    /**
+     * Compute the neighbour table for a list of styles.
+     */
+    function buildNeighborTable(styles, k = 12) {
+        const { nums, vectors } = buildFeatures(styles);
+        const tree = buildVpTree(vectors);
+        const count = Math.min(k, nums.length - 1);
+        const inbound = new Array(nums.length).fill(0);
+
+        const neighbors = nums.map((_, id) => {
+            const row = [];
+            queryVpTree(tree, vectors, id, count).forEach(({ id: other, d }) => {
+                const similarity = toSimilarity(d);
+                row.push(nums[other], similarity);
+                inbound[other] += similarity;
+            });
+            return row;
+        });
+
+        const central = inbound
+            .map((score, id) => ({ num: nums[id], score }))
+            .sort((a, b) => b.score - a.score || a.num - b.num)
+            .slice(0, CENTRAL_COUNT)
+            .map(item => item.num);
+
+        return { version: SIMILARITY_VERSION, k: count, nums, neighbors, central };
+    }
+
+    // --- Recommendations -----------------------------------------------
+
+    // num -> [{ num, similarity }] lookup over a neighbour table
+    function indexTable(table) {
+        if (table.version !== SIMILARITY_VERSION) {
+            throw new Error(`neighbour table version ${table.version}, expected ${SIMILARITY_VERSION}`);
+        }
+        const byNum = new Map();
+        table.nums.forEach((num, i) => {
+            const row = table.neighbors[i];
+            const list = [];
+            for (let j = 0; j < row.length; j += 2) {
+                list.push({ num: row[j], similarity: row[j + 1] / 1000 });
+            }
+            byNum.set(num, list);
+        });
+        return { byNum, central: table.central || [] };
+    }
+
+    function similarTo(index, num, count) {
+        return (index.byNum.get(num) || []).slice(0, count);
+    }
+
+    /**
+     * Rank styles by weighted similarity to a set of seed styles, reading
+     * only the seeds' neighbour lists.
+     *   seeds: [{ num, weight, ...anything the caller wants echoed back }]
+     * Returns [{ num, score, similarity, seed }] where `seed` is the seed that
+     * contributed most and `similarity` its similarity to the suggestion.
+     */
+    function recommend(index, seeds, limit = 5) {
+        const seedNums = new Set(seeds.map(seed => seed.num));
+        const candidates = new Map();
+
+        seeds.forEach(seed => {
+            similarTo(index, seed.num, Infinity).forEach(({ num, similarity }) => {
+                if (seedNums.has(num)) return;
+                const contribution = seed.weight * similarity;
+                const entry = candidates.get(num) || { num, score: 0, similarity: 0, seed: null, best: 0 };
+                entry.score += contribution;
+                if (contribution > entry.best) {
+                    entry.best = contribution;
+                    entry.seed = seed;
+                    entry.similarity = similarity;
+                }
+                candidates.set(num, entry);
+            });
+        });
+
+        return [...candidates.values()]
+            .sort((a, b) => b.score - a.score || a.num - b.num)
+            .slice(0, limit)
+            .map(({ num, score, similarity, seed }) => ({ num, score, similarity, seed }));
+    }
+
+    return {
+        SIMILARITY_VERSION,
+        FEATURE_WEIGHTS,
+        hexToLab,
+        buildFeatures,
+        buildNeighborTable,
+        indexTable,
+        similarTo,
+        recommend
+    };
+});
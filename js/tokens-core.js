@@ -0,0 +1,139 @@
+/**
+ * Lobbi Design System - Tokens Core
+ *
+ * Token shard format and exporters. Used by:
+ * - scripts/extract-tokens.js (build time, Node) to write the shards
+ * - scripts/export-tokens.js (bulk export archive)
+ * - index.html token inspector (single-style downloads)
+ *
+ * Shard layout (data/tokens/style-<num>.json):
+ *   version, num, name
+ *   customProperties - :root custom properties as written
+ *   colors           - [{ name, value }]
+ *   fonts            - { heading, body, stacks, webFonts }
+ *   typeScale, radii, spacing - values, smallest first
+ *   shadows          - most used first
+ */
+
+(function (root, factory) {
+    const api = factory();
+    if (typeof module === 'object' && module.exports) {
+        module.exports = api;
+    } else {
+        root.LobbiTokens = api;
+    }
+})(typeof self !== 'undefined' ? self : this, function () {
+    const TOKENS_VERSION = 1;
+
+    const FORMATS = {
+        css: { extension: 'css', mime: 'text/css' },
+        scss: { extension: 'scss', mime: 'text/x-scss' },
+        tailwind: { extension: 'js', mime: 'text/javascript' },
+        json: { extension: 'json', mime: 'application/json' }
+    };
+
+    function shardPath(num) {
+        return `data/tokens/style-${num}.json`;
+    }
+
+    // Flat [name, value] list shared by the CSS and SCSS exports
+    function flatTokens(tokens) {
+        const entries = tokens.colors.map(color => [`color-${color.name.replace(/^color-/, '')}`, color.value]);
+        if (tokens.fonts.heading) entries.push(['font-heading', tokens.fonts.heading]);
+        if (tokens.fonts.body) entries.push(['font-body', tokens.fonts.body]);
+        tokens.typeScale.forEach((value, i) => entries.push([`font-size-${i + 1}`, value]));
+        tokens.radii.forEach((value, i) => entries.push([`radius-${i + 1}`, value]));
+        tokens.shadows.forEach((value, i) => entries.push([`shadow-${i + 1}`, value]));
+        tokens.spacing.forEach((value, i) => entries.push([`space-${i + 1}`, value]));
+        return entries;
+    }
+
+    function fontList(stack) {
+        return stack.split(',').map(font => font.trim().replace(/^['"]|['"]$/g, ''));
+    }
+
+    function toObject(values, prefix) {
+        const result = {};
+        values.forEach((value, i) => {
+            result[`${prefix}${i + 1}`] = value;
+        });
+        return result;
+    }
+
+    function title(tokens) {
+        return `${tokens.name} (Style ${tokens.num}) - Lobbi Design System tokens`;
+    }
+
+    function toCSS(tokens) {
+        const lines = flatTokens(tokens).map(([name, value]) => `  --${name}: ${value};`);
+        return `/* ${title(tokens)} */\n:root {\n${lines.join('\n')}\n}\n`;
+    }
+
+    function toSCSS(tokens) {
+        const lines = flatTokens(tokens).map(([name, value]) => `$${name}: ${value};`);
+        return `// ${title(tokens)}\n${lines.join('\n')}\n`;
+    }
+
+    function toTailwind(tokens) {
+        const colors = {};
+        tokens.colors.forEach(color => {
+            colors[color.name.replace(/^color-/, '')] = color.value;
+        });
+        const fontFamily = {};
+        if (tokens.fonts.heading) fontFamily.heading = fontList(tokens.fonts.heading);
+        if (tokens.fonts.body) fontFamily.body = fontList(tokens.fonts.body);
+
+        const config = {
+            theme: {
+                extend: {
+                    colors,
+                    fontFamily,
+                    fontSize: toObject(tokens.typeScale, 'scale-'),
+                    borderRadius: toObject(tokens.radii, 'style-'),
+                    boxShadow: toObject(tokens.shadows, 'style-'),
+                    spacing: toObject(tokens.spacing, 'style-')
+                }
+            }
+        };
+        return `// ${title(tokens)}\nmodule.exports = ${JSON.stringify(config, null, 2)};\n`;
+    }
+
+    function toJSON(tokens) {
+        return JSON.stringify({
+            styleName: tokens.name,
+            styleNumber: tokens.num,
+            colors: tokens.colors,
+            typography: {
+                headingFont: tokens.fonts.heading,
+                bodyFont: tokens.fonts.body,
+                webFonts: tokens.fonts.webFonts,
+                scale: tokens.typeScale
+            },
+            radii: tokens.radii,
+            shadows: tokens.shadows,
+            spacing: tokens.spacing,
+            customProperties: tokens.customProperties
+        }, null, 2) + '\n';
+    }
+
+    const FORMATTERS = { css: toCSS, scss: toSCSS, tailwind: toTailwind, json: toJSON };
+
+    /**
+     * Render a token shard in one of FORMATS. Returns { content, filename, mime }.
+     */
+    function formatTokens(tokens, format) {
+        if (!FORMATTERS[format]) throw new Error(`unknown token format "${format}"`);
+        return {
+            content: FORMATTERS[format](tokens),
+            filename: `style-${tokens.num}-tokens.${FORMATS[format].extension}`,
+            mime: FORMATS[format].mime
+        };
+    }
+
+    return {
+        TOKENS_VERSION,
+        FORMATS,
+        shardPath,
+        formatTokens
+    };
+});
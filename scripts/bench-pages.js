@@ -0,0 +1,427 @@
+#!/usr/bin/env node
+/**
+ * Page Performance Benchmark
+ * Loads the gallery and every style page in headless Chrome, served over a
+ * local HTTP server, and records Web Vitals (LCP, CLS, INP), JS heap, DOM
+ * nodes, transferred bytes and iframe load times in the js/perf-core.js
+ * report format - the same one the gallery's Shift+P panel exports.
+ *
+ * Gallery scenarios, each from a cold cache:
+ *   cold-load         open index.html and wait for the grid to settle
+ *   scroll-to-bottom  then scroll the grid to the end
+ *   search            then type a recorded search (scripts/fixtures/search-queries.json)
+ *   compare           then pick two styles in compare mode and open the comparison
+ * Every style page gets a cold-load run.
+ *
+ * The report goes to dist/perf/report.json and is diffed against the
+ * per-page budgets in scripts/fixtures/perf-baseline.json; the run fails if
+ * any page goes over budget. --update-baseline records this run as the
+ * baseline, keeping budgets already there and deriving the missing ones.
+ * Until a baseline is committed there are no budgets: runs report metrics
+ * and fail only on page errors.
+ * --from diffs a saved report (e.g. a perf panel export) without a browser.
+ *
+ * Run with: npm run bench-pages [-- --only gallery|styles] [-- --single N] [-- --runs N]
+ *           [-- --concurrency N] [-- --update-baseline] [-- --from report.json]
+ *
+ * Prerequisites:
+ * - npm install puppeteer
+ */
+
+const fs = require('fs');
+const http = require('http');
+const path = require('path');
+const LobbiPerf = require('../js/perf-core');
+const { loadStyles } = require('./lib/manifest');
+const { parseCount } = require('./lib/worker-pool');
+
+const ROOT_DIR = path.join(__dirname, '..');
+const OUTPUT_DIR = path.join(ROOT_DIR, 'dist', 'perf');
+const REPORT_PATH = path.join(OUTPUT_DIR, 'report.json');
+const DIFF_PATH = path.join(OUTPUT_DIR, 'diff.json');
+const BASELINE_PATH = path.join(__dirname, 'fixtures', 'perf-baseline.json');
+const QUERIES_PATH = path.join(__dirname, 'fixtures', 'search-queries.json');
+const PERF_CORE_PATH = path.join(ROOT_DIR, 'js', 'perf-core.js');
+
+const VIEWPORT = { width: 1400, height: 900 };
+const DEFAULT_CONCURRENCY = 4;
+const NAVIGATION_TIMEOUT = 30000;
+const IDLE_TIME = 500;
+const KEY_DELAY = 120;
+const MAX_SCROLL_STEPS = 200;
+
+const MIME_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.js': 'text/javascript; charset=utf-8',
+    '.json': 'application/json; charset=utf-8',
+    '.svg': 'image/svg+xml',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.webp': 'image/webp',
+    '.avif': 'image/avif',
+    '.woff2': 'font/woff2',
+    '.ico': 'image/x-icon'
+};
+
+// --- Server ------------------------------------------------------------
+
+// The gallery fetches its catalogue, so pages can't be opened from file://
+function startServer() {
+    const server = http.createServer((req, res) => {
+        const urlPath = decodeURIComponent(new URL(req.url, 'http://localhost').pathname);
+        const filePath = path.join(ROOT_DIR, urlPath === '/' ? 'index.html' : urlPath);
+        if (!filePath.startsWith(ROOT_DIR + path.sep)) {
+            res.writeHead(403);
+            res.end();
+            return;
+        }
+        fs.readFile(filePath, (error, content) => {
+            if (error) {
+                res.writeHead(404);
+                res.end();
+                return;
+            }
+            res.writeHead(200, { 'Content-Type': MIME_TYPES[path.extname(filePath)] || 'application/octet-stream' });
+            res.end(content);
+        });
+    });
+    return new Promise(resolve => {
+        server.listen(0, '127.0.0.1', () => resolve(server));
+    });
+}
+
+// --- Scenarios ---------------------------------------------------------
+
+// Let pending paints and Event Timing entries land
+async function settle(page) {
+    await page.evaluate(() => new Promise(resolve =>
+        requestAnimationFrame(() => requestAnimationFrame(() => setTimeout(resolve, 100)))));
+}
+
+async function waitForIdle(page) {
+    await page.waitForNetworkIdle({ idleTime: IDLE_TIME, timeout: NAVIGATION_TIMEOUT });
+    await settle(page);
+}
+
+async function scrollToBottom(page) {
+    for (let step = 0; step < MAX_SCROLL_STEPS; step++) {
+        await page.mouse.wheel({ deltaY: VIEWPORT.height });
+        await settle(page);
+        const atBottom = await page.evaluate(() =>
+            window.innerHeight + window.scrollY >= document.documentElement.scrollHeight - 1);
+        if (atBottom) break;
+    }
+    await waitForIdle(page);
+}
+
+async function typeSearch(page, query) {
+    await page.click('#searchInput');
+    await page.type('#searchInput', query, { delay: KEY_DELAY });
+    await waitForIdle(page);
+}
+
+async function openCompare(page) {
+    await page.click('#compareToggle');
+    const checkboxes = await page.$$('.style-card .compare-checkbox');
+    if (checkboxes.length < 2) throw new Error('fewer than two styles to compare');
+    await checkboxes[0].click();
+    await checkboxes[1].click();
+    await page.click('#compareFab');
+    await waitForIdle(page);
+}
+
+function galleryScenarios() {
+    const fixture = JSON.parse(fs.readFileSync(QUERIES_PATH, 'utf-8'));
+    const keystrokes = fixture.sessions[0].keystrokes;
+    const query = keystrokes[keystrokes.length - 1];
+
+    return [
+        { page: 'index.html', scenario: 'cold-load', run: async () => {} },
+        { page: 'index.html', scenario: 'scroll-to-bottom', run: scrollToBottom },
+        { page: 'index.html', scenario: 'search', run: page => typeSearch(page, query) },
+        { page: 'index.html', scenario: 'compare', run: openCompare }
+    ];
+}
+
+// --- Measuring ---------------------------------------------------------
+
+/**
+ * One run in a fresh browser context, so every run starts from a cold
+ * cache. Transferred bytes come from the DevTools protocol and include
+ * everything the page's iframes load.
+ */
+async function measure(browser, baseUrl, job, injectScript) {
+    const context = await browser.createIncognitoBrowserContext();
+    try {
+        const page = await context.newPage();
+        await page.setViewport({ ...VIEWPORT, deviceScaleFactor: 1 });
+        await page.evaluateOnNewDocument(injectScript);
+
+        const client = await page.target().createCDPSession();
+        await client.send('Network.enable');
+        await client.send('Network.setCacheDisabled', { cacheDisabled: true });
+        let transferBytes = 0;
+        client.on('Network.loadingFinished', event => { transferBytes += event.encodedDataLength; });
+
+        await page.goto(`${baseUrl}/${job.page}`, { waitUntil: 'load', timeout: NAVIGATION_TIMEOUT });
+        await waitForIdle(page);
+        await job.run(page);
+
+        await client.send('HeapProfiler.collectGarbage');
+        const metrics = await page.evaluate(() => LobbiPerf.observeWebVitals().collect());
+        return { ...metrics, transferBytes };
+    } finally {
+        await context.close();
+    }
+}
+
+function median(values) {
+    const sorted = values.filter(value => typeof value === 'number').sort((a, b) => a - b);
+    if (sorted.length === 0) return null;
+    const middle = Math.floor(sorted.length / 2);
+    return sorted.length % 2 ? sorted[middle] : (sorted[middle - 1] + sorted[middle]) / 2;
+}
+
+// Per-metric median over repeated runs
+function medianMetrics(samples) {
+    const metrics = {};
+    Object.keys(samples[0]).forEach(key => {
+        metrics[key] = median(samples.map(sample => sample[key]));
+    });
+    return metrics;
+}
+
+async function runBrowser(jobs, options) {
+    const puppeteer = require('puppeteer');
+    const injectScript = `if (window.top === window) {\n${fs.readFileSync(PERF_CORE_PATH, 'utf-8')}\nLobbiPerf.observeWebVitals();\n}`;
+
+    const server = await startServer();
+    const baseUrl = `http://127.0.0.1:${server.address().port}`;
+    const browser = await puppeteer.launch({
+        headless: 'new',
+        args: ['--no-sandbox', '--disable-setuid-sandbox', '--enable-precise-memory-info']
+    });
+
+    const runs = [];
+    const errors = [];
+    const total = jobs.length;
+    const measureJob = async (job) => {
+        try {
+            const samples = [];
+            for (let i = 0; i < options.runs; i++) {
+                samples.push(await measure(browser, baseUrl, job, injectScript));
+            }
+            runs.push({ page: job.page, scenario: job.scenario, metrics: medianMetrics(samples) });
+        } catch (error) {
+            errors.push({ job, error });
+            console.error(`\n   ❌ ${LobbiPerf.runKey(job)}: ${error.message}`);
+        }
+        const done = runs.length + errors.length;
+        process.stdout.write(`\r   Progress: ${done}/${total} (${Math.round(done / total * 100)}%)`);
+    };
+
+    try {
+        // Gallery scenarios one at a time; style pages share the contexts
+        const gallery = jobs.filter(job => job.page === 'index.html');
+        const queue = jobs.filter(job => job.page !== 'index.html');
+        for (const job of gallery) await measureJob(job);
+
+        const concurrency = Math.max(1, Math.min(options.concurrency, queue.length));
+        await Promise.all(Array.from({ length: concurrency }, async () => {
+            let job;
+            while ((job = queue.shift())) await measureJob(job);
+        }));
+        console.log('');
+
+        const order = new Map(jobs.map((job, i) => [LobbiPerf.runKey(job), i]));
+        runs.sort((a, b) => order.get(LobbiPerf.runKey(a)) - order.get(LobbiPerf.runKey(b)));
+        return {
+            report: LobbiPerf.createReport('bench-pages', runs, {
+                userAgent: await browser.userAgent(),
+                viewport: VIEWPORT
+            }),
+            errors
+        };
+    } finally {
+        await browser.close();
+        server.close();
+    }
+}
+
+// --- Baseline ----------------------------------------------------------
+
+function loadBaseline() {
+    if (!fs.existsSync(BASELINE_PATH)) return null;
+    const baseline = JSON.parse(fs.readFileSync(BASELINE_PATH, 'utf-8'));
+    if (baseline.version !== LobbiPerf.REPORT_VERSION) {
+        throw new Error(`perf-baseline.json is version ${baseline.version}, expected ${LobbiPerf.REPORT_VERSION}`);
+    }
+    return baseline;
+}
+
+// Record a report as the baseline. Budgets already in the baseline are
+// kept (they may have been tuned by hand); runs without one get derived ones.
+function updateBaseline(baseline, report) {
+    const next = {
+        description: 'Per-page performance baseline and budgets for scripts/bench-pages.js. ' +
+            'Budgets survive --update-baseline; edit them by hand, or delete a run to derive them again.',
+        version: LobbiPerf.REPORT_VERSION,
+        generatedAt: report.generatedAt,
+        userAgent: report.userAgent,
+        viewport: report.viewport,
+        runs: baseline ? { ...baseline.runs } : {}
+    };
+    report.runs.forEach(run => {
+        const key = LobbiPerf.runKey(run);
+        const previous = next.runs[key];
+        next.runs[key] = {
+            metrics: run.metrics,
+            budgets: { ...LobbiPerf.deriveBudgets(run.metrics), ...(previous ? previous.budgets : {}) }
+        };
+    });
+    fs.writeFileSync(BASELINE_PATH, JSON.stringify(next, null, 2) + '\n');
+    return next;
+}
+
+// --- Report ------------------------------------------------------------
+
+function formatDelta(metric) {
+    const sign = metric.delta >= 0 ? '+' : '-';
+    return sign + LobbiPerf.formatValue(Math.abs(metric.delta), metric.unit);
+}
+
+function printDiff(rows) {
+    const overBudget = rows.filter(row => row.overBudget);
+    const changed = rows.filter(row => !row.overBudget && row.metrics.some(m => m.notable));
+    const fresh = rows.filter(row => row.isNew);
+
+    if (overBudget.length > 0) {
+        console.log(`\n❌ Over budget (${overBudget.length})`);
+        overBudget.forEach(row => {
+            console.log(`   ${row.key}`);
+            row.metrics.filter(m => m.overBudget).forEach(m => {
+                console.log(`      ${m.label.padEnd(20)} ${LobbiPerf.formatValue(m.value, m.unit).padStart(10)}` +
+                    `  budget ${LobbiPerf.formatValue(m.budget, m.unit)}` +
+                    (m.delta !== null ? `  (${formatDelta(m)} vs baseline)` : ''));
+            });
+        });
+    }
+
+    if (changed.length > 0) {
+        console.log(`\n📋 Changed since baseline (${changed.length})`);
+        changed.forEach(row => {
+            const moves = row.metrics.filter(m => m.notable)
+                .map(m => `${m.label} ${m.delta > 0 ? '▲' : '▼'} ${formatDelta(m)}`);
+            console.log(`   ${row.key.padEnd(48)} ${moves.join(', ')}`);
+        });
+    }
+
+    if (fresh.length > 0) {
+        console.log(`\n🆕 Not in the baseline (${fresh.length}): ${fresh.slice(0, 5).map(row => row.key).join(', ')}` +
+            (fresh.length > 5 ? ` and ${fresh.length - 5} more` : ''));
+    }
+
+    console.log(`\n📊 ${rows.length} runs: ${overBudget.length} over budget, ${changed.length} changed, ` +
+        `${fresh.length} new, ${rows.length - overBudget.length - changed.length - fresh.length} unchanged`);
+}
+
+// Slowest runs by LCP, for a quick read of a fresh report
+function printSummary(report) {
+    const slowest = [...report.runs]
+        .sort((a, b) => (b.metrics.lcp || 0) - (a.metrics.lcp || 0))
+        .slice(0, 10);
+    console.log('\n⏱️  Slowest runs by LCP');
+    console.log(`   ${'run'.padEnd(48)}${'LCP'.padStart(8)}${'CLS'.padStart(8)}${'INP'.padStart(8)}` +
+        `${'heap'.padStart(10)}${'nodes'.padStart(8)}${'bytes'.padStart(10)}`);
+    slowest.forEach(run => {
+        const m = run.metrics;
+        console.log(`   ${LobbiPerf.runKey(run).padEnd(48)}` +
+            `${LobbiPerf.formatValue(m.lcp, 'ms').padStart(8)}${LobbiPerf.formatValue(m.cls, '').padStart(8)}` +
+            `${LobbiPerf.formatValue(m.inp, 'ms').padStart(8)}${LobbiPerf.formatValue(m.heapBytes, 'B').padStart(10)}` +
+            `${String(m.domNodes).padStart(8)}${LobbiPerf.formatValue(m.transferBytes, 'B').padStart(10)}`);
+    });
+}
+
+// --- Main --------------------------------------------------------------
+
+function getOption(args, name, fallback) {
+    const index = args.indexOf(name);
+    return index !== -1 && args[index + 1] ? args[index + 1] : fallback;
+}
+
+async function main() {
+    const args = process.argv.slice(2);
+    const only = getOption(args, '--only', null);
+    const single = args.includes('--single') ? parseInt(getOption(args, '--single')) : null;
+    const from = getOption(args, '--from', null);
+
+    console.log('\n⏱️  Lobbi Design System - Page Benchmark\n');
+    console.log('━'.repeat(50));
+
+    try {
+        const options = {
+            runs: parseCount(getOption(args, '--runs', 1), '--runs'),
+            concurrency: parseCount(getOption(args, '--concurrency', DEFAULT_CONCURRENCY), '--concurrency')
+        };
+        if (only && only !== 'gallery' && only !== 'styles') {
+            throw new Error(`--only must be gallery or styles, got "${only}"`);
+        }
+
+        let report;
+        let errors = [];
+        if (from) {
+            report = JSON.parse(fs.readFileSync(path.resolve(from), 'utf-8'));
+            if (report.version !== LobbiPerf.REPORT_VERSION) {
+                throw new Error(`${from} is report version ${report.version}, expected ${LobbiPerf.REPORT_VERSION}`);
+            }
+            console.log(`📄 ${report.runs.length} runs from ${from} (${report.source}, ${report.generatedAt})`);
+        } else {
+            let styles = loadStyles();
+            if (single !== null) {
+                styles = styles.filter(style => style.num === single);
+                if (styles.length === 0) throw new Error(`no style ${single} in data/styles.json`);
+            }
+            const jobs = [
+                ...(only === 'styles' || single !== null ? [] : galleryScenarios()),
+                ...(only === 'gallery' ? [] : styles.map(style => ({ page: style.file, scenario: 'cold-load', run: async () => {} })))
+            ];
+
+            console.log(`📊 ${jobs.length} runs x ${options.runs}, ${Math.min(options.concurrency, jobs.length)} browser contexts\n`);
+            const startTime = Date.now();
+            ({ report, errors } = await runBrowser(jobs, options));
+            console.log(`   Done in ${((Date.now() - startTime) / 1000).toFixed(1)}s`);
+
+            fs.mkdirSync(OUTPUT_DIR, { recursive: true });
+            fs.writeFileSync(REPORT_PATH, JSON.stringify(report, null, 2));
+            console.log(`   Report: ${path.relative(ROOT_DIR, REPORT_PATH)}`);
+            printSummary(report);
+        }
+
+        let baseline = loadBaseline();
+        if (args.includes('--update-baseline')) {
+            if (errors.length > 0) throw new Error(`${errors.length} runs failed - baseline not updated`);
+            baseline = updateBaseline(baseline, report);
+            console.log(`\n✅ Baseline updated: ${path.relative(ROOT_DIR, BASELINE_PATH)} (${Object.keys(baseline.runs).length} runs)\n`);
+            return;
+        }
+        if (!baseline) {
+            console.log(`\n⚠️  No baseline at ${path.relative(ROOT_DIR, BASELINE_PATH)} - budgets are not enforced.`);
+            console.log('   Run with --update-baseline on a reference machine and commit the file to enable them.\n');
+            if (errors.length > 0) process.exit(1);
+            return;
+        }
+
+        const rows = LobbiPerf.compareReport(report, baseline);
+        if (!from) fs.writeFileSync(DIFF_PATH, JSON.stringify(rows, null, 2));
+        printDiff(rows);
+        console.log('');
+
+        if (errors.length > 0 || rows.some(row => row.overBudget)) process.exit(1);
+    } catch (error) {
+        console.error('❌ Error:', error.message);
+        process.exit(1);
+    }
+}
+
+main();
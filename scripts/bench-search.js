@@ -0,0 +1,140 @@
+#!/usr/bin/env node
+/**
+ * Search Benchmark
+ * Replays recorded search sessions (scripts/fixtures/search-queries.json)
+ * against the old linear-scan search path and the indexed search path, and
+ * reports per-keystroke timings for both.
+ *
+ * Run with: npm run bench-search [-- --iterations 50]
+ */
+
+const fs = require('fs');
+const path = require('path');
+const LobbiSearch = require('../js/search-core');
+const { loadStyles } = require('./lib/manifest');
+
+const ROOT_DIR = path.join(__dirname, '..');
+const FIXTURE_PATH = path.join(__dirname, 'fixtures', 'search-queries.json');
+const CATALOG_PATH = path.join(ROOT_DIR, 'data', 'catalog.json');
+
+function extractFilterTabs() {
+    const indexContent = fs.readFileSync(path.join(ROOT_DIR, 'index.html'), 'utf-8');
+    const filters = new Set();
+    const tabRegex = /class="filter-tab[^"]*" data-filter="([^"]+)"/g;
+    let match;
+    while ((match = tabRegex.exec(indexContent)) !== null) {
+        filters.add(match[1]);
+    }
+    return [...filters].filter(f => f !== 'collections');
+}
+
+// The pre-index gallery path: filterAndSort() + updateFilterCounts()
+function oldSearch(styles, searchTerm, favorites, filterTabs) {
+    let filtered = [...styles].filter(s =>
+        s.name.toLowerCase().includes(searchTerm) ||
+        s.blend.toLowerCase().includes(searchTerm) ||
+        s.tags.some(t => t.includes(searchTerm)) ||
+        (s.perfectFor || []).some(p => p.toLowerCase().includes(searchTerm))
+    );
+    filtered.sort((a, b) => a.num - b.num);
+
+    const searchFiltered = [...styles].filter(s =>
+        s.name.toLowerCase().includes(searchTerm) ||
+        s.blend.toLowerCase().includes(searchTerm) ||
+        s.tags.some(t => t.includes(searchTerm))
+    );
+    const counts = {};
+    filterTabs.forEach(filter => {
+        if (filter === 'all') {
+            counts[filter] = searchFiltered.length;
+        } else if (filter === 'favorites') {
+            counts[filter] = searchFiltered.filter(s => favorites.includes(s.num)).length;
+        } else {
+            counts[filter] = searchFiltered.filter(s => s.tags.includes(filter)).length;
+        }
+    });
+
+    return { results: filtered.map(s => s.num), counts };
+}
+
+// The indexed path: LobbiSearch.search() + one countFacets() pass
+function newSearch(index, styleByNum, searchTerm, favorites) {
+    const ranked = LobbiSearch.search(index, searchTerm) || index.docs;
+    const matched = ranked.map(num => styleByNum.get(num));
+    return { results: ranked, counts: LobbiSearch.countFacets(matched, favorites) };
+}
+
+function timeQueries(queries, iterations, run) {
+    const perQuery = new Array(queries.length).fill(0);
+    for (let i = 0; i < iterations; i++) {
+        queries.forEach((query, q) => {
+            const start = process.hrtime.bigint();
+            run(query);
+            perQuery[q] += Number(process.hrtime.bigint() - start) / 1e6;
+        });
+    }
+    return perQuery.map(total => total / iterations);
+}
+
+function percentile(values, p) {
+    const sorted = [...values].sort((a, b) => a - b);
+    return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))];
+}
+
+function summarize(label, timings) {
+    const total = timings.reduce((sum, t) => sum + t, 0);
+    console.log(`   ${label.padEnd(8)} mean ${(total / timings.length).toFixed(3)}ms` +
+        `  p95 ${percentile(timings, 0.95).toFixed(3)}ms` +
+        `  max ${Math.max(...timings).toFixed(3)}ms` +
+        `  total ${total.toFixed(1)}ms`);
+    return total;
+}
+
+function main() {
+    const args = process.argv.slice(2);
+    const iterIndex = args.indexOf('--iterations');
+    const iterations = iterIndex !== -1 ? parseInt(args[iterIndex + 1]) : 20;
+
+    console.log('\n⏱️  Lobbi Design System - Search Benchmark\n');
+    console.log('━'.repeat(50));
+
+    const catalog = fs.existsSync(CATALOG_PATH) ? JSON.parse(fs.readFileSync(CATALOG_PATH, 'utf-8')) : {};
+    const indexPath = catalog.searchIndex && path.join(ROOT_DIR, 'data', catalog.searchIndex.file);
+    if (!indexPath || !fs.existsSync(indexPath)) {
+        console.error('❌ search index not found - run npm run build-data first');
+        process.exit(1);
+    }
+
+    const styles = loadStyles();
+    const styleByNum = new Map(styles.map(s => [s.num, s]));
+    const filterTabs = extractFilterTabs();
+    const index = LobbiSearch.addTrigrams(JSON.parse(fs.readFileSync(indexPath, 'utf-8')));
+    const fixture = JSON.parse(fs.readFileSync(FIXTURE_PATH, 'utf-8'));
+    const favorites = fixture.favorites || [];
+    const queries = fixture.sessions.flatMap(session => session.keystrokes);
+
+    console.log(`📊 ${styles.length} styles, ${fixture.sessions.length} sessions, ${queries.length} keystrokes, ${iterations} iterations\n`);
+
+    const oldTimings = timeQueries(queries, iterations,
+        q => oldSearch(styles, q.toLowerCase(), favorites, filterTabs));
+    const newTimings = timeQueries(queries, iterations,
+        q => newSearch(index, styleByNum, q, favorites));
+
+    const oldTotal = summarize('old', oldTimings);
+    const newTotal = summarize('indexed', newTimings);
+    console.log(`\n   Speedup: ${(oldTotal / newTotal).toFixed(2)}x`);
+
+    // Where the two paths disagree on the final query of each session
+    console.log('\n📋 Final query per session (old → indexed results)');
+    fixture.sessions.forEach(session => {
+        const query = session.keystrokes[session.keystrokes.length - 1];
+        const before = oldSearch(styles, query.toLowerCase(), favorites, filterTabs);
+        const after = newSearch(index, styleByNum, query, favorites);
+        const countsAgree = before.counts.all === before.results.length;
+        console.log(`   ${JSON.stringify(query).padEnd(16)} ${String(before.results.length).padStart(3)} → ${String(after.results.length).padStart(3)}` +
+            (countsAgree ? '' : `   (old "All" tab showed ${before.counts.all})`));
+    });
+    console.log('');
+}
+
+main();
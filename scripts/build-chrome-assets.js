@@ -0,0 +1,129 @@
+#!/usr/bin/env node
+/**
+ * Build Shared Chrome Assets
+ *
+ * The patch transforms inject the same gallery chrome CSS and JS inline
+ * into every style page, so nothing is cached between pages. This build
+ * stage moves that shared chrome into content-hashed files under assets/
+ * and rewrites each page to reference them (see scripts/lib/chrome-assets.js
+ * for what moves where).
+ *
+ * Each style's own CSS stays inline and untouched. Per-page markup (nav
+ * links, similar-style cards) and the gallery nav script, which embeds
+ * per-page links, stay inline too.
+ *
+ * npm run patch-pages already writes pages in this form; run this on pages
+ * patched by hand, or with --dry-run for the size report.
+ *
+ * Run with: npm run build-chrome-assets [-- --dry-run] [-- --report <file>]
+ */
+
+const fs = require('fs');
+const path = require('path');
+const { ASSETS_URL, BUNDLE_PATTERN, extractChrome, referencedBundles } = require('./lib/chrome-assets');
+
+const ROOT_DIR = path.join(__dirname, '..');
+const ASSETS_DIR = path.join(ROOT_DIR, 'assets');
+
+function getStyleFiles() {
+    return fs.readdirSync(ROOT_DIR)
+        .filter(f => /^style-\d+-.*\.html$/.test(f))
+        .sort((a, b) => parseInt(a.match(/style-(\d+)/)[1]) - parseInt(b.match(/style-(\d+)/)[1]));
+}
+
+function formatKB(bytes) {
+    return (bytes / 1024).toFixed(1) + ' KB';
+}
+
+function main() {
+    const args = process.argv.slice(2);
+    const dryRun = args.includes('--dry-run');
+    const reportIndex = args.indexOf('--report');
+    const reportPath = reportIndex !== -1 ? args[reportIndex + 1] : null;
+
+    console.log('\n📦 Lobbi Design System - Build Shared Chrome Assets\n');
+    console.log('━'.repeat(50));
+
+    const files = getStyleFiles();
+    const assets = new Map();
+    const pages = [];
+
+    // Bundles already referenced by previously built pages count towards the
+    // "before" deploy size as well as the "after"
+    const existingAssetBytes = (name) => {
+        const assetPath = path.join(ASSETS_DIR, name);
+        return fs.existsSync(assetPath) ? fs.statSync(assetPath).size : 0;
+    };
+    const assetsBefore = new Set();
+
+    for (const file of files) {
+        const filePath = path.join(ROOT_DIR, file);
+        const original = fs.readFileSync(filePath, 'utf8');
+        referencedBundles(original).forEach(name => assetsBefore.add(name));
+
+        const { content, bundles } = extractChrome(original);
+        bundles.forEach(bundle => assets.set(bundle.file, bundle.content));
+        referencedBundles(content).forEach(name => {
+            if (!assets.has(name) && fs.existsSync(path.join(ASSETS_DIR, name))) {
+                assets.set(name, fs.readFileSync(path.join(ASSETS_DIR, name), 'utf8'));
+            }
+        });
+
+        pages.push({
+            file,
+            before: Buffer.byteLength(original),
+            after: Buffer.byteLength(content),
+            changed: content !== original,
+            content
+        });
+    }
+
+    if (!dryRun) {
+        fs.mkdirSync(ASSETS_DIR, { recursive: true });
+        assets.forEach((content, name) => {
+            const assetPath = path.join(ASSETS_DIR, name);
+            if (!fs.existsSync(assetPath)) fs.writeFileSync(assetPath, content, 'utf8');
+        });
+        pages.filter(page => page.changed).forEach(page => {
+            fs.writeFileSync(path.join(ROOT_DIR, page.file), page.content, 'utf8');
+        });
+        // Drop bundles no page references any more
+        fs.readdirSync(ASSETS_DIR)
+            .filter(name => BUNDLE_PATTERN.test(name) && !assets.has(name))
+            .forEach(name => fs.unlinkSync(path.join(ASSETS_DIR, name)));
+    }
+
+    // Size report
+    const pagesBefore = pages.reduce((sum, p) => sum + p.before, 0);
+    const pagesAfter = pages.reduce((sum, p) => sum + p.after, 0);
+    const sharedBefore = [...assetsBefore].reduce((sum, name) => sum + existingAssetBytes(name), 0);
+    const sharedAfter = [...assets.values()].reduce((sum, c) => sum + Buffer.byteLength(c), 0);
+    const totalBefore = pagesBefore + sharedBefore;
+    const totalAfter = pagesAfter + sharedAfter;
+
+    console.log(`\n📄 ${pages.length} pages, ${pages.filter(p => p.changed).length} rewritten${dryRun ? ' (dry run)' : ''}`);
+    console.log(`📦 ${assets.size} shared bundles (${formatKB(sharedAfter)})`);
+    [...assets.keys()].sort().forEach(name => {
+        const users = pages.filter(p => p.content.includes(`${ASSETS_URL}/${name}`)).length;
+        console.log(`   ${name.padEnd(36)} ${formatKB(Buffer.byteLength(assets.get(name))).padStart(9)}  ${users} pages`);
+    });
+
+    console.log('\n📊 Size report');
+    console.log(`   Per page (avg):     ${formatKB(pagesBefore / pages.length)} → ${formatKB(pagesAfter / pages.length)}`);
+    console.log(`   Style pages total:  ${formatKB(pagesBefore)} → ${formatKB(pagesAfter)}`);
+    console.log(`   Shared bundles:     ${formatKB(sharedBefore)} → ${formatKB(sharedAfter)}`);
+    console.log(`   Deploy total:       ${formatKB(totalBefore)} → ${formatKB(totalAfter)} ` +
+        `(${totalBefore ? ((1 - totalAfter / totalBefore) * 100).toFixed(1) : '0.0'}% smaller)`);
+
+    if (reportPath) {
+        fs.writeFileSync(reportPath, JSON.stringify({
+            pages: pages.map(({ file, before, after }) => ({ file, before, after })),
+            bundles: [...assets.keys()].sort().map(name => ({ file: name, bytes: Buffer.byteLength(assets.get(name)) })),
+            totals: { pagesBefore, pagesAfter, sharedBefore, sharedAfter, totalBefore, totalAfter }
+        }, null, 2));
+        console.log(`\n   Report written to ${reportPath}`);
+    }
+    console.log('');
+}
+
+main();
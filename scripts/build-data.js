@@ -0,0 +1,362 @@
+#!/usr/bin/env node
+/**
+ * Build Data Files
+ * Derives every generated file under data/ from the style manifest
+ * (data/styles.json):
+ *
+ *   catalog.json + catalog/*.json  gallery catalogue, in lazily fetched shards,
+ *                                  and the search worker index
+ *   neighbors.json                 k-nearest-neighbour table (recommender)
+ *   similar-styles.json            top 4 neighbours per style
+ *   style-fits.json                "Perfect for" recommendations
+ *   style-colors.json              color palettes
+ *
+ * Builds are incremental. Each artifact declares the style fields it reads,
+ * and data/.build-cache.json keeps a fingerprint of those fields per style.
+ * Editing a style's blend rebuilds its catalogue shard and the search index
+ * but leaves similarity, fits and colors alone; editing nothing rebuilds
+ * nothing. Files are only written when their content changes.
+ *
+ * Run with: npm run build-data [-- --force] [-- --dry-run]
+ */
+
+const fs = require('fs');
+const path = require('path');
+const crypto = require('crypto');
+const { ROOT_DIR, loadStyles } = require('./lib/manifest');
+const LobbiSearch = require('../js/search-core');
+const LobbiCatalog = require('../js/catalog-core');
+const LobbiSimilarity = require('../js/similarity-core');
+
+const DATA_DIR = path.join(ROOT_DIR, 'data');
+const CATALOG_DIR = path.join(DATA_DIR, 'catalog');
+const CACHE_PATH = path.join(DATA_DIR, '.build-cache.json');
+const CACHE_VERSION = 1;
+
+// Bump when the fits / color generators change
+const FITS_VERSION = 1;
+const COLORS_VERSION = 1;
+
+// Neighbours kept per style for the recommender; the style pages show the top few
+const NEIGHBOR_COUNT = 12;
+const SIMILAR_STYLES_COUNT = 4;
+
+// Generate "Perfect for" recommendations based on tags
+function generatePerfectFor(style) {
+    const fits = [];
+    const tags = style.tags;
+
+    const tagToFits = {
+        'premium': ['Luxury membership organizations', 'Executive boards', 'VIP services'],
+        'professional': ['Corporate associations', 'Professional societies', 'B2B platforms'],
+        'creative': ['Design agencies', 'Art galleries', 'Creative studios'],
+        'technology': ['Tech startups', 'SaaS platforms', 'Digital products'],
+        'heritage': ['Heritage societies', 'Historical organizations', 'Cultural institutions'],
+        'hospitality': ['Hotels & resorts', 'Restaurants', 'Wellness centers'],
+        'academic': ['Universities', 'Research institutions', 'Think tanks'],
+        'media': ['Publishers', 'Broadcasting', 'Entertainment'],
+        'association': ['Trade associations', 'Chambers of commerce', 'Professional networks'],
+        'finance': ['Investment firms', 'Banking', 'Wealth management'],
+        'health': ['Healthcare networks', 'Medical associations', 'Wellness brands'],
+        'legal': ['Law firms', 'Bar associations', 'Legal services'],
+        'real-estate': ['Real estate agencies', 'Property developers', 'HOAs'],
+        'sports': ['Sports leagues', 'Athletic clubs', 'Fitness centers'],
+        'nonprofit': ['Foundations', 'Charities', 'NGOs'],
+        'government': ['Government agencies', 'Civic organizations', 'Public services'],
+        'religious': ['Religious organizations', 'Faith communities', 'Spiritual centers'],
+        'education': ['Schools', 'Training centers', 'Educational platforms'],
+        'energy': ['Energy companies', 'Sustainability orgs', 'Clean tech'],
+        'aerospace': ['Aviation companies', 'Space industry', 'Defense contractors'],
+        'automotive': ['Auto manufacturers', 'Motorsports', 'Dealerships'],
+        'food': ['Culinary guilds', 'Food industry', 'Restaurant groups'],
+        'fashion': ['Fashion houses', 'Boutiques', 'Style councils'],
+        'art': ['Art institutions', 'Museums', 'Cultural foundations'],
+        'music': ['Music labels', 'Orchestras', 'Conservatories'],
+        'gaming': ['Esports', 'Gaming platforms', 'Entertainment tech'],
+        'web3': ['DAOs', 'Crypto projects', 'Blockchain platforms']
+    };
+
+    // Get fits from primary tags
+    for (const tag of tags) {
+        if (tagToFits[tag]) {
+            fits.push(...tagToFits[tag]);
+        }
+    }
+
+    // Add based on temperature/formality
+    if (style.temp >= 7) {
+        fits.push('Warm, inviting brands');
+    }
+    if (style.formality >= 8) {
+        fits.push('Formal institutional identity');
+    }
+    if (style.formality <= 4) {
+        fits.push('Casual, approachable brands');
+    }
+
+    // Dedupe and limit
+    return [...new Set(fits)].slice(0, 5);
+}
+
+// Generate color palette for styles without one in the manifest
+function generateColorForStyle(styleNum) {
+    // Use golden angle distribution for unique hues
+    const hue1 = (styleNum * 137.5) % 360;
+    const hue2 = (hue1 + 120) % 360;
+    const hue3 = (hue1 + 240) % 360;
+
+    // Convert HSL to hex
+    function hslToHex(h, s, l) {
+        l /= 100;
+        const a = s * Math.min(l, 1 - l) / 100;
+        const f = n => {
+            const k = (n + h / 30) % 12;
+            const color = l - a * Math.max(Math.min(k - 3, 9 - k, 1), -1);
+            return Math.round(255 * color).toString(16).padStart(2, '0');
+        };
+        return `#${f(0)}${f(8)}${f(4)}`;
+    }
+
+    // Generate 4 colors: primary, accent, background, text
+    const primary = hslToHex(hue1, 60, 40);
+    const accent = hslToHex(hue2, 70, 50);
+    const background = hslToHex(hue3, 10, 95);
+    const text = hslToHex(hue1, 30, 20);
+
+    return [primary, accent, background, text];
+}
+
+function contentHash(text) {
+    return crypto.createHash('sha256').update(text).digest('hex').slice(0, 10);
+}
+
+function readJSON(filePath, fallback) {
+    return fs.existsSync(filePath) ? JSON.parse(fs.readFileSync(filePath, 'utf-8')) : fallback;
+}
+
+// The catalogue fingerprint covers the search index, which it lists
+const CATALOG_BUILD_VERSION = `${LobbiCatalog.CATALOG_VERSION}.${LobbiSearch.INDEX_VERSION}`;
+
+// Artifacts derived from the manifest.
+//   fields  - style fields the artifact reads; only changes to these rebuild it
+//   scope   - 'catalog': any change rebuilds the whole file
+//             'style':   keyed by style number, only changed entries are recomputed
+//             'shard':   the catalogue shards, only shards holding a change are rewritten
+const ARTIFACTS = [
+    {
+        name: 'catalog',
+        version: CATALOG_BUILD_VERSION,
+        fields: LobbiCatalog.FIELDS,
+        scope: 'shard',
+        outputs: ['catalog.json']
+    },
+    {
+        name: 'neighbors.json',
+        version: LobbiSimilarity.SIMILARITY_VERSION,
+        fields: ['colors', 'blend', 'tags', 'temp', 'formality'],
+        scope: 'catalog',
+        outputs: ['neighbors.json', 'similar-styles.json'],
+        build: styles => {
+            const table = LobbiSimilarity.buildNeighborTable(styles.map(style => ({
+                ...style,
+                colors: style.colors.length > 0 ? style.colors : generateColorForStyle(style.num)
+            })), NEIGHBOR_COUNT);
+            const similarStyles = {};
+            table.nums.forEach((num, i) => {
+                similarStyles[num] = table.neighbors[i].filter((_, j) => j % 2 === 0).slice(0, SIMILAR_STYLES_COUNT);
+            });
+            return new Map([
+                ['neighbors.json', JSON.stringify(table)],
+                ['similar-styles.json', JSON.stringify(similarStyles, null, 2)]
+            ]);
+        }
+    },
+    {
+        name: 'style-fits.json',
+        version: FITS_VERSION,
+        fields: ['tags', 'temp', 'formality', 'perfectFor'],
+        scope: 'style',
+        outputs: ['style-fits.json'],
+        entry: style => style.perfectFor.length > 0 ? style.perfectFor : generatePerfectFor(style)
+    },
+    {
+        name: 'style-colors.json',
+        version: COLORS_VERSION,
+        fields: ['colors'],
+        scope: 'style',
+        outputs: ['style-colors.json'],
+        entry: style => style.colors.length > 0 ? style.colors : generateColorForStyle(style.num)
+    }
+];
+
+function fingerprint(artifact, style) {
+    const picked = artifact.fields.map(field => style[field]);
+    return contentHash(`v${artifact.version}:${JSON.stringify(picked)}`);
+}
+
+// Style numbers whose inputs to this artifact changed since the last build,
+// including styles that were added or removed
+function changedStyles(styles, previous, fingerprints) {
+    const changed = new Set();
+    styles.forEach(style => {
+        if (previous[style.num] !== fingerprints[style.num]) changed.add(style.num);
+    });
+    Object.keys(previous).forEach(num => {
+        if (!(num in fingerprints)) changed.add(parseInt(num));
+    });
+    return changed;
+}
+
+function buildCatalog(styles, changed, force) {
+    const catalogPath = path.join(DATA_DIR, 'catalog.json');
+    const previous = readJSON(catalogPath, { shards: [] });
+    const previousByKey = new Map(previous.shards.map(shard => [LobbiCatalog.shardKey(shard.first), shard]));
+
+    const groups = new Map();
+    styles.forEach(style => {
+        const key = LobbiCatalog.shardKey(style.num);
+        if (!groups.has(key)) groups.set(key, []);
+        groups.get(key).push(style);
+    });
+
+    const files = new Map();
+    const shards = [...groups.keys()].sort((a, b) => a - b).map(key => {
+        const members = groups.get(key);
+        const existing = previousByKey.get(key);
+        const dirty = force || !existing ||
+            !fs.existsSync(path.join(DATA_DIR, existing.file)) ||
+            [...changed].some(num => LobbiCatalog.shardKey(num) === key);
+        if (!dirty) return existing;
+
+        const json = JSON.stringify(LobbiCatalog.encodeShard(members));
+        const first = members[0].num;
+        const last = members[members.length - 1].num;
+        const file = `catalog/styles-${first}-${last}.${contentHash(json)}.json`;
+        files.set(file, json);
+        return { file, first, last, count: members.length };
+    });
+
+    // The search index covers every style, so any change rebuilds it. It is
+    // content-hashed like the shards; only catalog.json is revalidated.
+    let searchIndex = previous.searchIndex;
+    if (force || changed.size > 0 || !searchIndex || !fs.existsSync(path.join(DATA_DIR, searchIndex.file))) {
+        const json = JSON.stringify(LobbiSearch.buildIndex(styles));
+        searchIndex = { file: `catalog/search-index.${contentHash(json)}.json`, version: LobbiSearch.INDEX_VERSION };
+        files.set(searchIndex.file, json);
+    }
+
+    files.set('catalog.json', JSON.stringify({
+        version: LobbiCatalog.CATALOG_VERSION,
+        fields: LobbiCatalog.FIELDS,
+        count: styles.length,
+        shards,
+        searchIndex
+    }, null, 2));
+    return { files, keep: new Set([...shards.map(shard => shard.file), searchIndex.file]) };
+}
+
+function buildKeyed(artifact, styles, changed, force) {
+    const outputPath = path.join(DATA_DIR, artifact.outputs[0]);
+    const existing = force ? {} : readJSON(outputPath, {});
+    const entries = {};
+    styles.forEach(style => {
+        entries[style.num] = (changed.has(style.num) || !(style.num in existing))
+            ? artifact.entry(style)
+            : existing[style.num];
+    });
+    return JSON.stringify(entries, null, 2);
+}
+
+// Write only when the content differs; returns true if the file changed
+function writeIfChanged(relativePath, content, dryRun) {
+    const filePath = path.join(DATA_DIR, relativePath);
+    if (fs.existsSync(filePath) && fs.readFileSync(filePath, 'utf-8') === content) return false;
+    if (!dryRun) {
+        fs.mkdirSync(path.dirname(filePath), { recursive: true });
+        fs.writeFileSync(filePath, content);
+    }
+    return true;
+}
+
+function main() {
+    const args = process.argv.slice(2);
+    const force = args.includes('--force');
+    const dryRun = args.includes('--dry-run');
+
+    console.log('\n🎨 Lobbi Design System - Build Data Files\n');
+    console.log('━'.repeat(50));
+
+    try {
+        const styles = loadStyles();
+        console.log(`📊 Loaded ${styles.length} styles from data/styles.json${dryRun ? ' (dry run)' : ''}\n`);
+
+        const cache = readJSON(CACHE_PATH, {});
+        const previousArtifacts = cache.version === CACHE_VERSION ? cache.artifacts : {};
+        const nextArtifacts = {};
+        let written = 0;
+
+        for (const artifact of ARTIFACTS) {
+            const startTime = process.hrtime.bigint();
+            const previous = previousArtifacts[artifact.name] || {};
+            const fingerprints = {};
+            styles.forEach(style => {
+                fingerprints[style.num] = fingerprint(artifact, style);
+            });
+            nextArtifacts[artifact.name] = fingerprints;
+
+            const changed = changedStyles(styles, previous, fingerprints);
+            const missing = artifact.outputs.some(output => !fs.existsSync(path.join(DATA_DIR, output)));
+            if (!force && !missing && changed.size === 0) {
+                console.log(`   ⏭️  ${artifact.name.padEnd(20)} up to date`);
+                continue;
+            }
+
+            let files;
+            let keep = null;
+            if (artifact.scope === 'shard') {
+                ({ files, keep } = buildCatalog(styles, changed, force || missing));
+            } else if (artifact.scope === 'style') {
+                files = new Map([[artifact.outputs[0], buildKeyed(artifact, styles, changed, force || missing)]]);
+            } else {
+                files = artifact.build(styles);
+            }
+
+            const updated = [...files].filter(([file, content]) => writeIfChanged(file, content, dryRun));
+            written += updated.length;
+
+            // Drop shards the catalogue no longer references
+            if (keep && fs.existsSync(CATALOG_DIR)) {
+                fs.readdirSync(CATALOG_DIR)
+                    .filter(name => !keep.has(`catalog/${name}`))
+                    .forEach(name => {
+                        if (!dryRun) fs.unlinkSync(path.join(CATALOG_DIR, name));
+                        console.log(`      🗑️  removed catalog/${name}`);
+                    });
+            }
+
+            const buildMs = Number(process.hrtime.bigint() - startTime) / 1e6;
+            const reason = force ? 'forced' : missing ? 'missing output' : `${changed.size} style(s) changed`;
+            console.log(`   ✅ ${artifact.name.padEnd(20)} ${reason}, ${updated.length} file(s) written (${buildMs.toFixed(1)}ms)`);
+            updated.forEach(([file, content]) => {
+                console.log(`      📄 data/${file} (${(Buffer.byteLength(content) / 1024).toFixed(1)} KB)`);
+            });
+        }
+
+        if (!dryRun) {
+            fs.writeFileSync(CACHE_PATH, JSON.stringify({ version: CACHE_VERSION, artifacts: nextArtifacts }));
+        }
+
+        console.log('\n' + '━'.repeat(50));
+        console.log(`\n✨ ${written} file(s) ${dryRun ? 'would be ' : ''}written\n`);
+
+    } catch (error) {
+        console.error('❌ Error:', error.message);
+        process.exit(1);
+    }
+}
+
+if (require.main === module) {
+    main();
+}
+
+module.exports = { generatePerfectFor, generateColorForStyle };
@@ -0,0 +1,136 @@
+#!/usr/bin/env node
+/**
+ * Bulk Token Export
+ * Streams every style's design tokens, in CSS, SCSS, Tailwind and JSON, into
+ * one .tar.gz archive:
+ *
+ *   lobbi-tokens/css/style-1-tokens.css
+ *   lobbi-tokens/scss/style-1-tokens.scss
+ *   lobbi-tokens/tailwind/style-1-tokens.js
+ *   lobbi-tokens/json/style-1-tokens.json
+ *   ...
+ *   lobbi-tokens/index.json
+ *
+ * Token shards are read one at a time and written straight through gzip to
+ * disk, so memory use stays flat however many styles there are. Run
+ * npm run extract-tokens first.
+ *
+ * Run with: npm run export-tokens [-- --out <file>] [-- --formats css,json]
+ */
+
+const fs = require('fs');
+const path = require('path');
+const zlib = require('zlib');
+const { Readable } = require('stream');
+const { pipeline } = require('stream/promises');
+const { loadStyles } = require('./lib/manifest');
+const LobbiTokens = require('../js/tokens-core');
+
+const ROOT_DIR = path.join(__dirname, '..');
+const DEFAULT_OUT = path.join(ROOT_DIR, 'dist', 'lobbi-tokens.tar.gz');
+const ARCHIVE_ROOT = 'lobbi-tokens';
+const BLOCK_SIZE = 512;
+
+// ustar header for a regular file
+function tarHeader(name, size, mtime) {
+    const header = Buffer.alloc(BLOCK_SIZE);
+    const octal = (value, length) => value.toString(8).padStart(length - 1, '0') + '\0';
+
+    header.write(name, 0, 100, 'utf8');
+    header.write(octal(0o644, 8), 100);
+    header.write(octal(0, 8), 108);
+    header.write(octal(0, 8), 116);
+    header.write(octal(size, 12), 124);
+    header.write(octal(mtime, 12), 136);
+    header.write(' '.repeat(8), 148);
+    header.write('0', 156);
+    header.write('ustar\0', 257);
+    header.write('00', 263);
+
+    let checksum = 0;
+    for (const byte of header) checksum += byte;
+    header.write(octal(checksum, 7) + ' ', 148);
+    return header;
+}
+
+function* tarEntry(name, content, mtime) {
+    const data = Buffer.from(content, 'utf8');
+    if (Buffer.byteLength(name) > 100) throw new Error(`archive path too long: ${name}`);
+    yield tarHeader(name, data.length, mtime);
+    yield data;
+    const padding = (BLOCK_SIZE - (data.length % BLOCK_SIZE)) % BLOCK_SIZE;
+    if (padding) yield Buffer.alloc(padding);
+}
+
+async function* archiveEntries(styles, formats, stats) {
+    const mtime = Math.floor(Date.now() / 1000);
+    const index = [];
+
+    for (const style of styles) {
+        const shardPath = path.join(ROOT_DIR, LobbiTokens.shardPath(style.num));
+        if (!fs.existsSync(shardPath)) {
+            stats.missing.push(style.num);
+            continue;
+        }
+        const tokens = JSON.parse(await fs.promises.readFile(shardPath, 'utf-8'));
+        const files = [];
+        for (const format of formats) {
+            const { content, filename } = LobbiTokens.formatTokens(tokens, format);
+            const name = `${ARCHIVE_ROOT}/${format}/${filename}`;
+            files.push(`${format}/${filename}`);
+            stats.files++;
+            stats.bytes += Buffer.byteLength(content);
+            yield* tarEntry(name, content, mtime);
+        }
+        index.push({ num: style.num, name: style.name, files });
+    }
+
+    yield* tarEntry(`${ARCHIVE_ROOT}/index.json`, JSON.stringify({ formats, styles: index }, null, 2), mtime);
+    // End-of-archive marker
+    yield Buffer.alloc(BLOCK_SIZE * 2);
+}
+
+async function main() {
+    const args = process.argv.slice(2);
+    const outIndex = args.indexOf('--out');
+    const outPath = path.resolve(outIndex !== -1 ? args[outIndex + 1] : DEFAULT_OUT);
+    const formatsIndex = args.indexOf('--formats');
+    const formats = formatsIndex !== -1
+        ? args[formatsIndex + 1].split(',').map(f => f.trim())
+        : Object.keys(LobbiTokens.FORMATS);
+
+    console.log('\n📦 Lobbi Design System - Bulk Token Export\n');
+    console.log('━'.repeat(50));
+
+    try {
+        const unknown = formats.filter(format => !LobbiTokens.FORMATS[format]);
+        if (unknown.length) {
+            throw new Error(`unknown format(s) ${unknown.join(', ')} - expected ${Object.keys(LobbiTokens.FORMATS).join(', ')}`);
+        }
+
+        const styles = loadStyles();
+        const stats = { files: 0, bytes: 0, missing: [] };
+        fs.mkdirSync(path.dirname(outPath), { recursive: true });
+
+        const startTime = process.hrtime.bigint();
+        await pipeline(
+            Readable.from(archiveEntries(styles, formats, stats)),
+            zlib.createGzip({ level: 9 }),
+            fs.createWriteStream(outPath)
+        );
+        const totalMs = Number(process.hrtime.bigint() - startTime) / 1e6;
+
+        if (stats.missing.length) {
+            console.log(`   ⚠️  No token shard for ${stats.missing.length} styles (run npm run extract-tokens): ${stats.missing.join(', ')}`);
+        }
+        console.log(`   ✅ ${stats.files} files (${formats.join(', ')}) for ${styles.length - stats.missing.length} styles`);
+        console.log(`   📄 ${path.relative(ROOT_DIR, outPath)} - ${(stats.bytes / 1024).toFixed(1)} KB of tokens, ` +
+            `${(fs.statSync(outPath).size / 1024).toFixed(1)} KB compressed`);
+        console.log(`   ⏱️  ${totalMs.toFixed(0)}ms, peak RSS ${(process.memoryUsage().rss / 1024 / 1024).toFixed(0)} MB\n`);
+    } catch (error) {
+        console.error('❌ Error:', error.message);
+        process.exit(1);
+    }
+}
+
+main();
@@ -0,0 +1,161 @@
+#!/usr/bin/env node
+/**
+ * Extract Design Tokens
+ * Parses every style page's stylesheet (scripts/lib/css-tokens.js) into a
+ * token shard, data/tokens/style-<num>.json, which the gallery's token
+ * inspector fetches when it opens a style.
+ *
+ * Pages are parsed in parallel on worker threads. data/tokens/index.json
+ * records a hash of what the extractor reads from each page (inline styles
+ * and font links), so only pages whose stylesheet changed since the last
+ * run are parsed again.
+ *
+ * Run with: npm run extract-tokens [-- --force] [-- --concurrency N] [-- --single N]
+ */
+
+const fs = require('fs');
+const path = require('path');
+const crypto = require('crypto');
+const { isMainThread, parentPort } = require('worker_threads');
+const { extractStyleBlocks, extractWebFonts, extractTokens } = require('./lib/css-tokens');
+const LobbiTokens = require('../js/tokens-core');
+
+const ROOT_DIR = path.join(__dirname, '..');
+const TOKENS_DIR = path.join(ROOT_DIR, 'data', 'tokens');
+const INDEX_PATH = path.join(TOKENS_DIR, 'index.json');
+
+// --- Worker ------------------------------------------------------------
+
+if (!isMainThread) {
+    parentPort.on('message', ({ num, name, file }) => {
+        const startTime = process.hrtime.bigint();
+        try {
+            const html = fs.readFileSync(path.join(ROOT_DIR, file), 'utf-8');
+            const tokens = extractTokens(html);
+            parentPort.postMessage({
+                num,
+                shard: { version: LobbiTokens.TOKENS_VERSION, num, name, ...tokens },
+                ms: Number(process.hrtime.bigint() - startTime) / 1e6
+            });
+        } catch (error) {
+            parentPort.postMessage({ num, error: error.message });
+        }
+    });
+    return;
+}
+
+// --- Main --------------------------------------------------------------
+
+const { loadStyles } = require('./lib/manifest');
+const { defaultConcurrency, parseCount, runPool } = require('./lib/worker-pool');
+
+// Hash only extractTokens' input, so chrome bundle links and gallery
+// markup can change without invalidating the shards
+function hashPage(style) {
+    const html = fs.readFileSync(path.join(ROOT_DIR, style.file), 'utf-8');
+    return crypto.createHash('sha1')
+        .update(`v${LobbiTokens.TOKENS_VERSION}:${style.name}:`)
+        .update(extractWebFonts(html).join(',') + '\n')
+        .update(extractStyleBlocks(html))
+        .digest('hex');
+}
+
+function shardFile(num) {
+    return path.join(ROOT_DIR, LobbiTokens.shardPath(num));
+}
+
+async function main() {
+    const args = process.argv.slice(2);
+    const force = args.includes('--force');
+    const concurrencyIndex = args.indexOf('--concurrency');
+    const singleIndex = args.indexOf('--single');
+    const single = singleIndex !== -1 ? parseInt(args[singleIndex + 1]) : null;
+
+    console.log('\n🎨 Lobbi Design System - Extract Design Tokens\n');
+    console.log('━'.repeat(50));
+
+    try {
+        const concurrency = concurrencyIndex !== -1
+            ? parseCount(args[concurrencyIndex + 1], '--concurrency')
+            : defaultConcurrency();
+        fs.mkdirSync(TOKENS_DIR, { recursive: true });
+        let styles = loadStyles();
+        const index = fs.existsSync(INDEX_PATH) ? JSON.parse(fs.readFileSync(INDEX_PATH, 'utf-8')) : {};
+        const hashes = index.version === LobbiTokens.TOKENS_VERSION ? index.styles : {};
+        const nextHashes = {};
+
+        // Drop shards for styles no longer in the manifest
+        if (single === null) {
+            const nums = new Set(styles.map(style => String(style.num)));
+            Object.keys(hashes).filter(num => !nums.has(num)).forEach(num => {
+                if (fs.existsSync(shardFile(num))) fs.unlinkSync(shardFile(num));
+                console.log(`   🗑️  removed ${LobbiTokens.shardPath(num)}`);
+            });
+        }
+
+        Object.keys(hashes).forEach(num => {
+            if (single !== null && parseInt(num) !== single) nextHashes[num] = hashes[num];
+        });
+        if (single !== null) styles = styles.filter(style => style.num === single);
+
+        const queue = [];
+        styles.forEach(style => {
+            const hash = hashPage(style);
+            nextHashes[style.num] = hash;
+            if (force || hashes[style.num] !== hash || !fs.existsSync(shardFile(style.num))) {
+                queue.push({ num: style.num, name: style.name, file: style.file });
+            }
+        });
+
+        console.log(`📊 ${styles.length} styles, ${queue.length} to parse, ${styles.length - queue.length} cached`);
+        if (queue.length > 0) console.log(`   Using ${Math.min(concurrency, queue.length)} worker threads\n`);
+
+        const startTime = process.hrtime.bigint();
+        const timings = [];
+        let written = 0;
+        const errors = [];
+
+        await runPool(__filename, [...queue], concurrency, (result) => {
+            if (result.error) {
+                errors.push(result);
+                delete nextHashes[result.num];
+                return;
+            }
+            timings.push({ num: result.num, ms: result.ms });
+            const json = JSON.stringify(result.shard);
+            const filePath = shardFile(result.num);
+            if (!fs.existsSync(filePath) || fs.readFileSync(filePath, 'utf-8') !== json) {
+                fs.writeFileSync(filePath, json);
+                written++;
+            }
+        });
+        const totalMs = Number(process.hrtime.bigint() - startTime) / 1e6;
+
+        fs.writeFileSync(INDEX_PATH, JSON.stringify({ version: LobbiTokens.TOKENS_VERSION, styles: nextHashes }, null, 2));
+
+        errors.forEach(({ num, error }) => console.log(`   ❌ Style ${num}: ${error}`));
+        if (timings.length > 0) {
+            const parseMs = timings.reduce((sum, t) => sum + t.ms, 0);
+            console.log(`   ✅ Parsed ${timings.length} pages in ${totalMs.toFixed(0)}ms ` +
+                `(${(parseMs / timings.length).toFixed(1)}ms per page on a worker), ${written} shards written`);
+            console.log('   Slowest pages:');
+            timings.sort((a, b) => b.ms - a.ms).slice(0, 5).forEach(t => {
+                console.log(`      Style ${String(t.num).padEnd(4)} ${t.ms.toFixed(1)}ms`);
+            });
+        }
+
+        const shardBytes = styles.reduce((sum, style) => {
+            const filePath = shardFile(style.num);
+            return sum + (fs.existsSync(filePath) ? fs.statSync(filePath).size : 0);
+        }, 0);
+        console.log(`\n📄 data/tokens/ - ${styles.length} shards, ${(shardBytes / 1024).toFixed(1)} KB ` +
+            `(avg ${(shardBytes / Math.max(1, styles.length) / 1024).toFixed(1)} KB)\n`);
+
+        if (errors.length > 0) process.exit(1);
+    } catch (error) {
+        console.error('❌ Error:', error.message);
+        process.exit(1);
+    }
+}
+
+main();
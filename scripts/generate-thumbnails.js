@@ -1,148 +1,290 @@
 /**
  * Thumbnail Generation Script for Lobbi Design System
  *
- * This script uses Puppeteer to generate WebP thumbnails for all 210 style pages.
+ * Uses Puppeteer to capture every style page once and sharp to emit
+ * responsive thumbnails from that capture. Pages whose content hash matches
+ * the cache manifest are skipped, so only changed styles re-render.
+ *
  * Run with: npm run generate-thumbnails
  *
+ * Options:
+ *   --force              Re-render every style, ignoring the cache
+ *   --concurrency N      Number of browser contexts (default: 4)
+ *   --sprite             Also build a sprite sheet of the 1x thumbnails
+ *   --single N           Render one style only
+ *   --placeholder-only   Only generate the placeholder image
+ *
  * Prerequisites:
  * - Node.js 18+
  * - npm install puppeteer sharp
  *
- * Output: thumbnails/style-{num}.webp (400x250px)
+ * Output (thumbnails/):
+ *   style-{num}.webp / style-{num}@2x.webp   (400x250 / 800x500)
+ *   style-{num}.avif / style-{num}@2x.avif
+ *   manifest.json    content hashes of rendered pages
+ *   timings.json     per-page timings of the last run
+ *   sprite.webp + sprite.json (with --sprite)
  */
 
 const puppeteer = require('puppeteer');
 const sharp = require('sharp');
+const crypto = require('crypto');
 const path = require('path');
 const fs = require('fs');
+const { loadStyles } = require('./lib/manifest');
+const { parseCount } = require('./lib/worker-pool');
 
-const TOTAL_STYLES = 210;
-const OUTPUT_DIR = path.join(__dirname, '..', 'thumbnails');
+const ROOT_DIR = path.join(__dirname, '..');
+const OUTPUT_DIR = path.join(ROOT_DIR, 'thumbnails');
+const MANIFEST_PATH = path.join(OUTPUT_DIR, 'manifest.json');
+const TIMINGS_PATH = path.join(OUTPUT_DIR, 'timings.json');
 const VIEWPORT_WIDTH = 1400;
 const VIEWPORT_HEIGHT = 900;
 const THUMBNAIL_WIDTH = 400;
 const THUMBNAIL_HEIGHT = 250;
-const CONCURRENT_PAGES = 5;
+const DEFAULT_CONCURRENCY = 4;
+const SETTLE_TIMEOUT = 5000;
+const SPRITE_COLUMNS = 16;
+
+// Every output rendered from a single capture. Bump PIPELINE_VERSION when
+// these change so cached pages re-render.
+const PIPELINE_VERSION = 2;
+const OUTPUTS = [
+    { suffix: '', scale: 1, format: 'webp', options: { quality: 85, effort: 4 } },
+    { suffix: '@2x', scale: 2, format: 'webp', options: { quality: 80, effort: 4 } },
+    { suffix: '', scale: 1, format: 'avif', options: { quality: 55, effort: 4 } },
+    { suffix: '@2x', scale: 2, format: 'avif', options: { quality: 50, effort: 4 } }
+];
 
 // Ensure output directory exists
 if (!fs.existsSync(OUTPUT_DIR)) {
     fs.mkdirSync(OUTPUT_DIR, { recursive: true });
 }
 
-async function generateThumbnail(browser, styleNum) {
-    const page = await browser.newPage();
-
-    try {
-        await page.setViewport({
-            width: VIEWPORT_WIDTH,
-            height: VIEWPORT_HEIGHT,
-            deviceScaleFactor: 1
-        });
-
-        // Find the style file
-        const styleName = getStyleFileName(styleNum);
-        const styleFile = path.join(__dirname, '..', styleName);
+// Style pages come from the manifest
+function discoverStyles() {
+    return loadStyles().map(({ num, file }) => ({ num, file }));
+}
 
-        if (!fs.existsSync(styleFile)) {
-            console.log(`  [SKIP] Style ${styleNum}: File not found`);
-            return false;
-        }
+function hashPage(file) {
+    return crypto.createHash('sha1')
+        .update(`v${PIPELINE_VERSION}:`)
+        .update(fs.readFileSync(path.join(ROOT_DIR, file)))
+        .digest('hex');
+}
 
-        const fileUrl = `file://${styleFile}`;
+function outputName(num, output) {
+    return `style-${num}${output.suffix}.${output.format}`;
+}
 
-        await page.goto(fileUrl, {
-            waitUntil: 'networkidle2',
-            timeout: 30000
-        });
+function loadManifest() {
+    if (!fs.existsSync(MANIFEST_PATH)) return { version: PIPELINE_VERSION, styles: {} };
+    const manifest = JSON.parse(fs.readFileSync(MANIFEST_PATH, 'utf-8'));
+    if (manifest.version !== PIPELINE_VERSION) return { version: PIPELINE_VERSION, styles: {} };
+    return manifest;
+}
 
-        // Wait for any animations/transitions
-        await page.waitForTimeout(500);
-
-        // Take screenshot as PNG buffer
-        const screenshotBuffer = await page.screenshot({
-            type: 'png',
-            clip: {
-                x: 0,
-                y: 0,
-                width: VIEWPORT_WIDTH,
-                height: VIEWPORT_HEIGHT
-            }
-        });
+function isCached(manifest, style) {
+    const entry = manifest.styles[style.num];
+    return entry
+        && entry.hash === style.hash
+        && OUTPUTS.every(output => fs.existsSync(path.join(OUTPUT_DIR, outputName(style.num, output))));
+}
 
-        // Resize and convert to WebP using sharp
-        const outputPath = path.join(OUTPUT_DIR, `style-${styleNum}.webp`);
+// Wait for fonts and a couple of frames instead of a fixed delay
+async function settlePage(page) {
+    await page.evaluate((timeout) => Promise.race([
+        document.fonts.ready.then(() => new Promise(resolve =>
+            requestAnimationFrame(() => requestAnimationFrame(resolve)))),
+        new Promise(resolve => setTimeout(resolve, timeout))
+    ]), SETTLE_TIMEOUT);
+}
 
-        await sharp(screenshotBuffer)
-            .resize(THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT, {
+async function renderOutputs(screenshotBuffer, num) {
+    const base = sharp(screenshotBuffer);
+    await Promise.all(OUTPUTS.map(output =>
+        base.clone()
+            .resize(THUMBNAIL_WIDTH * output.scale, THUMBNAIL_HEIGHT * output.scale, {
                 fit: 'cover',
                 position: 'top'
             })
-            .webp({
-                quality: 85,
-                effort: 4
-            })
-            .toFile(outputPath);
+            .toFormat(output.format, output.options)
+            .toFile(path.join(OUTPUT_DIR, outputName(num, output)))
+    ));
+}
 
-        console.log(`  [OK] Style ${styleNum}`);
-        return true;
+async function generateThumbnail(page, style) {
+    const timings = {};
+    let mark = Date.now();
+    const lap = (name) => {
+        const now = Date.now();
+        timings[name] = now - mark;
+        mark = now;
+    };
 
-    } catch (error) {
-        console.error(`  [ERROR] Style ${styleNum}:`, error.message);
-        return false;
-    } finally {
-        await page.close();
-    }
+    await page.goto(`file://${path.join(ROOT_DIR, style.file)}`, {
+        waitUntil: 'networkidle2',
+        timeout: 30000
+    });
+    lap('navigate');
+
+    await settlePage(page);
+    lap('settle');
+
+    // One full-viewport capture serves every output size
+    const screenshotBuffer = await page.screenshot({
+        type: 'png',
+        clip: { x: 0, y: 0, width: VIEWPORT_WIDTH, height: VIEWPORT_HEIGHT }
+    });
+    lap('capture');
+
+    await renderOutputs(screenshotBuffer, style.num);
+    lap('encode');
+
+    timings.total = timings.navigate + timings.settle + timings.capture + timings.encode;
+    return timings;
 }
 
-function getStyleFileName(num) {
-    // Style files follow pattern: style-{num}-{name}.html
-    // We need to find the actual filename
-    const files = fs.readdirSync(path.join(__dirname, '..'));
-    const pattern = new RegExp(`^style-${num}-.*\\.html$`);
-    const match = files.find(f => pattern.test(f));
-    return match || `style-${num}.html`;
+// Each worker owns a browser context and one reusable page, and pulls the
+// next style off the shared queue as soon as it is free
+async function runWorker(browser, queue, onDone) {
+    const context = await browser.createIncognitoBrowserContext();
+    const page = await context.newPage();
+    await page.setViewport({
+        width: VIEWPORT_WIDTH,
+        height: VIEWPORT_HEIGHT,
+        deviceScaleFactor: 1
+    });
+
+    try {
+        let style;
+        while ((style = queue.shift())) {
+            try {
+                const timings = await generateThumbnail(page, style);
+                onDone(style, timings, null);
+            } catch (error) {
+                onDone(style, null, error);
+            }
+        }
+    } finally {
+        await context.close();
+    }
 }
 
-async function generateAllThumbnails() {
+async function generateThumbnails(styles, options) {
     console.log('Lobbi Design System - Thumbnail Generator');
     console.log('=========================================\n');
-    console.log(`Generating thumbnails for ${TOTAL_STYLES} styles...`);
-    console.log(`Output: ${OUTPUT_DIR}`);
-    console.log(`Size: ${THUMBNAIL_WIDTH}x${THUMBNAIL_HEIGHT}px WebP\n`);
 
-    const browser = await puppeteer.launch({
-        headless: 'new',
-        args: ['--no-sandbox', '--disable-setuid-sandbox']
-    });
+    const manifest = loadManifest();
+    styles.forEach(style => { style.hash = hashPage(style.file); });
 
-    let successful = 0;
-    let failed = 0;
+    const queue = options.force ? [...styles] : styles.filter(style => !isCached(manifest, style));
+    const skipped = styles.length - queue.length;
+    const total = queue.length;
 
-    // Process in batches for better performance
-    for (let i = 1; i <= TOTAL_STYLES; i += CONCURRENT_PAGES) {
-        const batch = [];
-        for (let j = i; j < i + CONCURRENT_PAGES && j <= TOTAL_STYLES; j++) {
-            batch.push(generateThumbnail(browser, j));
-        }
+    console.log(`Found ${styles.length} styles, ${skipped} unchanged, ${total} to render`);
+    console.log(`Output: ${OUTPUT_DIR}`);
+    console.log(`Sizes: ${OUTPUTS.map(o => `${THUMBNAIL_WIDTH * o.scale}x${THUMBNAIL_HEIGHT * o.scale} ${o.format}`).join(', ')}\n`);
 
-        const results = await Promise.all(batch);
-        results.forEach(success => {
-            if (success) successful++;
-            else failed++;
+    const results = [];
+    let failed = 0;
+
+    if (total > 0) {
+        const browser = await puppeteer.launch({
+            headless: 'new',
+            args: ['--no-sandbox', '--disable-setuid-sandbox']
         });
 
-        // Progress indicator
-        const progress = Math.min(i + CONCURRENT_PAGES - 1, TOTAL_STYLES);
-        process.stdout.write(`\rProgress: ${progress}/${TOTAL_STYLES} (${Math.round(progress/TOTAL_STYLES*100)}%)`);
+        const onDone = (style, timings, error) => {
+            if (error) {
+                failed++;
+                console.error(`\n  [ERROR] Style ${style.num}:`, error.message);
+            } else {
+                manifest.styles[style.num] = { file: style.file, hash: style.hash };
+                results.push({ num: style.num, file: style.file, ...timings });
+            }
+            const done = results.length + failed;
+            process.stdout.write(`\rProgress: ${done}/${total} (${Math.round(done / total * 100)}%)`);
+        };
+
+        const concurrency = Math.max(1, Math.min(options.concurrency, total));
+        const startTime = Date.now();
+        try {
+            await Promise.all(Array.from({ length: concurrency }, () => runWorker(browser, queue, onDone)));
+        } finally {
+            await browser.close();
+        }
+
+        console.log(`\n\nRendered in ${((Date.now() - startTime) / 1000).toFixed(1)}s with ${concurrency} contexts`);
+        fs.writeFileSync(MANIFEST_PATH, JSON.stringify(manifest, null, 2));
+        fs.writeFileSync(TIMINGS_PATH, JSON.stringify(results.sort((a, b) => a.num - b.num), null, 2));
+        reportTimings(results);
     }
 
-    await browser.close();
+    if (options.sprite) {
+        await generateSprite(discoverStyles());
+    }
 
-    console.log('\n\n=========================================');
-    console.log(`Completed: ${successful} successful, ${failed} failed`);
+    console.log('\n=========================================');
+    console.log(`Completed: ${results.length} rendered, ${skipped} cached, ${failed} failed`);
     console.log('=========================================\n');
 }
 
+function reportTimings(results) {
+    if (results.length === 0) return;
+
+    const slowest = [...results].sort((a, b) => b.total - a.total).slice(0, 10);
+    console.log('\nSlowest pages (ms):');
+    console.log('  style   navigate  settle  capture  encode   total');
+    slowest.forEach(r => {
+        console.log(`  ${String(r.num).padStart(5)}  ${String(r.navigate).padStart(9)}` +
+            `${String(r.settle).padStart(8)}${String(r.capture).padStart(9)}` +
+            `${String(r.encode).padStart(8)}${String(r.total).padStart(8)}`);
+    });
+
+    const mean = results.reduce((sum, r) => sum + r.total, 0) / results.length;
+    console.log(`\nMean per page: ${Math.round(mean)}ms (full list in thumbnails/timings.json)`);
+}
+
+// Combine the 1x WebP thumbnails into one sprite sheet for the gallery
+async function generateSprite(styles) {
+    const available = styles.filter(style =>
+        fs.existsSync(path.join(OUTPUT_DIR, outputName(style.num, OUTPUTS[0]))));
+    if (available.length === 0) return;
+
+    const columns = Math.min(SPRITE_COLUMNS, available.length);
+    const rows = Math.ceil(available.length / columns);
+    const positions = {};
+
+    const composites = available.map((style, i) => {
+        const left = (i % columns) * THUMBNAIL_WIDTH;
+        const top = Math.floor(i / columns) * THUMBNAIL_HEIGHT;
+        positions[style.num] = { x: left, y: top };
+        return { input: path.join(OUTPUT_DIR, outputName(style.num, OUTPUTS[0])), left, top };
+    });
+
+    await sharp({
+        create: {
+            width: columns * THUMBNAIL_WIDTH,
+            height: rows * THUMBNAIL_HEIGHT,
+            channels: 3,
+            background: '#1a1a24'
+        }
+    })
+        .composite(composites)
+        .webp({ quality: 75, effort: 4 })
+        .toFile(path.join(OUTPUT_DIR, 'sprite.webp'));
+
+    fs.writeFileSync(path.join(OUTPUT_DIR, 'sprite.json'), JSON.stringify({
+        width: THUMBNAIL_WIDTH,
+        height: THUMBNAIL_HEIGHT,
+        columns,
+        positions
+    }));
+
+    console.log(`\nSprite sheet generated: sprite.webp (${available.length} thumbnails)`);
+}
+
 // Generate placeholder thumbnail
 async function generatePlaceholder() {
     const placeholderPath = path.join(OUTPUT_DIR, 'placeholder.webp');
@@ -172,19 +314,43 @@ async function generatePlaceholder() {
     console.log('Placeholder thumbnail generated: placeholder.webp');
 }
 
+function getOption(args, name, fallback) {
+    const index = args.indexOf(name);
+    return index !== -1 && args[index + 1] ? args[index + 1] : fallback;
+}
+
 // Main execution
 (async () => {
     const args = process.argv.slice(2);
 
-    if (args.includes('--placeholder-only')) {
-        await generatePlaceholder();
-    } else if (args.includes('--single') && args[1]) {
-        const styleNum = parseInt(args[1]);
-        const browser = await puppeteer.launch({ headless: 'new' });
-        await generateThumbnail(browser, styleNum);
-        await browser.close();
-    } else {
-        await generatePlaceholder();
-        await generateAllThumbnails();
+    try {
+        const options = {
+            force: args.includes('--force'),
+            sprite: args.includes('--sprite'),
+            concurrency: parseCount(getOption(args, '--concurrency', DEFAULT_CONCURRENCY), '--concurrency')
+        };
+
+        if (args.includes('--placeholder-only')) {
+            await generatePlaceholder();
+            return;
+        }
+
+        let styles = discoverStyles();
+        if (args.includes('--single')) {
+            const styleNum = parseInt(getOption(args, '--single'));
+            styles = styles.filter(style => style.num === styleNum);
+            if (styles.length === 0) {
+                console.error(`Style ${styleNum} not found`);
+                process.exit(1);
+            }
+            options.force = true;
+        } else {
+            await generatePlaceholder();
+        }
+
+        await generateThumbnails(styles, options);
+    } catch (error) {
+        console.error('❌ Error:', error.message);
+        process.exit(1);
     }
 })();
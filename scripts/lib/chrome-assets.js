@@ -0,0 +1,160 @@
+/**
+ * Shared Gallery Chrome
+ * The patch transforms (scripts/lib/page-transforms/) inject the same
+ * gallery chrome CSS and JS inline into every style page. For deploy that
+ * chrome lives in content-hashed files under assets/ instead:
+ *
+ *   - CSS: everything from the first injected section marker to the end of
+ *     a <style> block (the transforms only ever append) moves out, one
+ *     file per section: assets/chrome-<section>.<hash>.css, linked right
+ *     after that <style> block in the same order so the cascade is
+ *     unchanged. Pages whose chrome differs in one section still share
+ *     the files for the others.
+ *   - JS: the export panel, recently-viewed and similar-styles scripts move
+ *     to assets/<name>.<hash>.js, loaded synchronously in the same place.
+ *
+ * extractChrome() turns an inline page into its deployed form and
+ * inlineChrome() reverses it, so the page pipeline can patch the inline
+ * form and extract again without changing pages nobody touched.
+ */
+
+const crypto = require('crypto');
+
+const ASSETS_URL = 'assets';
+
+// Section headers written by the patch transforms, in the order they
+// cascade. The title is recorded in the page so "already injected" checks
+// keep matching after extraction. A marker occurrence that starts with
+// `not` belongs to another section (UI polish has its own subsection for
+// similar styles).
+const CHROME_CSS_SECTIONS = [
+    { marker: '/* Gallery Navigation - Injected */', title: 'Gallery Navigation - Injected', slug: 'nav' },
+    { marker: '/* Skip Link for Accessibility */', title: 'Skip Link for Accessibility', slug: 'skip-link' },
+    { marker: '/* Export Panel */', title: 'Export Panel', slug: 'export-panel' },
+    { marker: '/* Back to Gallery Navigation */', title: 'Back to Gallery Navigation', slug: 'back-link' },
+    { marker: '/* Similar Styles Section', title: 'Similar Styles Section', slug: 'similar-styles', not: '/* Similar Styles Section Polish' },
+    { marker: 'MOBILE-FIRST RESPONSIVE STYLES', title: 'MOBILE-FIRST RESPONSIVE STYLES', slug: 'mobile', commentStart: true },
+    { marker: '/* === UI POLISH ADDITIONS === */', title: 'UI POLISH ADDITIONS', slug: 'ui-polish' }
+];
+
+// Inline scripts shared verbatim across pages
+const CHROME_SCRIPTS = [
+    { name: 'export-panel', test: body => body.includes('function getTokens()') && body.includes('function copyCSS()') },
+    { name: 'recent-views', test: body => body.includes("'lobbi-recent-styles'") && body.includes('location.pathname') },
+    { name: 'similar-styles', test: body => body.includes("'lobbi-similar-styles-collapsed'") }
+];
+
+// Bundles this module owns - anything else in assets/ is left alone. Plain
+// chrome.<hash>.css is the older single-file form, kept so it gets cleaned up.
+const CSS_BUNDLE = `chrome(?:-(?:${CHROME_CSS_SECTIONS.map(s => s.slug).join('|')}))?\\.[0-9a-f]{10}\\.css`;
+const BUNDLE_PATTERN = new RegExp(`^(?:${CSS_BUNDLE}|(?:${CHROME_SCRIPTS.map(s => s.name).join('|')})\\.[0-9a-f]{10}\\.js)$`);
+
+function contentHash(text) {
+    return crypto.createHash('sha256').update(text).digest('hex').slice(0, 10);
+}
+
+// Where a chrome section starts in content[from, to), or -1
+function findSection(content, section, from, to) {
+    let index = content.indexOf(section.marker, from);
+    while (index !== -1 && section.not && content.startsWith(section.not, index)) {
+        index = content.indexOf(section.marker, index + 1);
+    }
+    if (index === -1 || index >= to) return -1;
+    return section.commentStart ? content.lastIndexOf('/*', index) : index;
+}
+
+// Injected chrome sections inside a <style> block, as [{ section, index }]
+// in page order; empty if the block has none
+function findChromeSections(content, blockStart, blockEnd) {
+    return CHROME_CSS_SECTIONS
+        .map(section => ({ section, index: findSection(content, section, blockStart, blockEnd) }))
+        .filter(({ index }) => index !== -1)
+        .sort((a, b) => a.index - b.index);
+}
+
+/**
+ * Rewrite one page. Returns the new content plus the bundles it references.
+ */
+function extractChrome(content) {
+    const bundles = [];
+    let output = '';
+    let cursor = 0;
+
+    // CSS: the chrome tail of every <style> block
+    const styleRegex = /<style[^>]*>([\s\S]*?)<\/style>/g;
+    let match;
+    while ((match = styleRegex.exec(content)) !== null) {
+        const blockStart = match.index;
+        const blockEnd = match.index + match[0].length - '</style>'.length;
+        const sections = findChromeSections(content, blockStart, blockEnd);
+        if (sections.length === 0) continue;
+
+        // Each section runs up to the next one, the last to the end of the block
+        const files = sections.map(({ section, index }, i) => {
+            const end = i + 1 < sections.length ? sections[i + 1].index : blockEnd;
+            const css = content.slice(index, end).trim() + '\n';
+            const file = `chrome-${section.slug}.${contentHash(css)}.css`;
+            bundles.push({ file, content: css });
+            return file;
+        });
+
+        const closingIndent = content.slice(blockStart, blockEnd).match(/[ \t]*$/)[0];
+        output += content.slice(cursor, sections[0].index).replace(/\s*$/, '\n') +
+            closingIndent + '</style>\n' +
+            `    <!-- Shared gallery chrome: ${sections.map(({ section }) => section.title).join(' | ')} -->` +
+            files.map(file => `\n    <link rel="stylesheet" href="${ASSETS_URL}/${file}">`).join('');
+        cursor = blockEnd + '</style>'.length;
+    }
+    content = output + content.slice(cursor);
+
+    // JS: shared inline scripts become external, in place
+    content = content.replace(/<script>([\s\S]*?)<\/script>/g, (block, body) => {
+        const script = CHROME_SCRIPTS.find(s => s.test(body));
+        if (!script) return block;
+
+        const js = body.trim() + '\n';
+        const file = `${script.name}.${contentHash(js)}.js`;
+        bundles.push({ file, content: js });
+        return `<script src="${ASSETS_URL}/${file}"></script>`;
+    });
+
+    return { content, bundles };
+}
+
+/**
+ * Put a built page's chrome bundles back inline - the inverse of
+ * extractChrome(). readBundle(name) returns a bundle's content.
+ */
+function inlineChrome(content, readBundle) {
+    const linkRegex = new RegExp(`\\n([ \\t]*)</style>\\n    <!-- Shared gallery chrome: [^>]*-->` +
+        `((?:\\n    <link rel="stylesheet" href="${ASSETS_URL}/${CSS_BUNDLE}">)+)`, 'g');
+    const fileRegex = new RegExp(CSS_BUNDLE, 'g');
+    const scriptRegex = new RegExp(`<script src="${ASSETS_URL}/((?:${CHROME_SCRIPTS.map(s => s.name).join('|')})\\.[0-9a-f]{10}\\.js)"></script>`, 'g');
+
+    return content
+        .replace(linkRegex, (match, indent, links) =>
+            `\n${links.match(fileRegex).map(readBundle).join('')}${indent}</style>`)
+        .replace(scriptRegex, (match, file) => `<script>\n${readBundle(file)}</script>`);
+}
+
+function referencedBundles(content) {
+    const refs = [];
+    const refRegex = new RegExp(`${ASSETS_URL}/([\\w.-]+\\.(?:css|js))`, 'g');
+    let match;
+    while ((match = refRegex.exec(content)) !== null) {
+        if (BUNDLE_PATTERN.test(match[1])) refs.push(match[1]);
+    }
+    return refs;
+}
+
+module.exports = {
+    ASSETS_URL,
+    CHROME_CSS_SECTIONS,
+    CHROME_SCRIPTS,
+    BUNDLE_PATTERN,
+    contentHash,
+    findSection,
+    extractChrome,
+    inlineChrome,
+    referencedBundles
+};
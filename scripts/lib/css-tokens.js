@@ -0,0 +1,270 @@
+/**
+ * CSS Token Extraction
+ * Parses a style page's own stylesheet into design tokens: custom
+ * properties, colors, font stacks, type scale, radii, shadows and spacing.
+ *
+ * Only inline <style> blocks are read. Shared gallery chrome lives in
+ * assets/ (see build-chrome-assets.js), so it never leaks into a style's
+ * tokens.
+ */
+
+const BASE_FONT_SIZE = 16;
+const MAX_SHADOWS = 8;
+const MAX_FALLBACK_COLORS = 8;
+
+const COLOR_PATTERN = /#[0-9a-f]{8}\b|#[0-9a-f]{6}\b|#[0-9a-f]{3,4}\b|(?:rgba?|hsla?)\([^)]*\)/gi;
+const HEADING_SELECTOR = /(^|[\s,>+~])h[1-6]\b|title|heading|hero|display|logo|brand/i;
+const BODY_SELECTOR = /(^|[\s,])(body|html|:root)\b/i;
+const SPACING_PROPERTIES = new Set([
+    'padding', 'padding-top', 'padding-right', 'padding-bottom', 'padding-left', 'padding-inline', 'padding-block',
+    'margin', 'margin-top', 'margin-right', 'margin-bottom', 'margin-left', 'margin-inline', 'margin-block',
+    'gap', 'row-gap', 'column-gap'
+]);
+
+function extractStyleBlocks(html) {
+    const blocks = [];
+    const styleRegex = /<style[^>]*>([\s\S]*?)<\/style>/gi;
+    let match;
+    while ((match = styleRegex.exec(html)) !== null) {
+        blocks.push(match[1]);
+    }
+    return blocks.join('\n');
+}
+
+// Families requested from Google Fonts, in link order
+function extractWebFonts(html) {
+    const families = [];
+    const linkRegex = /fonts\.googleapis\.com\/css2?\?([^"']+)/g;
+    let match;
+    while ((match = linkRegex.exec(html)) !== null) {
+        match[1].replace(/&amp;/g, '&').split('&')
+            .filter(param => param.startsWith('family='))
+            .forEach(param => {
+                const family = decodeURIComponent(param.slice(7).split(':')[0].replace(/\+/g, ' '));
+                if (!families.includes(family)) families.push(family);
+            });
+    }
+    return families;
+}
+
+/**
+ * Flatten a stylesheet into rules: { selector, atRules, declarations: [[prop, value]] }.
+ * Handles nested at-rules, quoted strings and parentheses (data: URLs).
+ */
+function parseRules(css) {
+    css = css.replace(/\/\*[\s\S]*?\*\//g, '');
+    const rules = [];
+    const stack = [];
+    let buffer = '';
+    let quote = null;
+    let parens = 0;
+
+    function addDeclaration() {
+        const text = buffer.trim();
+        buffer = '';
+        const frame = stack[stack.length - 1];
+        if (!frame || !text) return;
+        const colon = text.indexOf(':');
+        if (colon <= 0) return;
+        const prop = text.slice(0, colon).trim().toLowerCase();
+        const value = text.slice(colon + 1).replace(/!important\s*$/i, '').replace(/\s+/g, ' ').trim();
+        frame.declarations.push([prop, value]);
+    }
+
+    for (let i = 0; i < css.length; i++) {
+        const ch = css[i];
+        if (quote) {
+            if (ch === quote && css[i - 1] !== '\\') quote = null;
+            buffer += ch;
+        } else if (ch === '"' || ch === "'") {
+            quote = ch;
+            buffer += ch;
+        } else if (ch === '(') {
+            parens++;
+            buffer += ch;
+        } else if (ch === ')') {
+            parens = Math.max(0, parens - 1);
+            buffer += ch;
+        } else if (ch === ';' && parens === 0) {
+            addDeclaration();
+        } else if (ch === '{' && parens === 0) {
+            stack.push({ prelude: buffer.trim(), declarations: [] });
+            buffer = '';
+        } else if (ch === '}' && parens === 0) {
+            addDeclaration();
+            const frame = stack.pop();
+            if (frame && frame.declarations.length > 0) {
+                rules.push({
+                    selector: frame.prelude,
+                    atRules: stack.filter(f => f.prelude.startsWith('@')).map(f => f.prelude),
+                    declarations: frame.declarations
+                });
+            }
+        } else {
+            buffer += ch;
+        }
+    }
+    return rules;
+}
+
+// Custom properties set on :root outside media queries, in source order
+function rootCustomProperties(rules) {
+    const props = new Map();
+    rules
+        .filter(rule => rule.atRules.length === 0 && /:root\b/.test(rule.selector))
+        .forEach(rule => rule.declarations.forEach(([prop, value]) => {
+            if (prop.startsWith('--')) props.set(prop, value);
+        }));
+    return props;
+}
+
+function resolveVars(value, props, depth = 0) {
+    if (depth > 8 || !value.includes('var(')) return value;
+    return resolveVars(value.replace(/var\(\s*(--[\w-]+)\s*(?:,\s*([^()]*(?:\([^()]*\)[^()]*)*))?\)/g,
+        (match, name, fallback) => props.has(name) ? props.get(name) : (fallback !== undefined ? fallback.trim() : match)),
+    props, depth + 1);
+}
+
+// Pixel size of a plain length, or null for anything relative/computed
+function toPixels(value) {
+    const match = String(value).trim().match(/^(-?\d*\.?\d+)(px|rem|em)?$/);
+    if (!match) return null;
+    const number = parseFloat(match[1]);
+    if (!match[2]) return number === 0 ? 0 : null;
+    return match[2] === 'px' ? number : number * BASE_FONT_SIZE;
+}
+
+function isColor(value) {
+    COLOR_PATTERN.lastIndex = 0;
+    const match = value.trim().match(COLOR_PATTERN);
+    return Boolean(match) && match[0].length === value.trim().length;
+}
+
+function isTranslucent(color) {
+    const alpha = color.match(/^(?:rgba|hsla)\([^)]*[,/]\s*([\d.]+%?)\s*\)$/);
+    if (!alpha) return false;
+    return alpha[1].endsWith('%') ? parseFloat(alpha[1]) < 100 : parseFloat(alpha[1]) < 1;
+}
+
+// Split a shorthand value on whitespace outside parentheses
+function splitValues(value) {
+    const parts = [];
+    let depth = 0;
+    let current = '';
+    for (const ch of value) {
+        if (ch === '(') depth++;
+        if (ch === ')') depth--;
+        if (/\s/.test(ch) && depth === 0) {
+            if (current) parts.push(current);
+            current = '';
+        } else {
+            current += ch;
+        }
+    }
+    if (current) parts.push(current);
+    return parts;
+}
+
+function countValues(values) {
+    const counts = new Map();
+    values.forEach(value => counts.set(value, (counts.get(value) || 0) + 1));
+    return counts;
+}
+
+// Unique values, smallest first; values without a pixel size go last
+function sortBySize(values) {
+    const unique = [...new Set(values)];
+    return unique
+        .map(value => ({ value, px: toPixels(value) }))
+        .sort((a, b) => {
+            if (a.px === null && b.px === null) return 0;
+            if (a.px === null) return 1;
+            if (b.px === null) return -1;
+            return a.px - b.px;
+        })
+        .map(item => item.value);
+}
+
+function byFrequency(counts) {
+    return [...counts].sort((a, b) => b[1] - a[1]).map(([value]) => value);
+}
+
+function normalizeFontStack(stack) {
+    return stack.split(',').map(part => part.trim()).filter(Boolean).join(', ');
+}
+
+/**
+ * Extract tokens from a style page.
+ */
+function extractTokens(html) {
+    const rules = parseRules(extractStyleBlocks(html));
+    const props = rootCustomProperties(rules);
+    const resolved = (value) => resolveVars(value, props);
+
+    const declarations = [];
+    rules.forEach(rule => rule.declarations.forEach(([prop, value]) => {
+        if (!prop.startsWith('--')) declarations.push({ selector: rule.selector, prop, value: resolved(value) });
+    }));
+    const valuesOf = (test) => declarations.filter(d => test(d.prop)).map(d => d.value);
+
+    // Colors: the palette the page declares, else its most used literals
+    let colors = [...props]
+        .map(([name, value]) => ({ name: name.slice(2), value: resolved(value) }))
+        .filter(color => isColor(color.value));
+    if (colors.length === 0) {
+        const literals = declarations
+            .flatMap(d => d.value.match(COLOR_PATTERN) || [])
+            .map(c => c.toLowerCase().replace(/\s+/g, ''))
+            .filter(c => !isTranslucent(c));
+        colors = byFrequency(countValues(literals))
+            .slice(0, MAX_FALLBACK_COLORS)
+            .map((value, i) => ({ name: `color-${i + 1}`, value }));
+    }
+
+    // Fonts: heading and body stacks by where they are used
+    const fontDecls = declarations
+        .filter(d => d.prop === 'font-family' && !/^(inherit|initial|unset)$/.test(d.value))
+        .map(d => ({ selector: d.selector, stack: normalizeFontStack(d.value) }));
+    const stacks = byFrequency(countValues(fontDecls.map(d => d.stack)));
+    const pick = (test) => {
+        const matches = fontDecls.filter(d => test(d.selector)).map(d => d.stack);
+        return matches.length ? byFrequency(countValues(matches))[0] : null;
+    };
+    const body = pick(selector => BODY_SELECTOR.test(selector)) || stacks[0] || null;
+    const heading = pick(selector => HEADING_SELECTOR.test(selector)) || body;
+
+    const spacing = valuesOf(prop => SPACING_PROPERTIES.has(prop))
+        .flatMap(splitValues)
+        .filter(value => {
+            const px = toPixels(value);
+            return px !== null && px > 0;
+        });
+
+    return {
+        customProperties: Object.fromEntries(props),
+        colors,
+        fonts: {
+            heading,
+            body,
+            stacks,
+            webFonts: extractWebFonts(html)
+        },
+        typeScale: sortBySize(valuesOf(prop => prop === 'font-size')
+            .filter(value => !/^(inherit|initial|unset|smaller|larger)$/.test(value))),
+        radii: sortBySize(valuesOf(prop => prop === 'border-radius')
+            .filter(value => toPixels(value) !== 0)),
+        shadows: byFrequency(countValues(valuesOf(prop => prop === 'box-shadow')
+            .filter(value => value !== 'none')))
+            .slice(0, MAX_SHADOWS),
+        spacing: sortBySize(spacing)
+    };
+}
+
+module.exports = {
+    extractStyleBlocks,
+    extractWebFonts,
+    parseRules,
+    resolveVars,
+    toPixels,
+    extractTokens
+};
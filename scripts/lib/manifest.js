@@ -0,0 +1,95 @@
+/**
+ * Style Manifest
+ * Loads and writes data/styles.json - the single source of truth for the
+ * catalogue (name, blend, tags, temperature, formality, preview, perfect-for
+ * fits, colour palette and page file of every style).
+ *
+ * Every script that needs style data goes through here; the gallery reads
+ * the compact shards that scripts/build-data.js derives from the manifest.
+ */
+
+const fs = require('fs');
+const path = require('path');
+
+const ROOT_DIR = path.join(__dirname, '..', '..');
+const MANIFEST_PATH = path.join(ROOT_DIR, 'data', 'styles.json');
+const MANIFEST_VERSION = 1;
+
+// Field order in the manifest (and in catalog shards)
+const STYLE_FIELDS = ['num', 'name', 'blend', 'tags', 'temp', 'formality', 'preview', 'perfectFor', 'colors', 'file'];
+
+function validateStyle(style, seen) {
+    const where = `style ${style.num !== undefined ? style.num : '?'}`;
+    if (!Number.isInteger(style.num) || style.num < 1) throw new Error(`${where}: num must be a positive integer`);
+    if (seen.has(style.num)) throw new Error(`${where}: duplicate num`);
+    ['name', 'blend', 'preview', 'file'].forEach(field => {
+        if (typeof style[field] !== 'string' || !style[field]) throw new Error(`${where}: missing ${field}`);
+    });
+    ['tags', 'perfectFor', 'colors'].forEach(field => {
+        if (!Array.isArray(style[field])) throw new Error(`${where}: ${field} must be an array`);
+    });
+    if (style.tags.length === 0) throw new Error(`${where}: needs at least one tag`);
+    ['temp', 'formality'].forEach(field => {
+        if (!Number.isInteger(style[field]) || style[field] < 1 || style[field] > 10) {
+            throw new Error(`${where}: ${field} must be an integer from 1 to 10`);
+        }
+    });
+    const unknown = Object.keys(style).filter(key => !STYLE_FIELDS.includes(key));
+    if (unknown.length) throw new Error(`${where}: unknown field(s) ${unknown.join(', ')}`);
+    seen.add(style.num);
+}
+
+/**
+ * Read and validate the manifest. Styles come back sorted by number.
+ */
+function loadManifest(manifestPath = MANIFEST_PATH) {
+    const manifest = JSON.parse(fs.readFileSync(manifestPath, 'utf-8'));
+    if (manifest.version !== MANIFEST_VERSION) {
+        throw new Error(`${path.relative(ROOT_DIR, manifestPath)} is version ${manifest.version}, expected ${MANIFEST_VERSION}`);
+    }
+    if (!Array.isArray(manifest.styles) || manifest.styles.length === 0) {
+        throw new Error(`${path.relative(ROOT_DIR, manifestPath)} has no styles`);
+    }
+
+    const seen = new Set();
+    manifest.styles.forEach(style => validateStyle(style, seen));
+    manifest.styles.sort((a, b) => a.num - b.num);
+    return manifest;
+}
+
+function loadStyles(manifestPath) {
+    return loadManifest(manifestPath).styles;
+}
+
+// One key per line, arrays of primitives kept on one line, so a style edit
+// shows up as a small readable diff
+function formatManifest(manifest) {
+    const styles = manifest.styles.map(style => {
+        const lines = STYLE_FIELDS
+            .filter(field => style[field] !== undefined)
+            .map(field => {
+                const value = style[field];
+                const json = Array.isArray(value)
+                    ? `[${value.map(item => JSON.stringify(item)).join(', ')}]`
+                    : JSON.stringify(value);
+                return `      ${JSON.stringify(field)}: ${json}`;
+            });
+        return `    {\n${lines.join(',\n')}\n    }`;
+    });
+    return `{\n  "version": ${manifest.version},\n  "styles": [\n${styles.join(',\n')}\n  ]\n}\n`;
+}
+
+function writeManifest(manifest, manifestPath = MANIFEST_PATH) {
+    fs.writeFileSync(manifestPath, formatManifest(manifest), 'utf-8');
+}
+
+module.exports = {
+    ROOT_DIR,
+    MANIFEST_PATH,
+    MANIFEST_VERSION,
+    STYLE_FIELDS,
+    loadManifest,
+    loadStyles,
+    formatManifest,
+    writeManifest
+};
@@ -0,0 +1,204 @@
+/**
+ * Style Page Pipeline
+ * Patches style pages with an ordered list of registered transforms
+ * (scripts/lib/page-transforms/), reading and writing each page once.
+ *
+ * A page is loaded with its shared chrome bundles inlined again (see
+ * scripts/lib/chrome-assets.js), so every transform sees the page the way
+ * the patch scripts originally wrote it. Each transform edits the Page in
+ * place and must be idempotent: applying it to a page it already patched
+ * leaves the page unchanged. The chrome is extracted again when the page is
+ * saved, so an untouched page round-trips byte for byte.
+ *
+ * Transform: { name, description, apply(page, ctx) }
+ */
+
+const fs = require('fs');
+const path = require('path');
+const { CHROME_CSS_SECTIONS, findSection, extractChrome, inlineChrome } = require('./chrome-assets');
+
+const ROOT_DIR = path.join(__dirname, '..', '..');
+const ASSETS_DIR = path.join(ROOT_DIR, 'assets');
+
+// --- Page --------------------------------------------------------------
+
+class Page {
+    constructor(file, content, style) {
+        this.file = file;
+        this.style = style;
+        this._content = content;
+        this._landmarks = null;
+    }
+
+    get content() {
+        return this._content;
+    }
+
+    set content(value) {
+        if (value === this._content) return;
+        this._content = value;
+        this._landmarks = null;
+    }
+
+    // Offsets the transforms anchor on, found once per edit
+    get landmarks() {
+        if (!this._landmarks) {
+            const bodyOpen = this._content.match(/<body[^>]*>/);
+            this._landmarks = {
+                bodyOpenEnd: bodyOpen ? bodyOpen.index + bodyOpen[0].length : -1,
+                bodyClose: this._content.lastIndexOf('</body>'),
+                styleClose: this._content.lastIndexOf('</style>')
+            };
+        }
+        return this._landmarks;
+    }
+
+    includes(text) {
+        return this._content.includes(text);
+    }
+
+    // String.replace on the page; true if anything changed
+    replace(pattern, replacement) {
+        const before = this._content;
+        this.content = before.replace(pattern, replacement);
+        return this._content !== before;
+    }
+
+    insert(index, text) {
+        this.content = this._content.slice(0, index) + text + this._content.slice(index);
+    }
+
+    landmark(name, tag) {
+        const index = this.landmarks[name];
+        if (index === -1) throw new Error(`no ${tag} tag`);
+        return index;
+    }
+
+    afterBodyOpen(html) {
+        this.insert(this.landmark('bodyOpenEnd', '<body>'), html);
+    }
+
+    beforeBodyClose(html) {
+        this.insert(this.landmark('bodyClose', '</body>'), html);
+    }
+
+    /**
+     * Add an injected chrome CSS section. Sections keep the order of
+     * CHROME_CSS_SECTIONS, so the new one goes in front of any section that
+     * should cascade after it, else at the end of the last <style> block.
+     */
+    addChromeCSS(title, css) {
+        const rank = CHROME_CSS_SECTIONS.findIndex(section => section.title === title);
+        if (rank === -1) throw new Error(`unknown chrome section "${title}"`);
+        const styleClose = this.landmark('styleClose', '</style>');
+        const styleOpen = this._content.lastIndexOf('<style', styleClose);
+
+        let before = -1;
+        CHROME_CSS_SECTIONS.slice(rank + 1).forEach(section => {
+            const index = findSection(this._content, section, styleOpen, styleClose);
+            if (index !== -1 && (before === -1 || index < before)) before = index;
+        });
+
+        // Whole lines, so the indentation around the anchor is untouched
+        const anchor = before === -1 ? styleClose : before;
+        const lineStart = this._content.lastIndexOf('\n', anchor - 1) + 1;
+        if (/^[ \t]*$/.test(this._content.slice(lineStart, anchor))) {
+            const spaced = /\n[ \t]*\n$/.test(this._content.slice(0, lineStart));
+            this.insert(lineStart, (spaced ? '' : '\n') + css.replace(/^\n+/, '').replace(/\s*$/, '\n\n'));
+        } else {
+            this.insert(anchor, '\n' + css.replace(/^\n+/, '').replace(/\s*$/, '\n'));
+        }
+    }
+}
+
+// --- Registry ----------------------------------------------------------
+
+const transforms = [];
+
+function registerTransform(transform) {
+    if (!transform.name || typeof transform.apply !== 'function') {
+        throw new Error('a transform needs a name and an apply(page, ctx) function');
+    }
+    if (transforms.some(t => t.name === transform.name)) {
+        throw new Error(`transform "${transform.name}" is already registered`);
+    }
+    transforms.push(transform);
+}
+
+// Registered transforms in order, optionally only the named ones
+function getTransforms(names) {
+    if (!names) return [...transforms];
+    const unknown = names.filter(name => !transforms.some(t => t.name === name));
+    if (unknown.length) {
+        throw new Error(`unknown transform(s) ${unknown.join(', ')} - expected ${transforms.map(t => t.name).join(', ')}`);
+    }
+    return transforms.filter(t => names.includes(t.name));
+}
+
+// --- Context -----------------------------------------------------------
+
+/**
+ * What transforms know about the catalogue, built once per worker from the
+ * manifest. `similar` maps a style number to its nearest styles' numbers.
+ */
+function buildContext(styles, similar = {}) {
+    const ordered = [...styles].sort((a, b) => a.num - b.num);
+    const byNum = new Map(ordered.map(style => [style.num, style]));
+    const position = new Map(ordered.map((style, i) => [style.num, i]));
+
+    return {
+        styles: ordered,
+        total: ordered.length,
+        byNum,
+        previous: (style) => ordered[position.get(style.num) - 1] || null,
+        next: (style) => ordered[position.get(style.num) + 1] || null,
+        similarTo: (style) => (similar[style.num] || []).map(num => byNum.get(num)).filter(Boolean)
+    };
+}
+
+// --- Running -----------------------------------------------------------
+
+const bundleCache = new Map();
+
+function readBundle(name) {
+    if (!bundleCache.has(name)) {
+        bundleCache.set(name, fs.readFileSync(path.join(ASSETS_DIR, name), 'utf8'));
+    }
+    return bundleCache.get(name);
+}
+
+function elapsed(startTime) {
+    return Number(process.hrtime.bigint() - startTime) / 1e6;
+}
+
+/**
+ * Run transforms over one page's HTML. Returns the patched HTML in its
+ * deployed form, the chrome bundles it references, and per-transform
+ * { name, ms, changed }.
+ */
+function patchPage(file, original, style, list, ctx) {
+    const timings = [];
+    let startTime = process.hrtime.bigint();
+    const page = new Page(file, inlineChrome(original, readBundle), style);
+    timings.push({ name: 'inline-chrome', ms: elapsed(startTime), changed: false });
+
+    for (const transform of list) {
+        startTime = process.hrtime.bigint();
+        const before = page.content;
+        transform.apply(page, ctx);
+        timings.push({ name: transform.name, ms: elapsed(startTime), changed: page.content !== before });
+    }
+
+    startTime = process.hrtime.bigint();
+    const { content, bundles } = extractChrome(page.content);
+    timings.push({ name: 'extract-chrome', ms: elapsed(startTime), changed: false });
+    return { content, bundles, timings };
+}
+
+module.exports = {
+    Page,
+    registerTransform,
+    getTransforms,
+    buildContext,
+    patchPage
+};
@@ -0,0 +1,49 @@
+/**
+ * Accessibility
+ * A skip link ahead of the injected chrome, pointing at the page's main
+ * content.
+ */
+
+const SKIP_LINK_SECTION = 'Skip Link for Accessibility';
+
+const SKIP_LINK_CSS = `
+        /* Skip Link for Accessibility */
+        .skip-link {
+            position: absolute;
+            top: -100px;
+            left: 0;
+            background: #000;
+            color: #fff;
+            padding: 0.75rem 1.5rem;
+            z-index: 10001;
+            text-decoration: none;
+            font-weight: 600;
+            border-radius: 0 0 4px 0;
+            transition: top 0.3s ease;
+        }
+        .skip-link:focus {
+            top: 0;
+            outline: 2px solid #3b82f6;
+            outline-offset: 2px;
+        }
+`;
+
+const SKIP_LINK_HTML = '<a href="#main-content" class="skip-link">Skip to main content</a>';
+
+module.exports = [
+    {
+        name: 'skip-link',
+        description: 'Add a "Skip to main content" link and its #main-content target',
+        apply(page) {
+            if (page.includes('class="skip-link"') || page.includes('Skip to main content')) return;
+            if (!page.includes(`/* ${SKIP_LINK_SECTION} */`)) page.addChromeCSS(SKIP_LINK_SECTION, SKIP_LINK_CSS);
+            page.afterBodyOpen('\n    ' + SKIP_LINK_HTML);
+
+            // Target: the <main> element, else the first container
+            if (page.includes('id="main-content"')) return;
+            if (!page.replace(/<main([^>]*)>/, '<main$1 id="main-content">')) {
+                page.replace(/class="container"/, 'id="main-content" class="container"');
+            }
+        }
+    }
+];
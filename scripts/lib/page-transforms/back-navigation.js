@@ -0,0 +1,99 @@
+/**
+ * Back Navigation
+ * The floating "Back to Gallery" link, and the script that records the
+ * page in the gallery's recently viewed list.
+ */
+
+const BACK_SECTION = 'Back to Gallery Navigation';
+
+const BACK_CSS = `
+/* Back to Gallery Navigation */
+.back-to-gallery {
+    position: fixed;
+    top: 1rem;
+    left: 1rem;
+    background: rgba(0, 0, 0, 0.85);
+    color: white;
+    padding: 0.75rem 1rem;
+    min-height: 44px;
+    border-radius: 2rem;
+    text-decoration: none;
+    z-index: 1000;
+    backdrop-filter: blur(10px);
+    display: flex;
+    align-items: center;
+    gap: 0.5rem;
+    font-size: 0.875rem;
+    font-weight: 500;
+    transition: all 0.2s ease;
+    border: 1px solid rgba(255, 255, 255, 0.1);
+}
+
+.back-to-gallery:hover {
+    background: rgba(59, 130, 246, 0.9);
+    transform: translateX(-4px);
+}
+
+.back-to-gallery svg {
+    transition: transform 0.2s;
+}
+
+.back-to-gallery:hover svg {
+    transform: translateX(-4px);
+}
+`;
+
+const BACK_HTML = `
+<!-- Back to Gallery Navigation -->
+<a href="index.html" class="back-to-gallery" aria-label="Back to gallery">
+    <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+        <line x1="19" y1="12" x2="5" y2="12"></line>
+        <polyline points="12 19 5 12 12 5"></polyline>
+    </svg>
+    Back to Gallery
+</a>
+`;
+
+const RECENT_VIEWS_SCRIPT = `
+<!-- Recently Viewed Tracking -->
+<script>
+(function() {
+    var match = location.pathname.match(/style-(\\d+)/);
+    if (match) {
+        var num = parseInt(match[1]);
+        var key = 'lobbi-recent-styles';
+        var recent = JSON.parse(localStorage.getItem(key) || '[]');
+        recent = recent.filter(function(n) { return n !== num; });
+        recent.unshift(num);
+        recent = recent.slice(0, 8);
+        localStorage.setItem(key, JSON.stringify(recent));
+    }
+})();
+</script>
+`;
+
+// The first of the other injected chrome after <body>; the back link goes
+// in front of it
+const BODY_CHROME = /(<body[^>]*>[\s\S]*?)(<a href="#main-content" class="skip-link"|<!-- Gallery Navigation -->|<nav class="gallery-nav"|<header)/;
+
+module.exports = [
+    {
+        name: 'back-link',
+        description: 'Add the floating "Back to Gallery" link',
+        apply(page) {
+            if (page.includes('<!-- Back to Gallery Navigation -->')) return;
+            if (!page.includes('.back-to-gallery {')) page.addChromeCSS(BACK_SECTION, BACK_CSS);
+            if (!page.replace(BODY_CHROME, (match, before, next) => `${before}${BACK_HTML}\n    ${next}`)) {
+                page.afterBodyOpen(BACK_HTML);
+            }
+        }
+    },
+    {
+        name: 'recent-views',
+        description: 'Record visits in the gallery\'s recently viewed list',
+        apply(page) {
+            if (page.includes('<!-- Recently Viewed Tracking -->')) return;
+            page.beforeBodyClose(RECENT_VIEWS_SCRIPT + '\n');
+        }
+    }
+];
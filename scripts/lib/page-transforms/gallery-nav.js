@@ -0,0 +1,353 @@
+/**
+ * Gallery Navigation
+ * The bar at the top of every style page: back to the gallery, "Style N of
+ * M", keyboard hints, category tags and previous/next arrows. The count and
+ * the links come from the manifest, so they follow the catalogue as styles
+ * are added.
+ */
+
+const NAV_SECTION = 'Gallery Navigation - Injected';
+
+const NAV_CSS = `
+        /* Gallery Navigation - Injected */
+        .gallery-nav {
+            position: fixed;
+            top: 0;
+            left: 0;
+            right: 0;
+            z-index: 9999;
+            background: linear-gradient(135deg, rgba(0,0,0,0.95) 0%, rgba(20,20,20,0.98) 100%);
+            backdrop-filter: blur(12px);
+            -webkit-backdrop-filter: blur(12px);
+            padding: 0.75rem 1.5rem;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            border-bottom: 1px solid rgba(255,255,255,0.1);
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            transform: translateY(0);
+            transition: transform 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        }
+        .gallery-nav.visible {
+            transform: translateY(0);
+        }
+        .gallery-nav-left {
+            display: flex;
+            align-items: center;
+            gap: 1rem;
+        }
+        .gallery-nav-back {
+            display: inline-flex;
+            align-items: center;
+            gap: 0.5rem;
+            padding: 0.5rem 1rem;
+            background: rgba(255,255,255,0.1);
+            border: 1px solid rgba(255,255,255,0.2);
+            border-radius: 6px;
+            color: #fff;
+            text-decoration: none;
+            font-size: 0.875rem;
+            font-weight: 500;
+            transition: all 0.2s ease;
+        }
+        .gallery-nav-back:hover {
+            background: rgba(255,255,255,0.2);
+            border-color: rgba(255,255,255,0.3);
+            transform: translateX(-2px);
+        }
+        .gallery-nav-back svg {
+            width: 16px;
+            height: 16px;
+        }
+        .gallery-nav-title {
+            font-size: 0.8125rem;
+            color: rgba(255,255,255,0.7);
+            font-weight: 400;
+        }
+        .gallery-nav-title strong {
+            color: #fff;
+            font-weight: 600;
+        }
+        .gallery-nav-right {
+            display: flex;
+            align-items: center;
+            gap: 0.75rem;
+        }
+        .gallery-nav-arrows {
+            display: flex;
+            gap: 0.25rem;
+        }
+        .gallery-nav-arrow {
+            display: inline-flex;
+            align-items: center;
+            justify-content: center;
+            width: 44px;
+            height: 44px;
+            background: rgba(255,255,255,0.1);
+            border: 1px solid rgba(255,255,255,0.2);
+            border-radius: 4px;
+            color: #fff;
+            text-decoration: none;
+            transition: all 0.2s ease;
+        }
+        .gallery-nav-arrow:hover {
+            background: rgba(255,255,255,0.2);
+        }
+        .gallery-nav-arrow.disabled {
+            opacity: 0.3;
+            pointer-events: none;
+        }
+        .gallery-nav-arrow svg {
+            width: 14px;
+            height: 14px;
+        }
+        .gallery-nav-toggle {
+            position: fixed;
+            top: 1rem;
+            left: 1rem;
+            z-index: 9998;
+            width: 44px;
+            height: 44px;
+            background: linear-gradient(135deg, rgba(0,0,0,0.9) 0%, rgba(30,30,30,0.95) 100%);
+            backdrop-filter: blur(8px);
+            border: 1px solid rgba(255,255,255,0.2);
+            border-radius: 8px;
+            color: #fff;
+            cursor: pointer;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            transition: all 0.2s ease;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.3);
+        }
+        .gallery-nav-toggle:hover {
+            background: linear-gradient(135deg, rgba(30,30,30,0.95) 0%, rgba(50,50,50,0.98) 100%);
+            transform: scale(1.05);
+        }
+        .gallery-nav-toggle svg {
+            width: 20px;
+            height: 20px;
+        }
+        .gallery-nav.visible + .gallery-nav-toggle {
+            opacity: 0;
+            pointer-events: none;
+        }
+        @media (max-width: 640px) {
+            .gallery-nav-title { display: none; }
+            .gallery-nav { padding: 0.5rem 1rem; }
+        }
+`;
+
+const HINTS_CSS = `        .gallery-nav-hints {
+            font-size: 0.6875rem;
+            color: rgba(255,255,255,0.5);
+            font-weight: 400;
+            margin-left: 1rem;
+            padding-left: 1rem;
+            border-left: 1px solid rgba(255,255,255,0.2);
+        }
+        .hint-text {
+            font-family: 'Courier New', monospace;
+        }
+        .gallery-nav-categories {
+            display: inline-flex;
+            gap: 0.25rem;
+            margin-left: 1rem;
+        }
+        .category-tag {
+            font-size: 0.625rem;
+            padding: 2px 6px;
+            background: rgba(255,255,255,0.1);
+            border: 1px solid rgba(255,255,255,0.2);
+            border-radius: 3px;
+            color: rgba(255,255,255,0.6);
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+            font-weight: 500;
+        }
+`;
+
+const NAV_TITLE = /(<span class="gallery-nav-title">Style <strong>)\d+<\/strong>(?: of \d+\+?)?( &mdash; )/;
+const NAV_TITLE_SPAN = /<span class="gallery-nav-title">Style <strong>\d+<\/strong>[^<]*<\/span>/;
+const SKIP_LINK = /<a href="#main-content" class="skip-link">[^<]*<\/a>/;
+
+function links(style, ctx) {
+    const prev = ctx.previous(style);
+    const next = ctx.next(style);
+    return {
+        prevNum: prev ? prev.num : 0,
+        nextNum: next ? next.num : 0,
+        prevHref: prev ? prev.file : '#',
+        nextHref: next ? next.file : '#'
+    };
+}
+
+function arrow(href, num, title) {
+    return `<a href="${href}" class="gallery-nav-arrow${num ? '' : ' disabled'}" title="${title}">`;
+}
+
+function hintsHTML(style) {
+    const badges = style.tags.map(tag => `<span class="category-tag">${tag}</span>`).join('');
+    return `
+            <span class="gallery-nav-hints" title="Keyboard Shortcuts">
+                <span class="hint-text">← → Navigate • ESC Hide</span>
+            </span>
+            <span class="gallery-nav-categories">
+                ${badges}
+            </span>`;
+}
+
+function navHTML(style, ctx) {
+    const { prevNum, nextNum, prevHref, nextHref } = links(style, ctx);
+
+    return `
+    <!-- Gallery Navigation -->
+    <nav class="gallery-nav visible" aria-label="Gallery navigation" id="galleryNav">
+        <div class="gallery-nav-left">
+            <a href="index.html" class="gallery-nav-back">
+                <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+                    <path d="M19 12H5M12 19l-7-7 7-7"/>
+                </svg>
+                Back to Gallery
+            </a>
+            <span class="gallery-nav-title">Style <strong>${style.num}</strong> of ${ctx.total} &mdash; ${style.name}</span>
+        </div>
+        <div class="gallery-nav-right">
+            <div class="gallery-nav-arrows">
+                ${arrow(prevHref, prevNum, 'Previous Style')}
+                    <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+                        <path d="M15 18l-6-6 6-6"/>
+                    </svg>
+                </a>
+                ${arrow(nextHref, nextNum, 'Next Style')}
+                    <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+                        <path d="M9 18l6-6-6-6"/>
+                    </svg>
+                </a>
+            </div>
+        </div>
+    </nav>
+    <button class="gallery-nav-toggle" id="galleryNavToggle" title="Show Navigation">
+        <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+            <path d="M4 6h16M4 12h16M4 18h16"/>
+        </svg>
+    </button>
+    <script>
+        (function() {
+            const nav = document.getElementById('galleryNav');
+            const toggle = document.getElementById('galleryNavToggle');
+            let hideTimeout;
+
+            function showNav() {
+                nav.classList.add('visible');
+                clearTimeout(hideTimeout);
+                hideTimeout = setTimeout(() => nav.classList.remove('visible'), 30000);
+            }
+
+            function hideNav() {
+                nav.classList.remove('visible');
+            }
+
+            // Show on page load briefly
+            setTimeout(showNav, 500);
+
+            // Toggle button
+            toggle.addEventListener('click', showNav);
+
+            // Show on mouse near top
+            document.addEventListener('mousemove', (e) => {
+                if (e.clientY < 60) showNav();
+            });
+
+            // Keep visible on hover
+            nav.addEventListener('mouseenter', () => clearTimeout(hideTimeout));
+            nav.addEventListener('mouseleave', () => {
+                hideTimeout = setTimeout(() => nav.classList.remove('visible'), 1500);
+            });
+
+            // Keyboard navigation
+            document.addEventListener('keydown', (e) => {
+                if (e.key === 'Escape') hideNav();
+                if (e.key === 'ArrowLeft' && ${prevNum}) window.location.href = '${prevHref}';
+                if (e.key === 'ArrowRight' && ${nextNum}) window.location.href = '${nextHref}';
+            });
+        })();
+    </script>
+`;
+}
+
+module.exports = [
+    {
+        name: 'gallery-nav',
+        description: 'Add the gallery navigation bar to pages without one',
+        apply(page, ctx) {
+            if (page.includes('id="galleryNav"')) return;
+            if (!page.includes(`/* ${NAV_SECTION} */`)) page.addChromeCSS(NAV_SECTION, NAV_CSS);
+
+            // After the skip link, which has to stay the first focusable element
+            const skipLink = page.content.match(SKIP_LINK);
+            if (skipLink) {
+                page.insert(skipLink.index + skipLink[0].length, navHTML(page.style, ctx));
+            } else {
+                page.afterBodyOpen(navHTML(page.style, ctx));
+            }
+        }
+    },
+    {
+        name: 'nav-counter',
+        description: 'Set "Style N of M" to the style number and the manifest total',
+        apply(page, ctx) {
+            page.replace(NAV_TITLE, (match, open, dash) => `${open}${page.style.num}</strong> of ${ctx.total}${dash}`);
+        }
+    },
+    {
+        name: 'nav-links',
+        description: 'Point the previous/next arrows and arrow keys at the neighbouring styles',
+        apply(page, ctx) {
+            const { prevNum, nextNum, prevHref, nextHref } = links(page.style, ctx);
+            page.replace(/<a href="[^"]*" class="gallery-nav-arrow(?: disabled)?" title="Previous Style">/,
+                () => arrow(prevHref, prevNum, 'Previous Style'));
+            page.replace(/<a href="[^"]*" class="gallery-nav-arrow(?: disabled)?" title="Next Style">/,
+                () => arrow(nextHref, nextNum, 'Next Style'));
+            page.replace(/if \(e\.key === 'ArrowLeft'(?: && \d+)?\) window\.location\.href = '[^']*';/,
+                () => `if (e.key === 'ArrowLeft' && ${prevNum}) window.location.href = '${prevHref}';`);
+            page.replace(/if \(e\.key === 'ArrowRight'(?: && \d+)?\) window\.location\.href = '[^']*';/,
+                () => `if (e.key === 'ArrowRight' && ${nextNum}) window.location.href = '${nextHref}';`);
+        }
+    },
+    {
+        name: 'nav-hints',
+        description: 'Add keyboard hints and category tags next to the nav title',
+        apply(page) {
+            if (page.includes('class="gallery-nav-hints"')) return;
+            const title = page.content.match(NAV_TITLE_SPAN);
+            if (!title) return;
+
+            if (!page.includes('.gallery-nav-hints {')) {
+                // Inside the nav section, ahead of its small-screen overrides
+                const section = page.content.indexOf(`/* ${NAV_SECTION} */`);
+                const media = section === -1 ? -1 : page.content.indexOf('@media (max-width: 640px)', section);
+                if (media === -1) return;
+                page.insert(page.content.lastIndexOf('\n', media) + 1, HINTS_CSS);
+            }
+            page.replace(NAV_TITLE_SPAN, span => span + hintsHTML(page.style));
+        }
+    },
+    {
+        name: 'nav-aria',
+        description: 'Label the gallery navigation landmark',
+        apply(page) {
+            page.replace(/<nav class="gallery-nav( visible)?"(?![^>]*aria-label)/, '<nav class="gallery-nav$1" aria-label="Gallery navigation"');
+        }
+    },
+    {
+        name: 'nav-visible',
+        description: 'Show the gallery navigation by default instead of hiding it off-screen',
+        apply(page) {
+            page.replace(/(\.gallery-nav \{[^}]*?)transform: translateY\(-100%\);/g, '$1transform: translateY(0);');
+            page.replace(/hideTimeout = setTimeout\(\(\) => nav\.classList\.remove\('visible'\), 3000\)/g,
+                "hideTimeout = setTimeout(() => nav.classList.remove('visible'), 30000)");
+            page.replace(/<nav class="gallery-nav"/g, '<nav class="gallery-nav visible"');
+        }
+    }
+];
@@ -0,0 +1,19 @@
+/**
+ * Page Transforms
+ * Registers every style page transform with the page pipeline, in the order
+ * they run. Later transforms may rely on what earlier ones added (the back
+ * link goes in front of the skip link and nav, UI polish covers the nav and
+ * similar styles bar).
+ */
+
+const { registerTransform } = require('../page-pipeline');
+
+[
+    require('./accessibility'),
+    require('./gallery-nav'),
+    require('./export-panel'),
+    require('./back-navigation'),
+    require('./similar-styles'),
+    require('./mobile-styles'),
+    require('./ui-polish')
+].flat().forEach(registerTransform);
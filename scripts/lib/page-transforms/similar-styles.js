@@ -0,0 +1,211 @@
+/**
+ * Similar Styles
+ * The collapsible "Similar Styles" bar at the bottom of each page, showing
+ * the nearest styles from data/similar-styles.json (see
+ * js/similarity-core.js). Run npm run build-data first.
+ */
+
+const SIMILAR_SECTION = 'Similar Styles Section';
+
+const SIMILAR_STYLES_CSS = `
+/* Similar Styles Section - Collapsible */
+.similar-styles-section {
+    position: fixed;
+    bottom: 0;
+    left: 0;
+    right: 0;
+    background: rgba(0, 0, 0, 0.95);
+    backdrop-filter: blur(20px);
+    padding: 1rem 2rem;
+    z-index: 999;
+    border-top: 1px solid rgba(255, 255, 255, 0.1);
+    transition: transform 0.3s ease, padding 0.3s ease;
+}
+
+.similar-styles-section.collapsed {
+    transform: translateY(calc(100% - 44px));
+    padding-bottom: 0.5rem;
+}
+
+.similar-styles-header {
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+    cursor: pointer;
+    user-select: none;
+}
+
+.similar-styles-title {
+    font-size: 0.75rem;
+    text-transform: uppercase;
+    letter-spacing: 0.1em;
+    color: rgba(255, 255, 255, 0.5);
+    margin-bottom: 0;
+    transition: margin 0.3s ease;
+}
+
+.similar-styles-section:not(.collapsed) .similar-styles-title {
+    margin-bottom: 0.75rem;
+}
+
+.similar-styles-toggle {
+    display: flex;
+    align-items: center;
+    gap: 0.5rem;
+    background: none;
+    border: none;
+    color: rgba(255, 255, 255, 0.5);
+    cursor: pointer;
+    padding: 0.25rem 0.5rem;
+    border-radius: 0.25rem;
+    transition: color 0.2s, background 0.2s;
+}
+
+.similar-styles-toggle:hover {
+    color: rgba(255, 255, 255, 0.8);
+    background: rgba(255, 255, 255, 0.1);
+}
+
+.similar-styles-toggle svg {
+    width: 16px;
+    height: 16px;
+    transition: transform 0.3s ease;
+}
+
+.similar-styles-section.collapsed .similar-styles-toggle svg {
+    transform: rotate(180deg);
+}
+
+.similar-styles-grid {
+    display: flex;
+    gap: 1rem;
+    overflow-x: auto;
+    transition: opacity 0.3s ease, max-height 0.3s ease;
+    max-height: 120px;
+}
+
+.similar-styles-section.collapsed .similar-styles-grid {
+    opacity: 0;
+    max-height: 0;
+    overflow: hidden;
+    margin-top: 0;
+}
+
+.similar-style-card {
+    display: flex;
+    flex-direction: column;
+    text-decoration: none;
+    flex-shrink: 0;
+    width: 120px;
+}
+
+.similar-preview {
+    width: 120px;
+    height: 75px;
+    border-radius: 0.375rem;
+    margin-bottom: 0.375rem;
+}
+
+.similar-name {
+    font-size: 0.75rem;
+    color: rgba(255, 255, 255, 0.8);
+    white-space: nowrap;
+    overflow: hidden;
+    text-overflow: ellipsis;
+}
+
+.similar-style-card:hover .similar-name {
+    color: #60a5fa;
+}
+`;
+
+const SIMILAR_STYLES_JS = `
+<script>
+(function() {
+    const section = document.querySelector('.similar-styles-section');
+    const toggle = document.querySelector('.similar-styles-toggle');
+    const STORAGE_KEY = 'lobbi-similar-styles-collapsed';
+
+    // Restore collapsed state from localStorage
+    if (localStorage.getItem(STORAGE_KEY) === 'true') {
+        section.classList.add('collapsed');
+    }
+
+    // Toggle collapse on click
+    if (toggle) {
+        toggle.addEventListener('click', (e) => {
+            e.stopPropagation();
+            section.classList.toggle('collapsed');
+            localStorage.setItem(STORAGE_KEY, section.classList.contains('collapsed'));
+        });
+    }
+
+    // Also allow clicking the header to toggle
+    const header = document.querySelector('.similar-styles-header');
+    if (header) {
+        header.addEventListener('click', () => {
+            section.classList.toggle('collapsed');
+            localStorage.setItem(STORAGE_KEY, section.classList.contains('collapsed'));
+        });
+    }
+})();
+</script>`;
+
+const SIMILAR_GRID = /(<div class="similar-styles-grid">\n)([\s\S]*?)(\n    <\/div>\n<\/div>)/;
+
+// Deterministic preview gradient from the style number and tags
+function generateGradient(style) {
+    const hue1 = (style.num * 137.5) % 360; // Golden angle distribution
+    const hue2 = (hue1 + 60) % 360;
+
+    const saturation = style.tags.includes('premium') ? '70%' : '50%';
+    const lightness = style.tags.includes('heritage') || style.tags.includes('academic') ? '40%' : '50%';
+
+    return `linear-gradient(135deg, hsl(${hue1}, ${saturation}, ${lightness}), hsl(${hue2}, ${saturation}, ${lightness}))`;
+}
+
+function similarCardsHTML(similarStyles) {
+    return similarStyles.map(style => `        <a href="${style.file}" class="similar-style-card">
+            <div class="similar-preview" style="background: ${generateGradient(style)}"></div>
+            <span class="similar-name">${style.name}</span>
+        </a>`).join('\n');
+}
+
+function similarStylesHTML(similarStyles) {
+    return `
+<!-- Similar Styles Section -->
+<div class="similar-styles-section">
+    <div class="similar-styles-header">
+        <h3 class="similar-styles-title">Similar Styles</h3>
+        <button class="similar-styles-toggle" aria-label="Toggle similar styles">
+            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+                <path d="M18 15l-6-6-6 6"/>
+            </svg>
+        </button>
+    </div>
+    <div class="similar-styles-grid">
+${similarCardsHTML(similarStyles)}
+    </div>
+</div>`;
+}
+
+module.exports = [
+    {
+        name: 'similar-styles',
+        description: 'Add the similar styles bar, or refresh its cards from data/similar-styles.json',
+        apply(page, ctx) {
+            const similarStyles = ctx.similarTo(page.style);
+
+            if (page.includes('<!-- Similar Styles Section -->')) {
+                page.replace(SIMILAR_GRID, (match, open, cards, close) => open + similarCardsHTML(similarStyles) + close);
+                return;
+            }
+            if (similarStyles.length === 0) return;
+
+            if (!page.includes('/* Similar Styles Section - Collapsible */')) {
+                page.addChromeCSS(SIMILAR_SECTION, SIMILAR_STYLES_CSS);
+            }
+            page.beforeBodyClose(similarStylesHTML(similarStyles) + '\n\n' + SIMILAR_STYLES_JS + '\n');
+        }
+    }
+];
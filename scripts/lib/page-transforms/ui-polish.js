@@ -0,0 +1,153 @@
+/**
+ * UI Polish
+ * Transitions, focus rings, reduced-motion support and touch feedback,
+ * plus polish for the gallery nav and similar styles section on pages that
+ * have them.
+ */
+
+const POLISH_SECTION = 'UI POLISH ADDITIONS';
+
+const UI_POLISH_CSS = `
+        /* === UI POLISH ADDITIONS === */
+
+        /* Smooth transitions for all interactive elements */
+        a, button, input, select, textarea {
+            transition: all 0.2s ease;
+        }
+
+        /* Card hover improvements */
+        .card {
+            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        }
+
+        .card:hover {
+            transform: translateY(-4px);
+            box-shadow: 0 20px 40px rgba(0, 0, 0, 0.3);
+        }
+
+        /* SVG transitions for collapsible sections */
+        svg {
+            transition: transform 0.3s ease;
+        }
+
+        /* Button active states with smooth transitions */
+        button:active, .btn:active {
+            transform: scale(0.98);
+            transition: transform 0.1s ease-out;
+        }
+
+        /* Focus visible states for accessibility */
+        a:focus-visible,
+        button:focus-visible,
+        input:focus-visible,
+        select:focus-visible,
+        textarea:focus-visible {
+            outline: 2px solid currentColor;
+            outline-offset: 2px;
+        }
+
+        /* Form input focus improvements */
+        input:focus,
+        select:focus,
+        textarea:focus {
+            border-color: var(--gold-500, #d4a520);
+            box-shadow: 0 0 0 3px rgba(212, 165, 32, 0.15);
+            transition: border-color 0.2s ease, box-shadow 0.2s ease;
+        }
+
+        /* Respect reduced motion preferences */
+        @media (prefers-reduced-motion: reduce) {
+            *, *::before, *::after {
+                animation-duration: 0.01ms !important;
+                animation-iteration-count: 1 !important;
+                transition-duration: 0.01ms !important;
+                scroll-behavior: auto !important;
+            }
+        }
+
+        /* Smooth scrolling */
+        html {
+            scroll-behavior: smooth;
+        }
+
+        /* Enhanced touch feedback for mobile */
+        @media (hover: none) and (pointer: coarse) {
+            .card:active {
+                transform: scale(0.98);
+                transition: transform 0.1s ease-out;
+            }
+
+            button:active, .btn:active {
+                transform: scale(0.95);
+            }
+        }
+`;
+
+const GALLERY_NAV_POLISH_CSS = `
+        /* Gallery Navigation Polish */
+        .gallery-nav {
+            transition: transform 0.3s cubic-bezier(0.4, 0, 0.2, 1),
+                        opacity 0.3s ease;
+        }
+
+        .gallery-nav-toggle svg,
+        .gallery-nav-arrow svg {
+            transition: transform 0.2s ease;
+        }
+
+        .gallery-nav-toggle:hover svg {
+            transform: rotate(180deg);
+        }
+
+        .gallery-nav-arrow:hover svg {
+            transform: scale(1.1);
+        }
+
+        .gallery-nav-arrow:active {
+            transform: scale(0.95);
+            transition: transform 0.1s ease-out;
+        }
+`;
+
+const SIMILAR_STYLES_POLISH_CSS = `
+        /* Similar Styles Section Polish */
+        .similar-styles-toggle svg {
+            transition: transform 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        }
+
+        .similar-styles-section.collapsed .similar-styles-toggle svg {
+            transform: rotate(180deg);
+        }
+
+        .similar-style-card {
+            transition: all 0.3s ease;
+        }
+
+        .similar-style-card:hover {
+            transform: translateY(-2px);
+            box-shadow: 0 8px 24px rgba(0, 0, 0, 0.4);
+        }
+`;
+
+module.exports = [
+    {
+        name: 'ui-polish',
+        description: 'Add transitions, focus states and reduced-motion support',
+        apply(page) {
+            const navPolish = page.includes('id="galleryNav"') && !page.includes('/* Gallery Navigation Polish */');
+            const similarPolish = page.includes('class="similar-styles-section"') &&
+                !page.includes('/* Similar Styles Section Polish */');
+
+            if (!page.includes(POLISH_SECTION)) {
+                page.addChromeCSS(POLISH_SECTION, UI_POLISH_CSS +
+                    (navPolish ? GALLERY_NAV_POLISH_CSS : '') +
+                    (similarPolish ? SIMILAR_STYLES_POLISH_CSS : ''));
+                return;
+            }
+
+            // Polish for chrome added after the page was first polished
+            if (navPolish) page.addChromeCSS(POLISH_SECTION, GALLERY_NAV_POLISH_CSS);
+            if (similarPolish) page.addChromeCSS(POLISH_SECTION, SIMILAR_STYLES_POLISH_CSS);
+        }
+    }
+];
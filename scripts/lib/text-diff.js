@@ -0,0 +1,108 @@
+/**
+ * Text Diff
+ * Line-based unified diff (Myers' O(ND) algorithm) for dry-run output.
+ */
+
+// Shortest edit script between two line arrays: [{ op: ' ' | '-' | '+', line }]
+function diffLines(a, b) {
+    const max = a.length + b.length;
+    const offset = max + 1;
+    const v = new Int32Array(2 * max + 3);
+    const trace = [];
+
+    let found = false;
+    for (let d = 0; d <= max && !found; d++) {
+        trace.push(v.slice());
+        for (let k = -d; k <= d; k += 2) {
+            let x = (k === -d || (k !== d && v[offset + k - 1] < v[offset + k + 1]))
+                ? v[offset + k + 1]
+                : v[offset + k - 1] + 1;
+            let y = x - k;
+            while (x < a.length && y < b.length && a[x] === b[y]) {
+                x++;
+                y++;
+            }
+            v[offset + k] = x;
+            if (x >= a.length && y >= b.length) {
+                found = true;
+                break;
+            }
+        }
+    }
+
+    // Walk the trace back from the end
+    const edits = [];
+    let x = a.length;
+    let y = b.length;
+    for (let d = trace.length - 1; d >= 0; d--) {
+        const vd = trace[d];
+        const k = x - y;
+        const prevK = (k === -d || (k !== d && vd[offset + k - 1] < vd[offset + k + 1])) ? k + 1 : k - 1;
+        const prevX = vd[offset + prevK];
+        const prevY = prevX - prevK;
+        while (x > prevX && y > prevY) {
+            edits.push({ op: ' ', line: a[--x] });
+            y--;
+        }
+        if (d === 0) break;
+        if (x === prevX) edits.push({ op: '+', line: b[--y] });
+        else edits.push({ op: '-', line: a[--x] });
+    }
+    return edits.reverse();
+}
+
+/**
+ * Unified diff of two texts, or '' if they are equal.
+ */
+function unifiedDiff(name, before, after, context = 3) {
+    if (before === after) return '';
+    const a = before.replace(/\n$/, '').split('\n');
+    const b = after.replace(/\n$/, '').split('\n');
+
+    // Only the changed middle goes through the diff
+    let head = 0;
+    while (head < a.length && head < b.length && a[head] === b[head]) head++;
+    let tail = 0;
+    while (tail < a.length - head && tail < b.length - head &&
+        a[a.length - 1 - tail] === b[b.length - 1 - tail]) tail++;
+
+    const edits = [
+        ...a.slice(0, head).map(line => ({ op: ' ', line })),
+        ...diffLines(a.slice(head, a.length - tail), b.slice(head, b.length - tail)),
+        ...a.slice(a.length - tail).map(line => ({ op: ' ', line }))
+    ];
+
+    // Group changes into hunks with `context` lines around them
+    const hunks = [];
+    let hunk = null;
+    let aLine = 0;
+    let bLine = 0;
+    edits.forEach((edit, i) => {
+        const near = edits.slice(Math.max(0, i - context), i + context + 1).some(e => e.op !== ' ');
+        if (near) {
+            if (!hunk) {
+                hunk = { aStart: aLine, bStart: bLine, aCount: 0, bCount: 0, lines: [] };
+                hunks.push(hunk);
+            }
+            hunk.lines.push(edit.op + edit.line);
+            if (edit.op !== '+') hunk.aCount++;
+            if (edit.op !== '-') hunk.bCount++;
+        } else {
+            hunk = null;
+        }
+        if (edit.op !== '+') aLine++;
+        if (edit.op !== '-') bLine++;
+    });
+
+    const range = (start, count) => `${count ? start + 1 : start},${count}`;
+    return [
+        `--- a/${name}`,
+        `+++ b/${name}`,
+        ...hunks.flatMap(h => [`@@ -${range(h.aStart, h.aCount)} +${range(h.bStart, h.bCount)} @@`, ...h.lines])
+    ].join('\n') + '\n';
+}
+
+module.exports = {
+    diffLines,
+    unifiedDiff
+};
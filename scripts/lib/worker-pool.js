@@ -0,0 +1,76 @@
+/**
+ * Worker Pool
+ * Runs a queue of jobs across worker threads. The worker is a script that
+ * answers each job message with exactly one result message - usually the
+ * calling script itself, branching on worker_threads' isMainThread.
+ */
+
+const os = require('os');
+const { Worker } = require('worker_threads');
+
+// One thread per core, leaving one for the main thread, at most 8
+function defaultConcurrency() {
+    return Math.max(1, Math.min(8, os.cpus().length - 1));
+}
+
+// Parse a count option such as --concurrency N. Anything but a whole
+// number of at least 1 is an error rather than a NaN that starts no workers
+function parseCount(value, flag) {
+    const count = Number(value);
+    if (!Number.isInteger(count) || count < 1) {
+        throw new Error(`${flag} expects a whole number of at least 1, got "${value}"`);
+    }
+    return count;
+}
+
+// Run the queue on `concurrency` workers; results come back in completion
+// order
+function runPool(workerFile, queue, concurrency, onResult, workerData) {
+    return new Promise((resolve, reject) => {
+        let active = 0;
+        let failed = false;
+        const workers = [];
+
+        function next(worker) {
+            const job = queue.shift();
+            if (!job) {
+                worker.terminate();
+                if (--active === 0) resolve();
+                return;
+            }
+            worker.postMessage(job);
+        }
+
+        for (let i = 0; i < Math.min(concurrency, queue.length); i++) {
+            const worker = new Worker(workerFile, { workerData });
+            workers.push(worker);
+            active++;
+            worker.on('message', (result) => {
+                if (failed) return;
+                try {
+                    onResult(result);
+                } catch (error) {
+                    failed = true;
+                    workers.forEach(w => w.terminate());
+                    reject(error);
+                    return;
+                }
+                next(worker);
+            });
+            worker.on('error', (error) => {
+                if (failed) return;
+                failed = true;
+                workers.forEach(w => w.terminate());
+                reject(error);
+            });
+            next(worker);
+        }
+        if (active === 0) resolve();
+    });
+}
+
+module.exports = {
+    defaultConcurrency,
+    parseCount,
+    runPool
+};
@@ -0,0 +1,197 @@
+#!/usr/bin/env node
+/**
+ * Patch Style Pages
+ * Runs the registered page transforms (scripts/lib/page-transforms/) over
+ * every style page in data/styles.json: skip link, gallery navigation,
+ * export panel, back link, recently viewed tracking, similar styles, mobile
+ * styles and UI polish.
+ *
+ * Each page is read once, patched by every transform in order and written
+ * back only if something changed, on worker threads. Shared chrome is
+ * written out as content-hashed bundles in assets/ (as
+ * build-chrome-assets.js does), and bundles no page uses any more are
+ * removed. Navigation counts and links come from the manifest.
+ *
+ * --dry-run prints a unified diff for every page that would change instead
+ * of writing anything; --list prints the transforms in the order they run.
+ *
+ * Run with: npm run patch-pages [-- --dry-run] [-- --only name,name] [-- --single N] [-- --concurrency N] [-- --list]
+ */
+
+const fs = require('fs');
+const path = require('path');
+const { isMainThread, parentPort, workerData } = require('worker_threads');
+const { getTransforms, buildContext, patchPage } = require('./lib/page-pipeline');
+const { loadStyles } = require('./lib/manifest');
+const { unifiedDiff } = require('./lib/text-diff');
+require('./lib/page-transforms');
+
+const ROOT_DIR = path.join(__dirname, '..');
+const ASSETS_DIR = path.join(ROOT_DIR, 'assets');
+const SIMILAR_STYLES_PATH = path.join(ROOT_DIR, 'data', 'similar-styles.json');
+
+function elapsed(startTime) {
+    return Number(process.hrtime.bigint() - startTime) / 1e6;
+}
+
+// --- Worker ------------------------------------------------------------
+
+if (!isMainThread) {
+    const transforms = getTransforms(workerData.only);
+    const similar = fs.existsSync(SIMILAR_STYLES_PATH) ? JSON.parse(fs.readFileSync(SIMILAR_STYLES_PATH, 'utf-8')) : {};
+    const ctx = buildContext(loadStyles(), similar);
+
+    // Bundles are named by content hash, so a bundle that already exists
+    // never needs writing again
+    const writeBundle = (bundle) => {
+        try {
+            fs.writeFileSync(path.join(ASSETS_DIR, bundle.file), bundle.content, { encoding: 'utf8', flag: 'wx' });
+        } catch (error) {
+            if (error.code !== 'EEXIST') throw error;
+        }
+    };
+
+    parentPort.on('message', ({ num }) => {
+        const style = ctx.byNum.get(num);
+        try {
+            const filePath = path.join(ROOT_DIR, style.file);
+            let startTime = process.hrtime.bigint();
+            const original = fs.readFileSync(filePath, 'utf-8');
+            const timings = [{ name: 'read', ms: elapsed(startTime), changed: false }];
+
+            const result = patchPage(style.file, original, style, transforms, ctx);
+            timings.push(...result.timings);
+            const changed = result.content !== original;
+
+            startTime = process.hrtime.bigint();
+            let diff = '';
+            if (changed && workerData.dryRun) {
+                diff = unifiedDiff(style.file, original, result.content);
+            } else if (changed) {
+                fs.mkdirSync(ASSETS_DIR, { recursive: true });
+                result.bundles.forEach(writeBundle);
+                fs.writeFileSync(filePath, result.content, 'utf8');
+            }
+            timings.push({ name: workerData.dryRun ? 'diff' : 'write', ms: elapsed(startTime), changed: false });
+
+            parentPort.postMessage({
+                num,
+                file: style.file,
+                changed,
+                diff,
+                bytes: Buffer.byteLength(result.content) - Buffer.byteLength(original),
+                bundles: result.bundles.map(bundle => bundle.file),
+                timings
+            });
+        } catch (error) {
+            parentPort.postMessage({ num, file: style.file, error: error.message });
+        }
+    });
+    return;
+}
+
+// --- Main --------------------------------------------------------------
+
+const { BUNDLE_PATTERN } = require('./lib/chrome-assets');
+const { defaultConcurrency, parseCount, runPool } = require('./lib/worker-pool');
+
+/**
+ * Run the pipeline from the command line. The legacy patch scripts call
+ * this with the transforms they used to apply; --only overrides them.
+ */
+async function main(defaultOnly = null) {
+    const args = process.argv.slice(2);
+    const dryRun = args.includes('--dry-run');
+    const onlyIndex = args.indexOf('--only');
+    const only = onlyIndex !== -1 ? args[onlyIndex + 1].split(',').map(name => name.trim()) : defaultOnly;
+    const singleIndex = args.indexOf('--single');
+    const single = singleIndex !== -1 ? parseInt(args[singleIndex + 1]) : null;
+    const concurrencyIndex = args.indexOf('--concurrency');
+
+    console.log('\n🎨 Lobbi Design System - Patch Style Pages\n');
+    console.log('━'.repeat(50));
+
+    try {
+        const concurrency = concurrencyIndex !== -1
+            ? parseCount(args[concurrencyIndex + 1], '--concurrency')
+            : defaultConcurrency();
+        const transforms = getTransforms(only);
+
+        if (args.includes('--list')) {
+            transforms.forEach((transform, i) => {
+                console.log(`   ${String(i + 1).padStart(2)}. ${transform.name.padEnd(16)} ${transform.description}`);
+            });
+            console.log('');
+            return;
+        }
+
+        let styles = loadStyles();
+        if (single !== null) styles = styles.filter(style => style.num === single);
+        if (styles.length === 0) throw new Error(`no style ${single} in data/styles.json`);
+
+        console.log(`📊 ${styles.length} pages, ${transforms.length} transforms: ${transforms.map(t => t.name).join(', ')}`);
+        console.log(`   Using ${Math.min(concurrency, styles.length)} worker threads${dryRun ? ' (dry run)' : ''}\n`);
+
+        const startTime = process.hrtime.bigint();
+        const results = [];
+        const errors = [];
+        await runPool(__filename, styles.map(style => ({ num: style.num })), concurrency, (result) => {
+            if (result.error) errors.push(result);
+            else results.push(result);
+        }, { only: transforms.map(t => t.name), dryRun });
+        const totalMs = Number(process.hrtime.bigint() - startTime) / 1e6;
+
+        results.sort((a, b) => a.num - b.num);
+        const changed = results.filter(result => result.changed);
+        if (dryRun) changed.forEach(result => process.stdout.write(result.diff));
+
+        // Drop bundles no page references any more
+        const removed = [];
+        if (!dryRun && single === null && errors.length === 0 && fs.existsSync(ASSETS_DIR)) {
+            const referenced = new Set(results.flatMap(result => result.bundles));
+            fs.readdirSync(ASSETS_DIR)
+                .filter(name => BUNDLE_PATTERN.test(name) && !referenced.has(name))
+                .forEach(name => {
+                    fs.unlinkSync(path.join(ASSETS_DIR, name));
+                    removed.push(name);
+                });
+        }
+
+        errors.forEach(({ file, error }) => console.log(`   ❌ ${file}: ${error}`));
+        console.log(`${dryRun ? '\n' : ''}📄 ${changed.length} of ${results.length} pages ${dryRun ? 'would change' : 'written'}, ` +
+            `${results.length - changed.length} unchanged`);
+        changed.forEach(result => {
+            const names = result.timings.filter(t => t.changed).map(t => t.name);
+            const bytes = `${result.bytes >= 0 ? '+' : ''}${(result.bytes / 1024).toFixed(1)} KB`;
+            console.log(`   ✅ ${result.file.padEnd(44)} ${bytes.padStart(9)}  ${names.join(', ')}`);
+        });
+        removed.forEach(name => console.log(`   🗑️  removed assets/${name}`));
+
+        // Per-transform timing, summed over all pages and workers
+        const totals = new Map();
+        results.forEach(result => result.timings.forEach(({ name, ms, changed: hit }) => {
+            const total = totals.get(name) || { ms: 0, pages: 0 };
+            total.ms += ms;
+            if (hit) total.pages++;
+            totals.set(name, total);
+        }));
+        console.log(`\n⏱️  ${totalMs.toFixed(0)}ms wall clock; per stage, summed across workers:`);
+        totals.forEach((total, name) => {
+            console.log(`   ${name.padEnd(16)} ${total.ms.toFixed(1).padStart(8)}ms` +
+                `  ${(total.ms / Math.max(1, results.length)).toFixed(2).padStart(6)}ms/page` +
+                (transforms.some(t => t.name === name) ? `  ${total.pages} pages changed` : ''));
+        });
+        console.log('');
+
+        if (errors.length > 0) process.exit(1);
+    } catch (error) {
+        console.error('❌ Error:', error.message);
+        process.exit(1);
+    }
+}
+
+if (require.main === module) {
+    main();
+}
+
+module.exports = { main };